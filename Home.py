@@ -2,8 +2,31 @@
 Video Tools Dashboard - Master Page
 Provides access to all video processing and evaluation tools
 """
+import os
 import streamlit as st
-from pathlib import Path
+
+
+def _count(dir_path, suffix=None):
+    """Count directory entries, optionally filtered by file suffix"""
+    try:
+        with os.scandir(dir_path) as it:
+            return sum(1 for e in it
+                       if not e.name.startswith('.')
+                       and (suffix is None or e.name.endswith(suffix)))
+    except FileNotFoundError:
+        return 0
+
+
+@st.cache_data(ttl=30)
+def get_stats():
+    """Directory counts shown in the Project Statistics section"""
+    return (
+        _count("data"),
+        _count("downloaded_videos", ".mp4"),
+        _count("subtitles", ".srt"),
+        _count("transcripts", ".txt"),
+    )
+
 
 # Page config
 st.set_page_config(
@@ -144,21 +167,7 @@ st.markdown("---")
 st.header("📊 Project Statistics")
 col1, col2, col3, col4 = st.columns(4)
 
-# Count videos in data directory
-data_dir = Path("data")
-ingested_videos = len(list(data_dir.glob("*"))) if data_dir.exists() else 0
-
-# Count subtitles
-subtitle_dir = Path("subtitles")
-subtitle_count = len(list(subtitle_dir.glob("*.srt"))) if subtitle_dir.exists() else 0
-
-# Count transcripts
-transcript_dir = Path("transcripts")
-transcript_count = len(list(transcript_dir.glob("*.txt"))) if transcript_dir.exists() else 0
-
-# Count downloaded videos
-download_dir = Path("downloaded_videos")
-downloaded_count = len(list(download_dir.glob("*.mp4"))) if download_dir.exists() else 0
+ingested_videos, downloaded_count, subtitle_count, transcript_count = get_stats()
 
 with col1:
     st.metric("Ingested Videos", ingested_videos)
@@ -172,6 +181,10 @@ with col3:
 with col4:
     st.metric("Transcripts", transcript_count)
 
+if st.button("🔄 Refresh stats"):
+    get_stats.clear()
+    st.rerun()
+
 st.markdown("---")
 
 # Getting Started
@@ -10,12 +10,12 @@ import re
 from pathlib import Path
 from datetime import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-from src.youtube_downloader import YouTubeDownloader
-from src.youtube_metadata import YouTubeMetadataFetcher
-from src.youtube_captions import YouTubeCaptionDownloader
-from src.frame_extractor import FrameExtractor
-from src.audio_transcriber import AudioTranscriber
+import orjson
+
+# Pipeline modules (Whisper/torch, OpenCV, yt-dlp) are imported lazily inside
+# the functions that need them so the page loads without pulling them in.
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -34,6 +34,55 @@ WHISPER_MODELS = ["tiny", "base", "small", "medium", "large"]
 DEFAULT_FRAME_INTERVAL = 1
 DEFAULT_WHISPER_MODEL = "medium"
 
+# Precompiled patterns for video ID handling
+_YT_PATTERNS = tuple(re.compile(p) for p in (
+    r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
+    r'(?:embed\/)([0-9A-Za-z_-]{11})',
+    r'^([0-9A-Za-z_-]{11})$'
+))
+_SANITIZE_BAD = re.compile(r'[^a-zA-Z0-9_-]')
+_SANITIZE_UNDER = re.compile(r'_+')
+
+
+def _word_count(text: str) -> int:
+    """Count whitespace-separated words"""
+    return len(text.split())
+
+
+@st.cache_resource
+def get_transcriber(model_name: str):
+    """Load (and warm up) a Whisper transcriber once per model, reused across reruns"""
+    # Same process-wide instance as the Subtitle Generator page and the CLI
+    from src.audio_transcriber import get_transcriber as load_transcriber
+    return load_transcriber(model_name, warmup=True)
+
+
+@st.cache_resource
+def get_extractor(interval: int):
+    """Shared frame extractor for the given interval"""
+    from src.frame_extractor import FrameExtractor
+    return FrameExtractor(interval_seconds=interval)
+
+
+@st.cache_resource
+def _get_youtube_downloader():
+    """Shared downloader used for URL validation"""
+    from src.youtube_downloader import YouTubeDownloader
+    return YouTubeDownloader()
+
+
+@st.cache_data
+def _is_youtube_url(url: str) -> bool:
+    """Cached YouTube URL check (pure function of the URL string)"""
+    return _get_youtube_downloader().is_youtube_url(url)
+
+
+@st.cache_data(show_spinner=False)
+def video_duration(path: str, mtime: float, size: int) -> float:
+    """Video duration, cached on (path, mtime, size) so unchanged files skip the probe"""
+    from src.frame_extractor import FrameExtractor
+    return FrameExtractor().get_video_duration(path)
+
 
 def sanitize_video_id(filename: str) -> str:
     """
@@ -49,10 +98,10 @@ def sanitize_video_id(filename: str) -> str:
     name = Path(filename).stem
 
     # Replace spaces and special chars with underscores
-    sanitized = re.sub(r'[^a-zA-Z0-9_-]', '_', name)
+    sanitized = _SANITIZE_BAD.sub('_', name)
 
     # Remove consecutive underscores
-    sanitized = re.sub(r'_+', '_', sanitized)
+    sanitized = _SANITIZE_UNDER.sub('_', sanitized)
 
     # Remove leading/trailing underscores
     sanitized = sanitized.strip('_')
@@ -70,14 +119,8 @@ def extract_youtube_video_id(url: str) -> str:
     Returns:
         Video ID (11 characters)
     """
-    patterns = [
-        r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
-        r'(?:embed\/)([0-9A-Za-z_-]{11})',
-        r'^([0-9A-Za-z_-]{11})$'
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
+    for pattern in _YT_PATTERNS:
+        match = pattern.search(url)
         if match:
             return match.group(1)
 
@@ -97,15 +140,44 @@ def check_existing_video(video_id: str) -> tuple:
     base_path = os.path.join(DATA_DIR, video_id)
     exists = os.path.exists(base_path)
 
+    # Collect existing iterations with a single directory read
+    prefix = f"{video_id}_v"
+    used = set()
+    try:
+        with os.scandir(DATA_DIR) as it:
+            for entry in it:
+                suffix = entry.name[len(prefix):]
+                if entry.name.startswith(prefix) and suffix.isascii() and suffix.isdigit():
+                    used.add(int(suffix))
+    except FileNotFoundError:
+        pass
+
     # Find next available iteration
     iteration = 2
-    next_iteration = f"{video_id}_v{iteration}"
-
-    while os.path.exists(os.path.join(DATA_DIR, next_iteration)):
+    while iteration in used:
         iteration += 1
-        next_iteration = f"{video_id}_v{iteration}"
 
-    return exists, base_path, next_iteration
+    return exists, base_path, f"{video_id}_v{iteration}"
+
+
+def write_transcript_json(path: str, transcript: dict):
+    """
+    Write the Whisper transcript to compact JSON
+
+    No indentation: the transcript is machine-consumed and can be several MB.
+
+    Args:
+        path: Output path for transcript.json
+        transcript: Whisper transcript result
+    """
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(transcript))
+
+
+def write_transcript_txt(path: str, text: str):
+    """Write the plain-text transcript"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
 
 
 def save_metadata(video_id: str, metadata: dict, video_path: str,
@@ -126,8 +198,15 @@ def save_metadata(video_id: str, metadata: dict, video_path: str,
     video_dir = os.path.join(DATA_DIR, video_id)
 
     # Get video properties
-    extractor = FrameExtractor(interval_seconds=frame_interval)
-    duration = extractor.get_video_duration(video_path)
+    video_stat = os.stat(video_path)
+    duration = video_duration(video_path, video_stat.st_mtime, video_stat.st_size)
+
+    # Frame paths live under video_dir, so strip the prefix instead of relpath
+    prefix = video_dir.rstrip(os.sep) + os.sep
+    frame_list = [
+        p[len(prefix):] if p.startswith(prefix) else os.path.relpath(p, video_dir)
+        for p in frame_paths
+    ]
 
     # Create metadata object
     metadata_obj = {
@@ -139,10 +218,10 @@ def save_metadata(video_id: str, metadata: dict, video_path: str,
         "fps": metadata.get("fps", 30),
         "frame_interval_seconds": frame_interval,
         "frame_count": len(frame_paths),
-        "frame_list": [os.path.relpath(p, video_dir) for p in frame_paths],
+        "frame_list": frame_list,
         "whisper_model": whisper_model,
         "whisper_language": transcript.get("language", "en"),
-        "transcript_word_count": len(transcript.get("text", "").split()),
+        "transcript_word_count": _word_count(transcript.get("text", "")),
         "ingestion_timestamp": datetime.now().isoformat(),
         "ingestion_complete": True
     }
@@ -155,6 +234,24 @@ def save_metadata(video_id: str, metadata: dict, video_path: str,
     logger.info(f"✓ Metadata saved to: {metadata_path}")
 
 
+def _scan_entries(directory: str) -> dict:
+    """Map entry name -> DirEntry for a directory (empty if it doesn't exist)"""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        return {}
+
+
+def _dir_has_entries(directory: str) -> bool:
+    """True if directory exists and contains at least one entry"""
+    try:
+        with os.scandir(directory) as it:
+            return next(it, None) is not None
+    except FileNotFoundError:
+        return False
+
+
 def process_video(video_source, source_type: str, video_id: str,
                   frame_interval: int, whisper_model: str, process_mode: str = "overwrite"):
     """
@@ -185,28 +282,31 @@ def process_video(video_source, source_type: str, video_id: str,
             "source_type": source_type
         }
 
-        # Check existing files for add_missing mode
+        # Check existing files for add_missing mode (single directory snapshot)
+        present = _scan_entries(video_dir)
         source_path = os.path.join(video_dir, "source.mp4")
-        video_exists = os.path.exists(source_path)
+        video_exists = "source.mp4" in present
         yt_metadata_path = os.path.join(video_dir, "youtube_metadata.json")
-        metadata_exists = os.path.exists(yt_metadata_path)
-        thumbnail_path = os.path.join(video_dir, "thumbnail.jpg")
-        thumbnail_exists = os.path.exists(thumbnail_path)
+        metadata_exists = "youtube_metadata.json" in present
         captions_dir = os.path.join(video_dir, "captions")
-        captions_exist = os.path.exists(captions_dir) and len(os.listdir(captions_dir)) > 0
-        frames_exist = os.path.exists(frames_dir) and len(os.listdir(frames_dir)) > 0
+        captions_exist = "captions" in present and _dir_has_entries(captions_dir)
+        frames_exist = "frames" in present and _dir_has_entries(frames_dir)
         transcript_json_path = os.path.join(video_dir, "transcript.json")
-        transcript_exists = os.path.exists(transcript_json_path)
+        transcript_exists = "transcript.json" in present
 
         # Step 1: Handle video source
         if source_type == "youtube":
+            from src.youtube_downloader import YouTubeDownloader
+            from src.youtube_metadata import YouTubeMetadataFetcher
+            from src.youtube_captions import YouTubeCaptionDownloader
+
             # Download video if needed
             if not video_exists or process_mode == "overwrite":
                 st.write("📥 Downloading YouTube video...")
                 downloader = YouTubeDownloader(download_dir=video_dir)
                 downloaded_path = downloader.download(video_source)
                 if downloaded_path != source_path:
-                    shutil.move(downloaded_path, source_path)
+                    os.replace(downloaded_path, source_path)
                 st.success("✓ Video downloaded")
             else:
                 st.info("✓ Video already exists, skipping download")
@@ -257,7 +357,7 @@ def process_video(video_source, source_type: str, video_id: str,
             if not video_exists or process_mode == "overwrite":
                 st.write("📁 Processing local video...")
                 with open(source_path, "wb") as f:
-                    f.write(video_source.read())
+                    shutil.copyfileobj(video_source, f, 1024 * 1024)
                 st.success("✓ Video saved")
             else:
                 st.info("✓ Video already exists, skipping upload")
@@ -268,12 +368,13 @@ def process_video(video_source, source_type: str, video_id: str,
         # Step 2: Extract frames
         if not frames_exist or process_mode == "overwrite":
             st.write(f"🎞️ Extracting frames (1 frame every {frame_interval}s)...")
-            extractor = FrameExtractor(interval_seconds=frame_interval)
+            extractor = get_extractor(frame_interval)
             frame_paths = extractor.extract_frames(source_path, frames_dir)
             st.success(f"✓ Extracted {len(frame_paths)} frames")
         else:
             st.info("✓ Frames already exist, skipping extraction")
-            frame_paths = [os.path.join(frames_dir, f) for f in sorted(os.listdir(frames_dir)) if f.endswith('.jpg')]
+            with os.scandir(frames_dir) as it:
+                frame_paths = sorted(e.path for e in it if e.name.endswith('.jpg'))
 
         results["frame_paths"] = frame_paths
         results["frame_count"] = len(frame_paths)
@@ -281,24 +382,26 @@ def process_video(video_source, source_type: str, video_id: str,
         # Step 3: Transcribe audio
         if not transcript_exists or process_mode == "overwrite":
             st.write(f"🎤 Transcribing audio (Whisper {whisper_model} model)...")
-            transcriber = AudioTranscriber(model_name=whisper_model)
+            transcriber = get_transcriber(whisper_model)
             transcript = transcriber.transcribe_video(source_path)
 
-            # Save transcript files
-            with open(transcript_json_path, 'w', encoding='utf-8') as f:
-                json.dump(transcript, f, indent=2, ensure_ascii=False)
-
+            # Save transcript files (JSON and plain text written in parallel)
             transcript_txt_path = os.path.join(video_dir, "transcript.txt")
-            with open(transcript_txt_path, 'w', encoding='utf-8') as f:
-                f.write(transcript['text'])
-
-            word_count = len(transcript['text'].split())
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(write_transcript_json, transcript_json_path, transcript),
+                    executor.submit(write_transcript_txt, transcript_txt_path, transcript['text']),
+                ]
+            for future in futures:
+                future.result()
+
+            word_count = _word_count(transcript['text'])
             st.success(f"✓ Transcription complete ({word_count} words)")
         else:
             st.info("✓ Transcript already exists, loading from file")
             with open(transcript_json_path, 'r', encoding='utf-8') as f:
                 transcript = json.load(f)
-            word_count = len(transcript['text'].split())
+            word_count = _word_count(transcript['text'])
 
         results["transcript"] = transcript
         results["word_count"] = word_count
@@ -436,9 +539,7 @@ def main():
 
         if youtube_url:
             # Validate URL
-            downloader = YouTubeDownloader()
-
-            if not downloader.is_youtube_url(youtube_url):
+            if not _is_youtube_url(youtube_url):
                 st.error("⚠️ Invalid YouTube URL")
             else:
                 # Extract video ID from URL
@@ -3,11 +3,36 @@
 Subtitle Generation Tool
 Creates transcript and SRT subtitle files from video using Whisper
 """
+import contextlib
+import io
 import os
+import secrets
+import shutil
 import sys
+import tempfile
 import argparse
+from multiprocessing.connection import Listener, Client, AuthenticationError
 from pathlib import Path
-from src.audio_transcriber import AudioTranscriber
+
+import numpy as np
+from src.audio_transcriber import get_transcriber
+
+# Persistent subtitle server (see --server): keeps Whisper models loaded
+# between CLI invocations. Bound to localhost only.
+SERVER_HOST = 'localhost'
+DEFAULT_SERVER_PORT = 6010
+
+# The connection pickles requests, so the authkey must stay secret: taken
+# from SUBTITLE_SERVER_AUTHKEY, or generated by the server and shared with
+# clients through a file only the current user can read
+SERVER_AUTHKEY_ENV = 'SUBTITLE_SERVER_AUTHKEY'
+SERVER_AUTHKEY_FILE = Path.home() / '.cache' / 'kids-video-evaluator' / 'subtitle_server.key'
+
+# Output file buffer size (64 KiB)
+WRITE_BUFFER_SIZE = 1 << 16
+
+# Segments formatted and written per chunk when streaming SRT output
+SRT_CHUNK_SEGMENTS = 256
 
 
 def format_srt_timestamp(seconds: float) -> str:
@@ -20,14 +45,42 @@ def format_srt_timestamp(seconds: float) -> str:
     Returns:
         Formatted timestamp string
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    milliseconds = int((seconds - int(seconds)) * 1000)
+    # Integer-only arithmetic from a single float -> ms conversion
+    total_ms = int(seconds * 1000)
+    total_seconds, milliseconds = divmod(total_ms, 1000)
+
+    # Most kids' videos are under an hour: skip the hours divmod
+    if 0 <= total_ms < 3_600_000:
+        minutes, secs = divmod(total_seconds, 60)
+        return f"00:{minutes:02d}:{secs:02d},{milliseconds:03d}"
+
+    total_minutes, secs = divmod(total_seconds, 60)
+    hours, minutes = divmod(total_minutes, 60)
 
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
 
 
+def format_srt_timestamps(times) -> list:
+    """
+    Format many times to SRT timestamps at once (vectorized format_srt_timestamp)
+
+    Args:
+        times: Sequence of times in seconds
+
+    Returns:
+        List of formatted timestamp strings, in input order
+    """
+    total_ms = (np.asarray(times, dtype=np.float64) * 1000).astype(np.int64)
+    hours, rem = np.divmod(total_ms, 3_600_000)
+    minutes, rem = np.divmod(rem, 60_000)
+    secs, milliseconds = np.divmod(rem, 1000)
+
+    return [
+        f"{h:02d}:{m:02d}:{sec:02d},{ms:03d}"
+        for h, m, sec, ms in zip(hours.tolist(), minutes.tolist(), secs.tolist(), milliseconds.tolist())
+    ]
+
+
 def create_srt_file(transcript_result: dict, output_path: str) -> None:
     """
     Create an SRT subtitle file from Whisper transcript
@@ -36,22 +89,81 @@ def create_srt_file(transcript_result: dict, output_path: str) -> None:
         transcript_result: Whisper transcription result with segments
         output_path: Path where to save the SRT file
     """
-    with open(output_path, 'w', encoding='utf-8') as f:
-        for idx, segment in enumerate(transcript_result.get('segments', []), start=1):
-            # SRT index
-            f.write(f"{idx}\n")
+    stream_srt_file(transcript_result.get('segments', []), output_path)
+
+
+def stream_srt_file(segments, output_path: str, transcript_path: str = None) -> dict:
+    """
+    Write SRT subtitles from a (possibly lazy) iterable of segments
+
+    Segments are written in chunks as they arrive and then dropped; only
+    running counts are kept, so memory stays flat however long the video.
+    If transcript_path is given, the plain text transcript (same layout as
+    create_transcript_file) is written in the same pass.
 
-            # Timestamps
-            start_time = format_srt_timestamp(segment['start'])
-            end_time = format_srt_timestamp(segment['end'])
-            f.write(f"{start_time} --> {end_time}\n")
+    Args:
+        segments: Iterable of Whisper segment dicts
+        output_path: Path where to save the SRT file
+        transcript_path: Optional path where to save the transcript
 
-            # Text content
+    Returns:
+        Dict with 'num_segments', 'total_words' and 'duration_seconds'
+    """
+    stats = {'num_segments': 0, 'total_words': 0, 'duration_seconds': 0}
+    chunk = []
+    # Spaces owed before the next transcript text (" ".join, then strip())
+    pending_spaces = None
+
+    with contextlib.ExitStack() as stack:
+        f = stack.enter_context(open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE))
+        if transcript_path:
+            # The full text comes first in the transcript, so the timestamped
+            # lines are spooled to a temp file and appended at the end
+            transcript = stack.enter_context(
+                open(transcript_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+            )
+            timestamped = stack.enter_context(tempfile.TemporaryFile('w+', encoding='utf-8'))
+            transcript.write("=== VIDEO TRANSCRIPT ===\n\nFULL TEXT:\n")
+
+        def flush():
+            nonlocal pending_spaces
+            start_times = format_srt_timestamps([seg['start'] for seg in chunk])
+            end_times = format_srt_timestamps([seg['end'] for seg in chunk])
+            parts = []
+            for seg, start_time, end_time in zip(chunk, start_times, end_times):
+                stats['num_segments'] += 1
+                parts.append(f"{stats['num_segments']}\n{start_time} --> {end_time}\n{seg['text']}\n\n")
+            f.write("".join(parts))
+
+            if transcript_path:
+                for seg in chunk:
+                    if pending_spaces is not None:
+                        pending_spaces += 1
+                    if seg['text']:
+                        transcript.write(" " * (pending_spaces or 0) + seg['text'])
+                        pending_spaces = 0
+                    timestamped.write(
+                        f"[{format_timestamp_readable(seg['start'])} - "
+                        f"{format_timestamp_readable(seg['end'])}] {seg['text']}\n"
+                    )
+            chunk.clear()
+
+        for segment in segments:
             text = segment['text'].strip()
-            f.write(f"{text}\n")
+            chunk.append({'start': segment['start'], 'end': segment['end'], 'text': text})
+            stats['total_words'] += len(text.split())
+            stats['duration_seconds'] = segment['end']
+            if len(chunk) >= SRT_CHUNK_SEGMENTS:
+                flush()
+        if chunk:
+            flush()
 
-            # Blank line between subtitles
-            f.write("\n")
+        if transcript_path:
+            transcript.write("\n\nTIMESTAMPED SEGMENTS:\n")
+            timestamped.seek(0)
+            shutil.copyfileobj(timestamped, transcript)
+
+    return stats
 
 
 def create_transcript_file(transcript_result: dict, output_path: str) -> None:
@@ -62,21 +174,18 @@ def create_transcript_file(transcript_result: dict, output_path: str) -> None:
         transcript_result: Whisper transcription result
         output_path: Path where to save the transcript
     """
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write("=== VIDEO TRANSCRIPT ===\n\n")
-
-        # Full text
-        f.write("FULL TEXT:\n")
-        f.write(transcript_result['text'].strip())
-        f.write("\n\n")
+    # Accumulate in memory so the file is encoded and written in one go
+    buf = io.StringIO()
+    buf.write("=== VIDEO TRANSCRIPT ===\n\nFULL TEXT:\n")
+    buf.write(transcript_result['text'].strip())
+    buf.write("\n\nTIMESTAMPED SEGMENTS:\n")
+    for segment in transcript_result.get('segments', []):
+        start_time = format_timestamp_readable(segment['start'])
+        end_time = format_timestamp_readable(segment['end'])
+        buf.write(f"[{start_time} - {end_time}] {segment['text'].strip()}\n")
 
-        # Timestamped segments
-        f.write("TIMESTAMPED SEGMENTS:\n")
-        for segment in transcript_result.get('segments', []):
-            start_time = format_timestamp_readable(segment['start'])
-            end_time = format_timestamp_readable(segment['end'])
-            text = segment['text'].strip()
-            f.write(f"[{start_time} - {end_time}] {text}\n")
+    with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(buf.getvalue())
 
 
 def format_timestamp_readable(seconds: float) -> str:
@@ -110,43 +219,153 @@ def process_video(video_path: str, model_name: str = "base",
     os.makedirs(subtitle_dir, exist_ok=True)
     os.makedirs(transcript_dir, exist_ok=True)
 
-    print(f"\n{'='*60}")
-    print(f"Processing: {video_path_obj.name}")
-    print(f"{'='*60}\n")
+    # Each status block goes out as a single write
+    rule = '=' * 60
+    print(f"\n{rule}\nProcessing: {video_path_obj.name}\n{rule}\n\nLoading Whisper model: {model_name}")
 
     # Initialize transcriber
-    print(f"Loading Whisper model: {model_name}")
-    transcriber = AudioTranscriber(model_name=model_name)
-
-    # Transcribe video
-    print(f"\nTranscribing audio...")
-    transcript_result = transcriber.transcribe_video(video_path)
+    transcriber = get_transcriber(model_name)
 
     # Create output file paths
     srt_path = os.path.join(subtitle_dir, f"{video_name}.srt")
     transcript_path = os.path.join(transcript_dir, f"{video_name}_transcript.txt")
 
-    # Generate SRT file
-    print(f"\nCreating subtitle file...")
-    create_srt_file(transcript_result, srt_path)
-    print(f"✓ Subtitles saved: {srt_path}")
-
-    # Generate transcript file
-    print(f"\nCreating transcript file...")
-    create_transcript_file(transcript_result, transcript_path)
-    print(f"✓ Transcript saved: {transcript_path}")
-
-    # Print summary
-    summary = transcriber.get_transcript_summary(transcript_result)
-    print(f"\n{'='*60}")
-    print(f"SUMMARY")
-    print(f"{'='*60}")
-    print(f"Language: {summary['language']}")
-    print(f"Duration: {summary['duration_seconds']:.1f} seconds")
-    print(f"Total words: {summary['total_words']}")
-    print(f"Segments: {summary['num_segments']}")
-    print(f"Words per minute: {summary['words_per_minute']:.1f}")
-    print(f"{'='*60}\n")
+    # Transcribe video, writing subtitles and transcript as segments are decoded
+    print("\nTranscribing audio and creating subtitle and transcript files...")
+    segments, info = transcriber.transcribe_video_stream(video_path)
+    summary = stream_srt_file(segments, srt_path, transcript_path)
+
+    # Results and summary, reported after the files are written
+    duration = summary['duration_seconds']
+    summary['language'] = info['language']
+    summary['words_per_minute'] = (summary['total_words'] / duration * 60) if duration > 0 else 0
+    lines = [
+        f"✓ Subtitles saved: {srt_path}",
+        f"✓ Transcript saved: {transcript_path}",
+        f"\n{rule}",
+        "SUMMARY",
+        rule,
+        f"Language: {summary['language']}",
+        f"Duration: {summary['duration_seconds']:.1f} seconds",
+        f"Total words: {summary['total_words']}",
+        f"Segments: {summary['num_segments']}",
+        f"Words per minute: {summary['words_per_minute']:.1f}",
+        f"{rule}\n",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def create_server_authkey() -> bytes:
+    """
+    Authkey for a starting server: SUBTITLE_SERVER_AUTHKEY if set, otherwise
+    a fresh random key written to SERVER_AUTHKEY_FILE (mode 0600)
+    """
+    env_key = os.environ.get(SERVER_AUTHKEY_ENV)
+    if env_key:
+        return env_key.encode()
+
+    authkey = secrets.token_hex(32).encode()
+    SERVER_AUTHKEY_FILE.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # Replace rather than rewrite, so the new file is created 0600
+    tmp_path = SERVER_AUTHKEY_FILE.with_suffix('.tmp')
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(authkey)
+    os.replace(tmp_path, SERVER_AUTHKEY_FILE)
+    return authkey
+
+
+def read_server_authkey():
+    """Authkey a client should use, or None if no server has published one"""
+    env_key = os.environ.get(SERVER_AUTHKEY_ENV)
+    if env_key:
+        return env_key.encode()
+    try:
+        return SERVER_AUTHKEY_FILE.read_bytes()
+    except OSError:
+        return None
+
+
+def serve(port: int = DEFAULT_SERVER_PORT, model_name: str = None) -> None:
+    """
+    Run a persistent subtitle worker that keeps Whisper models in memory
+
+    Each connection sends a dict of process_video keyword arguments and
+    receives {'ok': bool, 'error': str} once processing finishes.
+
+    Args:
+        port: Local TCP port to listen on
+        model_name: Whisper model to load and warm up before accepting jobs
+    """
+    if model_name:
+        get_transcriber(model_name, warmup=True)
+
+    authkey = create_server_authkey()
+    with Listener((SERVER_HOST, port), authkey=authkey) as listener:
+        print(f"Subtitle server listening on {SERVER_HOST}:{port} (Ctrl+C to stop)")
+        while True:
+            # A client that fails authentication, disconnects or sends
+            # garbage only loses its own connection
+            try:
+                conn = listener.accept()
+            except (AuthenticationError, EOFError, OSError):
+                continue
+
+            with conn:
+                try:
+                    request = conn.recv()
+                except Exception:
+                    continue
+
+                try:
+                    if not isinstance(request, dict):
+                        raise TypeError("request must be a dict of process_video arguments")
+                    process_video(**request)
+                    reply = {'ok': True}
+                except (Exception, SystemExit) as e:
+                    reply = {'ok': False, 'error': str(e)}
+
+                try:
+                    conn.send(reply)
+                except OSError:
+                    pass
+
+
+def submit_to_server(request: dict, port: int = DEFAULT_SERVER_PORT) -> bool:
+    """
+    Send a job to a running subtitle server
+
+    Args:
+        request: process_video keyword arguments (absolute paths)
+        port: Server port
+
+    Returns:
+        True if a server handled the request, False if none is running or
+        the connection dropped before a reply
+    """
+    authkey = read_server_authkey()
+    if authkey is None:
+        return False
+
+    try:
+        conn = Client((SERVER_HOST, port), authkey=authkey)
+    except (ConnectionRefusedError, AuthenticationError, OSError):
+        return False
+
+    # A server that dies mid-job (killed, crashed) means local fallback
+    try:
+        with conn:
+            conn.send(request)
+            reply = conn.recv()
+    except (EOFError, OSError):
+        print("Subtitle server connection lost; processing locally")
+        return False
+
+    if not reply['ok']:
+        print(f"Error: {reply['error']}")
+        sys.exit(1)
+    return True
 
 
 def main():
@@ -164,6 +383,9 @@ Examples:
   # Custom output directories
   python create_subtitles.py video.mp4 --subtitle-dir subs --transcript-dir transcripts
 
+  # Keep models loaded between runs (later invocations are sent to the server)
+  python create_subtitles.py --server
+
 Whisper Models (accuracy vs speed):
   - tiny:   Fastest, least accurate (~1GB RAM)
   - base:   Good balance (~1GB RAM)
@@ -175,6 +397,7 @@ Whisper Models (accuracy vs speed):
 
     parser.add_argument(
         'video',
+        nargs='?',
         help='Path to the video file'
     )
 
@@ -197,16 +420,43 @@ Whisper Models (accuracy vs speed):
         help='Directory to save transcript files (default: transcripts)'
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        '--server',
+        action='store_true',
+        help='Run a persistent server that keeps Whisper models loaded between runs '
+             '(--model is loaded and warmed up at startup)'
+    )
 
-    # Process the video
-    process_video(
-        video_path=args.video,
-        model_name=args.model,
-        subtitle_dir=args.subtitle_dir,
-        transcript_dir=args.transcript_dir
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=DEFAULT_SERVER_PORT,
+        help=f'Local subtitle server port (default: {DEFAULT_SERVER_PORT})'
     )
 
+    args = parser.parse_args()
+
+    if args.server:
+        serve(args.port, args.model)
+        return
+
+    if not args.video:
+        parser.error("the following arguments are required: video")
+
+    request = {
+        'video_path': os.path.abspath(args.video),
+        'model_name': args.model,
+        'subtitle_dir': os.path.abspath(args.subtitle_dir),
+        'transcript_dir': os.path.abspath(args.transcript_dir)
+    }
+
+    # Hand off to a running server if there is one, otherwise process locally
+    if os.path.exists(request['video_path']) and submit_to_server(request, args.port):
+        print(f"✓ Processed by subtitle server on port {args.port}")
+        return
+
+    process_video(**request)
+
 
 if __name__ == "__main__":
     main()
@@ -6,6 +6,7 @@ A Streamlit dashboard for viewing and managing video evaluations.
 
 import streamlit as st
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add current directory to path
@@ -59,6 +60,23 @@ def check_database_connection():
         return False, str(e)
 
 
+@st.cache_data(ttl=30)
+def load_overview():
+    """Load dashboard data, cached for 30 seconds across reruns."""
+    db = VideoEvaluatorDB()
+
+    # Each query is an independent network round-trip, so run them concurrently
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [
+            executor.submit(db.get_all_videos),
+            executor.submit(db.get_video_status),
+            executor.submit(db.get_rubric_completion_stats),
+            executor.submit(db.get_total_cost),
+            executor.submit(db.get_recent_evaluations, limit=10),
+        ]
+        return tuple(future.result() for future in futures)
+
+
 def main():
     """Main dashboard home page."""
     st.markdown('<h1 class="main-header">🎬 Video Evaluator Dashboard</h1>', unsafe_allow_html=True)
@@ -86,11 +104,7 @@ def main():
 
     # Get overview statistics
     try:
-        videos = db.get_all_videos()
-        video_status = db.get_video_status()
-        rubric_stats = db.get_rubric_completion_stats()
-        total_cost = db.get_total_cost()
-        recent_evals = db.get_recent_evaluations(limit=10)
+        videos, video_status, rubric_stats, total_cost, recent_evals = load_overview()
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return
@@ -141,6 +155,7 @@ def main():
     st.info("👈 Use the sidebar to navigate to different pages")
 
     if st.button("🔄 Refresh Data", use_container_width=True):
+        load_overview.clear()
         st.rerun()
 
     st.markdown("---")
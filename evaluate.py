@@ -24,18 +24,20 @@ import sys
 import time
 import os
 from pathlib import Path
-from typing import List
+from typing import List, TYPE_CHECKING
 import logging
 import shutil
+import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from src import (
-    FrameExtractor,
-    AudioTranscriber,
-    ReportGenerator,
-    YouTubeDownloader
-)
 from src.evaluator_claude_code import VideoEvaluatorClaudeCode
 
+# OpenCV, Whisper and yt-dlp are slow to import, so main() imports them only
+# once it knows they are needed (not for --help, a bad path or an empty folder)
+if TYPE_CHECKING:
+    from src import FrameExtractor, AudioTranscriber, ReportGenerator
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -45,33 +47,74 @@ logger = logging.getLogger(__name__)
 # Supported video formats
 VIDEO_EXTENSIONS = {'.mp4', '.mov', '.avi', '.mkv', '.webm', '.m4v'}
 
+# tmpfs for short-lived frames/transcripts (Linux); output/temp otherwise
+SHM_DIR = '/dev/shm'
+DISK_TEMP_DIR = 'output/temp'
+TEMP_DIR_PREFIX = 'kids-video-evaluator-'
+
+
+def choose_temp_dir(keep_temp: bool) -> str:
+    """
+    Create the directory for this run's per-video temp files
+
+    Frames are written, read once by Claude and deleted within seconds, so
+    they go to RAM-backed /dev/shm when it's writable. Files the user asked
+    to keep (--keep-temp) stay on disk under output/temp. Unless kept, the
+    directory is a fresh mkdtemp(), so removing it at the end never touches
+    a concurrent run's files.
+    """
+    if keep_temp:
+        os.makedirs(DISK_TEMP_DIR, exist_ok=True)
+        return DISK_TEMP_DIR
+
+    if os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK):
+        try:
+            return tempfile.mkdtemp(prefix=TEMP_DIR_PREFIX, dir=SHM_DIR)
+        except OSError:
+            pass
+    os.makedirs(DISK_TEMP_DIR, exist_ok=True)
+    return tempfile.mkdtemp(prefix=TEMP_DIR_PREFIX, dir=DISK_TEMP_DIR)
+
 
 def find_videos(directory: str) -> List[str]:
     """Find all video files in directory"""
     video_files = []
-    for ext in VIDEO_EXTENSIONS:
-        video_files.extend(Path(directory).glob(f'*{ext}'))
-        video_files.extend(Path(directory).glob(f'*{ext.upper()}'))
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS:
+                video_files.append(entry.path)
 
-    return sorted([str(f) for f in video_files])
+    return sorted(video_files)
 
 
 def process_video(
     video_path: str,
-    frame_extractor: FrameExtractor,
-    audio_transcriber: AudioTranscriber,
+    frame_extractor: 'FrameExtractor',
+    audio_transcriber: 'AudioTranscriber',
     evaluator: VideoEvaluatorClaudeCode,
-    report_generator: ReportGenerator,
+    report_generator: 'ReportGenerator',
     frames_per_batch: int,
-    temp_dir: str
+    video_temp_dir: str,
+    transcript_result: dict = None,
+    all_frames: List[str] = None,
+    video_name: str = None
 ) -> tuple:
     """
     Process a single video: extract frames, transcribe, evaluate
 
+    If transcript_result is given (e.g. from AudioTranscriber.transcribe_batch),
+    the Whisper step reuses it instead of transcribing again. Likewise,
+    all_frames skips frame extraction when frames were already decoded.
+
+    Args:
+        video_temp_dir: Temp directory owned by this video alone (its
+            'frames' subdirectory is deleted when processing ends)
+        video_name: Name for logs and the report (defaults to the file stem)
+
     Returns:
         Tuple of (video_name, report_path, processing_time)
     """
-    video_name = Path(video_path).stem
+    video_name = video_name or Path(video_path).stem
     start_time = time.time()
 
     logger.info(f"\n{'='*80}")
@@ -79,14 +122,27 @@ def process_video(
     logger.info(f"{'='*80}\n")
 
     # Create temp directory for this video
-    video_temp_dir = os.path.join(temp_dir, video_name)
-    frames_dir = os.path.join(video_temp_dir, 'frames')
-    os.makedirs(frames_dir, exist_ok=True)
+    video_temp_dir = Path(video_temp_dir)
+    frames_dir = video_temp_dir / 'frames'
+    frames_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        # Step 1: Extract frames
+        # Steps 1 and 2 are independent: extract frames while Whisper transcribes
         logger.info("Step 1/4: Extracting video frames...")
-        all_frames = frame_extractor.extract_frames(video_path, frames_dir)
+        logger.info("Step 2/4: Transcribing audio with Whisper...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            frames_future = None
+            if all_frames is None:
+                frames_future = executor.submit(frame_extractor.extract_frames, video_path, frames_dir)
+            transcript_future = None
+            if transcript_result is None:
+                transcript_future = executor.submit(
+                    audio_transcriber.transcribe_video, video_path, video_temp_dir
+                )
+            if frames_future is not None:
+                all_frames = frames_future.result()
+            if transcript_future is not None:
+                transcript_result = transcript_future.result()
 
         # Sample frames if we have too many
         if len(all_frames) > frames_per_batch:
@@ -97,9 +153,6 @@ def process_video(
 
         logger.info(f"Using {len(selected_frames)} frames for analysis\n")
 
-        # Step 2: Transcribe audio
-        logger.info("Step 2/4: Transcribing audio with Whisper...")
-        transcript_result = audio_transcriber.transcribe_video(video_path, video_temp_dir)
         transcript_formatted = audio_transcriber.format_transcript_for_claude(transcript_result)
         transcript_summary = audio_transcriber.get_transcript_summary(transcript_result)
         logger.info("")
@@ -135,10 +188,8 @@ def process_video(
 
     finally:
         # Keep transcripts, but clean up frames
-        frames_dir = os.path.join(video_temp_dir, 'frames')
-        if os.path.exists(frames_dir):
-            shutil.rmtree(frames_dir)
-            logger.info(f"Cleaned up frame files (transcript saved)")
+        shutil.rmtree(frames_dir, ignore_errors=True)
+        logger.info("Cleaned up frame files (transcript saved)")
 
 
 def main():
@@ -203,6 +254,20 @@ Whisper models (speed vs accuracy):
         help='Whisper model size (default: base)'
     )
 
+    parser.add_argument(
+        '--transcribe-batch-size',
+        type=int,
+        default=4,
+        help='Number of videos to transcribe back to back before evaluation (default: 4)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Videos to extract frames for and evaluate concurrently (default: 4)'
+    )
+
     parser.add_argument(
         '--keep-temp',
         action='store_true',
@@ -215,6 +280,7 @@ Whisper models (speed vs accuracy):
     if args.youtube:
         logger.info("YouTube URL provided - downloading video first...")
         try:
+            from src import YouTubeDownloader
             downloader = YouTubeDownloader(download_dir='downloaded_videos')
             if not downloader.is_youtube_url(args.youtube):
                 logger.error(f"Invalid YouTube URL: {args.youtube}")
@@ -252,8 +318,10 @@ Whisper models (speed vs accuracy):
     # Initialize components
     try:
         logger.info("Initializing components...")
+        from src import FrameExtractor, ReportGenerator
+        from src.audio_transcriber import get_transcriber
         frame_extractor = FrameExtractor(interval_seconds=args.frame_interval)
-        audio_transcriber = AudioTranscriber(model_name=args.whisper_model)
+        audio_transcriber = get_transcriber(args.whisper_model)
         evaluator = VideoEvaluatorClaudeCode()
         report_generator = ReportGenerator(output_dir='output/reports')
         logger.info("✓ All components initialized\n")
@@ -263,37 +331,108 @@ Whisper models (speed vs accuracy):
         return 1
 
     # Process videos
-    temp_dir = 'output/temp'
-    os.makedirs(temp_dir, exist_ok=True)
+    temp_dir = choose_temp_dir(args.keep_temp)
+    logger.info(f"Temporary files: {temp_dir}")
 
-    video_reports = []
     total_start_time = time.time()
     successful = 0
     failed = 0
 
-    for i, video_path in enumerate(video_files, 1):
-        logger.info(f"\n[Video {i}/{len(video_files)}]")
+    batch_size = max(1, args.transcribe_batch_size)
+    workers = max(1, min(args.workers, len(video_files)))
+    results = {}
+    decoded_frames = {}
+
+    # Concurrent workers must never share a temp dir (clip.mp4 and clip.mov
+    # have the same stem), so each video's is keyed by its position
+    video_temp_dirs = {
+        vp: os.path.join(temp_dir, f"{i:04d}_{Path(vp).stem}")
+        for i, vp in enumerate(video_files)
+    }
+    # Same for report names: repeated stems get their extension appended
+    stem_counts = Counter(Path(vp).stem for vp in video_files)
+    video_names = {
+        vp: Path(vp).stem if stem_counts[Path(vp).stem] == 1
+        else f"{Path(vp).stem}_{Path(vp).suffix.lstrip('.')}"
+        for vp in video_files
+    }
+
+    def decode_video(video_path):
+        """Demux once: write frames for process_video, return audio for Whisper"""
+        frames_dir = os.path.join(video_temp_dirs[video_path], 'frames')
         try:
-            result = process_video(
-                video_path,
-                frame_extractor,
-                audio_transcriber,
-                evaluator,
-                report_generator,
-                args.frames_per_batch,
-                temp_dir
-            )
-            video_reports.append(result[:2])  # (name, report_path)
-            successful += 1
-
-        except KeyboardInterrupt:
-            logger.warning("\n\nProcess interrupted by user")
-            break
-
+            frames, audio = frame_extractor.extract_frames_and_audio(video_path, frames_dir)
         except Exception as e:
-            logger.error(f"Failed to process {Path(video_path).name}: {e}")
-            failed += 1
-            continue
+            logger.warning(f"Single-pass decode failed ({e}), decoding audio separately")
+            return audio_transcriber.load_audio(video_path)
+        decoded_frames[video_path] = frames
+        return audio
+
+    # Whisper runs here in the main thread, one batch at a time (so at most
+    # one model forward pass uses the GPU); frame extraction and Claude
+    # evaluation for already-transcribed videos run on the worker threads.
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures = {}
+    try:
+        for batch_start in range(0, len(video_files), batch_size):
+            batch = video_files[batch_start:batch_start + batch_size]
+
+            # Transcribe the whole batch up front so Whisper runs back to back
+            try:
+                logger.info(f"Transcribing batch of {len(batch)} video(s)...")
+                transcripts = audio_transcriber.transcribe_batch(
+                    batch,
+                    [video_temp_dirs[vp] for vp in batch],
+                    load_audio=decode_video
+                )
+            except Exception as e:
+                logger.warning(f"Batch transcription failed ({e}), transcribing per video")
+                transcripts = [None] * len(batch)
+
+            for i, (video_path, transcript_result) in enumerate(zip(batch, transcripts), batch_start + 1):
+                logger.info(f"\n[Video {i}/{len(video_files)}] Queued {Path(video_path).name}")
+                future = executor.submit(
+                    process_video,
+                    video_path,
+                    frame_extractor,
+                    audio_transcriber,
+                    evaluator,
+                    report_generator,
+                    args.frames_per_batch,
+                    video_temp_dirs[video_path],
+                    transcript_result=transcript_result,
+                    all_frames=decoded_frames.pop(video_path, None),
+                    video_name=video_names[video_path]
+                )
+                futures[future] = video_path
+
+        for future in as_completed(futures):
+            video_path = futures[future]
+            try:
+                results[video_path] = future.result()
+                successful += 1
+            except Exception as e:
+                logger.error(f"Failed to process {Path(video_path).name}: {e}")
+                failed += 1
+
+    except KeyboardInterrupt:
+        logger.warning("\n\nProcess interrupted by user")
+        executor.shutdown(wait=False, cancel_futures=True)
+        running = sum(1 for future in futures if future.running())
+        if running:
+            # The claude subprocesses got the same SIGINT, so this is short
+            logger.warning(f"Waiting for {running} running video(s) to stop (Ctrl+C again to quit now)")
+            try:
+                executor.shutdown(wait=True)
+            except KeyboardInterrupt:
+                logger.warning("Quitting without cleanup; temporary files left in place")
+                os._exit(130)
+
+    finally:
+        executor.shutdown(wait=True)
+
+    # Keep reports in input order regardless of completion order
+    video_reports = [results[vp] for vp in video_files if vp in results]  # (name, report_path, time)
 
     # Generate summary report
     total_time = time.time() - total_start_time
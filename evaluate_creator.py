@@ -23,10 +23,15 @@ import argparse
 import sys
 import time
 import os
+import shutil
+import tempfile
 from pathlib import Path
 from typing import List
 import logging
-import shutil
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from src import (
     FrameExtractor,
@@ -34,6 +39,8 @@ from src import (
     ReportGenerator,
     YouTubeDownloader
 )
+from src.archive.rubric_creator import get_creator_evaluation_prompt
+from src.audio_transcriber import get_transcriber
 from src.evaluator_claude_code import VideoEvaluatorClaudeCode
 
 logging.basicConfig(
@@ -45,15 +52,52 @@ logger = logging.getLogger(__name__)
 # Supported video formats
 VIDEO_EXTENSIONS = {'.mp4', '.mov', '.avi', '.mkv', '.webm', '.m4v'}
 
+# Videos buffered between pipeline stages (see run_pipeline)
+PIPELINE_QUEUE_SIZE = 2
+
+# Claude requests in flight at once (keep under the API rate limit)
+MAX_CONCURRENT_EVALUATIONS = 4
+
+# Creator rubric text, built once (identical for every video)
+_RUBRIC_PROMPT = get_creator_evaluation_prompt()
+
+# Prompt text is composed once at import; only the video name, frame count and
+# transcript are spliced in per call, so the cached system prompt stays
+# byte-identical across videos
+_CREATOR_SYSTEM_PROMPT = f"""# Creator Feedback Analysis
+
+{_RUBRIC_PROMPT}
+"""
+_PROMPT_VIDEO = "VIDEO: "
+_PROMPT_FRAMES = "\nFRAMES ANALYZED: "
+_PROMPT_TRANSCRIPT = """ frames (sampled at regular intervals)
+
+---
+
+## VIDEO TRANSCRIPT
+
+"""
+_PROMPT_TASK = """
+
+---
+
+## YOUR TASK
+
+Provide comprehensive CREATOR FEEDBACK following the framework in the system prompt. Be specific with timestamps, actionable with recommendations, and constructive in tone.
+
+Focus on helping the creator improve both THIS video and FUTURE videos.
+"""
+
 
 def find_videos(directory: str) -> List[str]:
     """Find all video files in directory"""
     video_files = []
-    for ext in VIDEO_EXTENSIONS:
-        video_files.extend(Path(directory).glob(f'*{ext}'))
-        video_files.extend(Path(directory).glob(f'*{ext.upper()}'))
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS:
+                video_files.append(entry.path)
 
-    return sorted([str(f) for f in video_files])
+    return sorted(video_files)
 
 
 class CreatorReportGenerator(ReportGenerator):
@@ -72,52 +116,186 @@ class CreatorReportGenerator(ReportGenerator):
         from datetime import datetime
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        # Create report content
-        report_lines = []
-        report_lines.append(f"# Creator Feedback Report: {video_name}")
-        report_lines.append(f"\n**Generated:** {timestamp}")
-        report_lines.append(f"**Report Type:** Production & Pedagogical Feedback\n")
-
-        # Video metadata section
-        report_lines.append("## Video Information\n")
-        report_lines.append(f"- **File:** `{Path(video_path).name}`")
-        report_lines.append(f"- **Duration:** {transcript_summary.get('duration_seconds', 0):.1f} seconds")
-        report_lines.append(f"- **Frames Analyzed:** {num_frames}")
-        report_lines.append(f"- **Analysis Time:** {processing_time:.1f} seconds")
-        report_lines.append("")
-
-        # Transcript metadata
-        report_lines.append("## Transcript Analysis\n")
-        report_lines.append(f"- **Language:** {transcript_summary.get('language', 'unknown')}")
-        report_lines.append(f"- **Total Words:** {transcript_summary.get('total_words', 0)}")
-        report_lines.append(f"- **Speaking Pace:** {transcript_summary.get('words_per_minute', 0):.1f} words/minute")
-        report_lines.append("")
-
-        # Divider before evaluation
-        report_lines.append("---\n")
-
-        # Claude's creator feedback
-        report_lines.append("## Production Feedback & Recommendations\n")
-        report_lines.append(evaluation)
-        report_lines.append("")
-
-        # Footer
-        report_lines.append("\n---")
-        report_lines.append(f"\n*Creator feedback report generated on {timestamp}*")
-        report_lines.append(f"\n*This report is for CREATORS to improve production quality and pedagogical effectiveness.*")
-
-        # Write report to file
         safe_name = self._sanitize_filename(video_name)
         report_filename = f"{safe_name}_creator_feedback.md"
         report_path = os.path.join(self.output_dir, report_filename)
 
+        # Write report lines straight to the file
         with open(report_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(report_lines))
+            def write(line=""):
+                f.write(line)
+                f.write("\n")
+
+            write(f"# Creator Feedback Report: {video_name}")
+            write(f"\n**Generated:** {timestamp}")
+            write("**Report Type:** Production & Pedagogical Feedback\n")
+
+            # Video metadata section
+            write("## Video Information\n")
+            write(f"- **File:** `{Path(video_path).name}`")
+            write(f"- **Duration:** {transcript_summary.get('duration_seconds', 0):.1f} seconds")
+            write(f"- **Frames Analyzed:** {num_frames}")
+            write(f"- **Analysis Time:** {processing_time:.1f} seconds")
+            write()
+
+            # Transcript metadata
+            write("## Transcript Analysis\n")
+            write(f"- **Language:** {transcript_summary.get('language', 'unknown')}")
+            write(f"- **Total Words:** {transcript_summary.get('total_words', 0)}")
+            write(f"- **Speaking Pace:** {transcript_summary.get('words_per_minute', 0):.1f} words/minute")
+            write()
+
+            # Divider before evaluation
+            write("---\n")
+
+            # Claude's creator feedback
+            write("## Production Feedback & Recommendations\n")
+            write(evaluation)
+            write()
+
+            # Footer
+            write("\n---")
+            write(f"\n*Creator feedback report generated on {timestamp}*")
+            f.write("\n*This report is for CREATORS to improve production quality and pedagogical effectiveness.*")
 
         logger.info(f"✓ Creator report saved: {report_path}")
         return report_path
 
 
+class LazyComponent:
+    """
+    Stand-in for a component that is only built on first use
+
+    Attribute access is forwarded to the real object, which the factory
+    creates once (thread-safe). A factory error is remembered and re-raised
+    instead of retrying the load for every video.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._instance = None
+        self._error = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        with self._lock:
+            if self._instance is None and self._error is None:
+                try:
+                    self._instance = self._factory()
+                except Exception as e:
+                    self._error = e
+            if self._error is not None:
+                raise self._error
+            return self._instance
+
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
+
+
+def create_creator_evaluator():
+    """Create the Claude API evaluator patched to use the creator rubric"""
+    from src.evaluator import VideoEvaluator
+
+    evaluator = VideoEvaluator()
+    evaluator._original_build = evaluator._build_evaluation_prompt
+    evaluator._build_system_prompt = _build_creator_system_prompt
+    evaluator._build_evaluation_prompt = lambda transcript, video_name, num_frames: \
+        _build_creator_prompt(transcript, video_name, num_frames)
+    return evaluator
+
+
+def warm_up_evaluator(evaluator: LazyComponent):
+    """Build the evaluator and warm its API connection; failures are logged, not raised"""
+    try:
+        evaluator.warmup()
+    except Exception as e:
+        logger.warning(f"Evaluator warm-up failed: {e}")
+
+
+def prepare_job(video_path: str, temp_dir: str, index: int = 0, video_name: str = None) -> dict:
+    """
+    Create the per-video state passed between pipeline stages
+
+    Each job gets its own mkdtemp() directory: videos with the same stem
+    (clip.mp4, clip.mov) run concurrently and must not share temp files.
+
+    Args:
+        index: Position of the video in the run (restores input order)
+        video_name: Name for logs and the report (defaults to the file stem)
+
+    Returns:
+        Job dict with paths, timing and (later) frames, transcript and error
+    """
+    video_name = video_name or Path(video_path).stem
+    video_temp_dir = tempfile.mkdtemp(prefix=f"{index:04d}_{video_name}_", dir=temp_dir)
+    return {
+        'index': index,
+        'video_path': video_path,
+        'video_name': video_name,
+        'start_time': time.time(),
+        'video_temp_dir': video_temp_dir,
+        'error': None
+    }
+
+
+def extract_stage(job: dict, frame_extractor: FrameExtractor, frames_per_batch: int) -> None:
+    """Stage 1: extract and sample frames (kept in memory as JPEG bytes)"""
+    logger.info(f"[{job['video_name']}] Step 1/4: Extracting video frames...")
+
+    # Only decode the frames that sampling would keep
+    job['selected_frames'] = frame_extractor.encode_sampled_frames(job['video_path'], frames_per_batch)
+
+    logger.info(f"[{job['video_name']}] Using {len(job['selected_frames'])} frames for analysis\n")
+
+
+def transcribe_stage(job: dict, audio_transcriber: AudioTranscriber) -> None:
+    """Stage 2: transcribe audio"""
+    logger.info(f"[{job['video_name']}] Step 2/4: Transcribing audio with Whisper...")
+    job['transcript_result'] = audio_transcriber.transcribe_video(job['video_path'], job['video_temp_dir'])
+
+
+def evaluate_stage(
+    job: dict,
+    audio_transcriber: AudioTranscriber,
+    evaluator: VideoEvaluatorClaudeCode,
+    report_generator: CreatorReportGenerator
+) -> tuple:
+    """
+    Stages 3-4: get creator feedback from Claude and write the report
+
+    Returns:
+        Tuple of (video_name, report_path, processing_time)
+    """
+    video_name = job['video_name']
+    transcript_formatted = audio_transcriber.format_transcript_for_claude(job['transcript_result'])
+    transcript_summary = audio_transcriber.get_transcript_summary(job['transcript_result'])
+
+    # Step 3: Evaluate with Claude (using creator rubric)
+    logger.info(f"[{video_name}] Step 3/4: Getting creator feedback from Claude...")
+    evaluation = evaluator.evaluate_with_retry(
+        job['selected_frames'],
+        transcript_formatted,
+        video_name
+    )
+    logger.info("")
+
+    # Step 4: Generate report
+    logger.info(f"[{video_name}] Step 4/4: Generating creator feedback report...")
+    processing_time = time.time() - job['start_time']
+    report_path = report_generator.generate_report(
+        video_name=video_name,
+        video_path=job['video_path'],
+        evaluation=evaluation,
+        transcript_summary=transcript_summary,
+        num_frames=len(job['selected_frames']),
+        processing_time=processing_time
+    )
+
+    logger.info(f"\n✓ Creator feedback for {video_name} complete in {processing_time:.1f} seconds")
+
+    return (video_name, report_path, processing_time)
+
+
 def process_video(
     video_path: str,
     frame_extractor: FrameExtractor,
@@ -128,79 +306,136 @@ def process_video(
     temp_dir: str
 ) -> tuple:
     """
-    Process a single video for creator feedback
+    Process a single video for creator feedback (all stages in sequence)
 
     Returns:
         Tuple of (video_name, report_path, processing_time)
     """
-    video_name = Path(video_path).stem
-    start_time = time.time()
+    job = prepare_job(video_path, temp_dir)
 
     logger.info(f"\n{'='*80}")
-    logger.info(f"ANALYZING: {video_name}")
+    logger.info(f"ANALYZING: {job['video_name']}")
     logger.info(f"{'='*80}\n")
 
-    # Create temp directory for this video
-    video_temp_dir = os.path.join(temp_dir, video_name)
-    frames_dir = os.path.join(video_temp_dir, 'frames')
-    os.makedirs(frames_dir, exist_ok=True)
-
     try:
-        # Step 1: Extract frames
-        logger.info("Step 1/4: Extracting video frames...")
-        all_frames = frame_extractor.extract_frames(video_path, frames_dir)
-
-        # Sample frames if we have too many
-        if len(all_frames) > frames_per_batch:
-            logger.info(f"Sampling {frames_per_batch} frames from {len(all_frames)} total...")
-            selected_frames = frame_extractor.sample_frames_evenly(all_frames, frames_per_batch)
-        else:
-            selected_frames = all_frames
-
-        logger.info(f"Using {len(selected_frames)} frames for analysis\n")
-
-        # Step 2: Transcribe audio
-        logger.info("Step 2/4: Transcribing audio with Whisper...")
-        transcript_result = audio_transcriber.transcribe_video(video_path, video_temp_dir)
-        transcript_formatted = audio_transcriber.format_transcript_for_claude(transcript_result)
-        transcript_summary = audio_transcriber.get_transcript_summary(transcript_result)
-        logger.info("")
+        extract_stage(job, frame_extractor, frames_per_batch)
+        transcribe_stage(job, audio_transcriber)
+        return evaluate_stage(job, audio_transcriber, evaluator, report_generator)
 
-        # Step 3: Evaluate with Claude (using creator rubric)
-        logger.info("Step 3/4: Getting creator feedback from Claude...")
-        evaluation = evaluator.evaluate_with_retry(
-            selected_frames,
-            transcript_formatted,
-            video_name
-        )
-        logger.info("")
+    except Exception as e:
+        logger.error(f"✗ Error analyzing video: {e}")
+        raise
 
-        # Step 4: Generate report
-        logger.info("Step 4/4: Generating creator feedback report...")
-        processing_time = time.time() - start_time
-        report_path = report_generator.generate_report(
-            video_name=video_name,
-            video_path=video_path,
-            evaluation=evaluation,
-            transcript_summary=transcript_summary,
-            num_frames=len(selected_frames),
-            processing_time=processing_time
-        )
 
-        logger.info(f"\n✓ Creator feedback complete in {processing_time:.1f} seconds")
+def run_pipeline(
+    video_files: List[str],
+    frame_extractor: FrameExtractor,
+    audio_transcriber: AudioTranscriber,
+    evaluator: VideoEvaluatorClaudeCode,
+    report_generator: CreatorReportGenerator,
+    frames_per_batch: int,
+    temp_dir: str,
+    max_concurrent: int = MAX_CONCURRENT_EVALUATIONS
+):
+    """
+    Analyze videos with overlapping stages
+
+    A frame-extraction thread and a transcription thread feed the caller
+    through bounded queues, so while video N is with Claude, video N+1 is
+    being transcribed and N+2's frames extracted. Up to max_concurrent
+    Claude requests run at once on a thread pool; the bounded queues keep
+    at most a couple of videos' frames in memory ahead of evaluation.
 
-        return (video_name, report_path, processing_time)
+    Yields:
+        (job, result, error) per video in completion order; result is
+        (video_name, report_path, processing_time) or None on error
+    """
+    frames_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    transcripts_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    stop = threading.Event()
+
+    # Reports are written concurrently and named after the video, so
+    # repeated stems (clip.mp4, clip.mov) get their extension appended
+    stem_counts = Counter(Path(vp).stem for vp in video_files)
+    video_names = [
+        Path(vp).stem if stem_counts[Path(vp).stem] == 1
+        else f"{Path(vp).stem}_{Path(vp).suffix.lstrip('.')}"
+        for vp in video_files
+    ]
+
+    def extract_worker():
+        for index, video_path in enumerate(video_files):
+            if stop.is_set():
+                break
+            job = prepare_job(video_path, temp_dir, index, video_names[index])
+            try:
+                extract_stage(job, frame_extractor, frames_per_batch)
+            except Exception as e:
+                job['error'] = e
+            frames_queue.put(job)
+        frames_queue.put(None)
+
+    def transcribe_worker():
+        while True:
+            job = frames_queue.get()
+            if job is None or stop.is_set():
+                break
+            if job['error'] is None:
+                try:
+                    transcribe_stage(job, audio_transcriber)
+                except Exception as e:
+                    job['error'] = e
+            transcripts_queue.put(job)
+        transcripts_queue.put(None)
+
+    threads = [
+        threading.Thread(target=extract_worker, name='extract', daemon=True),
+        threading.Thread(target=transcribe_worker, name='transcribe', daemon=True)
+    ]
+    for thread in threads:
+        thread.start()
+
+    # Caps Claude requests in flight; acquired before submitting so the
+    # transcripts queue (and the stages behind it) stay bounded
+    in_flight = threading.Semaphore(max_concurrent)
+
+    def evaluate_worker(job):
+        try:
+            return evaluate_stage(job, audio_transcriber, evaluator, report_generator)
+        finally:
+            in_flight.release()
 
-    except Exception as e:
-        logger.error(f"✗ Error analyzing video: {e}")
-        raise
+    def outcome(future):
+        job = futures.pop(future)
+        try:
+            return job, future.result(), None
+        except Exception as e:
+            return job, None, e
 
+    futures = {}
+    executor = ThreadPoolExecutor(max_workers=max_concurrent)
+    try:
+        while True:
+            job = transcripts_queue.get()
+            if job is None:
+                break
+            if job['error'] is not None:
+                yield job, None, job['error']
+                continue
+
+            in_flight.acquire()
+            futures[executor.submit(evaluate_worker, job)] = job
+
+            # Report whatever has finished so far
+            for future in [f for f in futures if f.done()]:
+                yield outcome(future)
+
+        for future in as_completed(list(futures)):
+            yield outcome(future)
     finally:
-        # Keep transcripts, but clean up frames
-        frames_dir = os.path.join(video_temp_dir, 'frames')
-        if os.path.exists(frames_dir):
-            shutil.rmtree(frames_dir)
-            logger.info(f"Cleaned up frame files (transcript saved)")
+        # Stop feeding new videos (e.g. on Ctrl+C); workers are daemons
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 def main():
@@ -265,6 +500,13 @@ This tool provides CREATOR-FOCUSED feedback on:
         help='Whisper model size (default: base)'
     )
 
+    parser.add_argument(
+        '--concurrent-evaluations',
+        type=int,
+        default=MAX_CONCURRENT_EVALUATIONS,
+        help=f'Claude requests to run at once (default: {MAX_CONCURRENT_EVALUATIONS})'
+    )
+
     args = parser.parse_args()
 
     # Handle YouTube URL if provided
@@ -305,25 +547,21 @@ This tool provides CREATOR-FOCUSED feedback on:
             logger.info(f"  {i}. {Path(vf).name}")
         logger.info("")
 
-    # Initialize components with creator rubric
+    # Initialize components with creator rubric. Whisper and the Claude client
+    # are built on first use, so the model loads on the transcription thread
+    # while the first video's frames are being extracted.
     try:
         logger.info("Initializing creator analysis components...")
         frame_extractor = FrameExtractor(interval_seconds=args.frame_interval)
-        audio_transcriber = AudioTranscriber(model_name=args.whisper_model)
-
-        # Use creator rubric
-        from src.evaluator import VideoEvaluator
-        from src.rubric_creator import get_creator_evaluation_prompt
-
-        # Patch the evaluator to use creator rubric
-        evaluator = VideoEvaluator()
-        evaluator._original_build = evaluator._build_evaluation_prompt
-        evaluator._build_evaluation_prompt = lambda transcript, video_name, num_frames: \
-            _build_creator_prompt(transcript, video_name, num_frames)
-
+        audio_transcriber = LazyComponent(lambda: get_transcriber(args.whisper_model))
+        evaluator = LazyComponent(create_creator_evaluator)
         report_generator = CreatorReportGenerator(output_dir='output/reports')
         logger.info("✓ Creator analysis components initialized\n")
 
+        # Connect to the API while the first video is extracted/transcribed;
+        # the client (and its connection pool) is then reused for every video
+        threading.Thread(target=warm_up_evaluator, args=(evaluator,), daemon=True).start()
+
     except Exception as e:
         logger.error(f"Failed to initialize: {e}")
         return 1
@@ -337,29 +575,35 @@ This tool provides CREATOR-FOCUSED feedback on:
     successful = 0
     failed = 0
 
-    for i, video_path in enumerate(video_files, 1):
-        logger.info(f"\n[Video {i}/{len(video_files)}]")
-        try:
-            result = process_video(
-                video_path,
-                frame_extractor,
-                audio_transcriber,
-                evaluator,
-                report_generator,
-                args.frames_per_batch,
-                temp_dir
-            )
-            video_reports.append(result[:2])  # (name, report_path)
+    try:
+        pipeline = run_pipeline(
+            video_files,
+            frame_extractor,
+            audio_transcriber,
+            evaluator,
+            report_generator,
+            args.frames_per_batch,
+            temp_dir,
+            max_concurrent=max(1, args.concurrent_evaluations)
+        )
+        for i, (job, result, error) in enumerate(pipeline, 1):
+            # The job is finished either way; its temp files are no longer needed
+            shutil.rmtree(job['video_temp_dir'], ignore_errors=True)
+
+            logger.info(f"\n[Video {i}/{len(video_files)}] {job['video_name']}")
+            if error is not None:
+                logger.error(f"Failed to analyze {Path(job['video_path']).name}: {error}")
+                failed += 1
+                continue
+
+            video_reports.append((job['index'], result))  # result: (name, report_path, time)
             successful += 1
 
-        except KeyboardInterrupt:
-            logger.warning("\n\nAnalysis interrupted by user")
-            break
+    except KeyboardInterrupt:
+        logger.warning("\n\nAnalysis interrupted by user")
 
-        except Exception as e:
-            logger.error(f"Failed to analyze {Path(video_path).name}: {e}")
-            failed += 1
-            continue
+    # Summary lists videos in input order, whatever order they finished in
+    video_reports = [result for _, result in sorted(video_reports, key=lambda report: report[0])]
 
     # Generate summary report
     total_time = time.time() - total_start_time
@@ -384,33 +628,19 @@ This tool provides CREATOR-FOCUSED feedback on:
     return 0 if failed == 0 else 1
 
 
-def _build_creator_prompt(transcript: str, video_name: str, num_frames: int) -> str:
-    """Build prompt with creator rubric"""
-    from src.rubric_creator import get_creator_evaluation_prompt
-    rubric_prompt = get_creator_evaluation_prompt()
-
-    prompt = f"""# Creator Feedback Analysis
-
-VIDEO: {video_name}
-FRAMES ANALYZED: {num_frames} frames (sampled at regular intervals)
+def _build_creator_system_prompt() -> str:
+    """Build the creator rubric system prompt (cached across videos by the API)"""
+    return _CREATOR_SYSTEM_PROMPT
 
-{rubric_prompt}
 
----
-
-## VIDEO TRANSCRIPT
-
-{transcript}
-
----
-
-## YOUR TASK
-
-Provide comprehensive CREATOR FEEDBACK following the framework above. Be specific with timestamps, actionable with recommendations, and constructive in tone.
-
-Focus on helping the creator improve both THIS video and FUTURE videos.
-"""
-    return prompt
+def _build_creator_prompt(transcript: str, video_name: str, num_frames: int) -> str:
+    """Build the per-video creator prompt (rubric is in the system prompt)"""
+    return "".join((
+        _PROMPT_VIDEO, video_name,
+        _PROMPT_FRAMES, str(num_frames),
+        _PROMPT_TRANSCRIPT, transcript,
+        _PROMPT_TASK,
+    ))
 
 
 if __name__ == '__main__':
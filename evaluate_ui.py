@@ -4,10 +4,12 @@ Select ingested videos and evaluate with different rubrics/models
 """
 
 import streamlit as st
-import json
 import logging
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 
 # Import evaluators
 import sys
@@ -23,6 +25,7 @@ except ImportError:
 from pipeline.evaluators.claude_evaluator import ClaudeEvaluator
 from pipeline.evaluators.ollama_evaluator import OllamaEvaluator
 from pipeline.evaluators.gemini_evaluator import GeminiEvaluator
+from pipeline.evaluators.base import load_evaluation_index, load_video_option, file_mtime_ns
 from src.rubric_content_safety import get_content_safety_rubric
 from src.rubric_ai_quality import get_ai_quality_rubric
 from src.rubric_production_metrics import get_production_metrics_rubric
@@ -37,6 +40,51 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Rubric name -> prompt builder
+RUBRIC_GETTERS = {
+    "academic": get_academic_rubric,
+    "four_pillars": get_brainrot_rubric,
+    "content_safety": get_content_safety_rubric,
+    "ai_quality": get_ai_quality_rubric,
+    "production_metrics": get_production_metrics_rubric,
+    "media_ethics": get_media_ethics_rubric,
+}
+
+
+def _dump_json(data) -> str:
+    """Pretty-print data as JSON"""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+
+
+@st.cache_data(show_spinner=False)
+def load_all_metadata(dirs_with_mtimes: tuple) -> dict:
+    """
+    Load display info for all ingested videos in parallel
+
+    Args:
+        dirs_with_mtimes: Tuple of (video_dir, metadata mtime, youtube metadata mtime);
+            the mtimes are only there so edits invalidate the cache
+
+    Returns:
+        Dict of display name -> video option
+    """
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        entries = executor.map(load_video_option, [entry[0] for entry in dirs_with_mtimes])
+        return dict(entry for entry in entries if entry is not None)
+
+
+@st.cache_data(show_spinner=False)
+def list_existing_evaluations(evaluations_dir: str, dir_mtime: int) -> list:
+    """
+    List a video's saved evaluations (filename, rubric, timestamp), newest first
+
+    Args:
+        evaluations_dir: The video's evaluations directory
+        dir_mtime: Directory mtime; only there so a newly saved evaluation
+            invalidates the cache
+    """
+    return load_evaluation_index(Path(evaluations_dir))
+
 
 # Page config
 st.set_page_config(
@@ -209,34 +257,11 @@ if not video_dirs:
     st.info("Please run the ingestion step first (app.py) to process videos.")
     st.stop()
 
-# Load video metadata for display
-video_options = {}
-for vdir in sorted(video_dirs):
-    metadata_path = vdir / "metadata.json"
-    if metadata_path.exists():
-        with open(metadata_path, 'r') as f:
-            metadata = json.load(f)
-
-        video_id = vdir.name
-        duration = metadata.get('duration_seconds', 0)
-        frame_count = metadata.get('frame_count', 0)
-        source_type = metadata.get('source_type', 'unknown')
-
-        # Get YouTube title if available
-        title = video_id
-        youtube_metadata_path = vdir / "youtube_metadata.json"
-        if youtube_metadata_path.exists():
-            with open(youtube_metadata_path, 'r') as f:
-                yt_meta = json.load(f)
-                title = yt_meta.get('title', video_id)
-
-        display_name = f"{title} ({duration:.0f}s, {frame_count} frames)"
-        video_options[display_name] = {
-            'video_id': video_id,
-            'path': vdir,
-            'metadata': metadata,
-            'title': title
-        }
+# Load video metadata for display (cached until a metadata file changes)
+video_options = load_all_metadata(tuple(
+    (str(vdir), file_mtime_ns(vdir / "metadata.json"), file_mtime_ns(vdir / "youtube_metadata.json"))
+    for vdir in sorted(video_dirs)
+))
 
 selected_video_display = st.selectbox(
     "Select ingested video",
@@ -265,17 +290,14 @@ if selected_video_display:
 
     # Show existing evaluations if any
     evaluations_dir = video_dir / "evaluations"
-    if evaluations_dir.exists():
-        existing_evals = list(evaluations_dir.glob("*.json"))
+    dir_mtime = file_mtime_ns(evaluations_dir)
+    if dir_mtime is not None:
+        existing_evals = list_existing_evaluations(str(evaluations_dir), dir_mtime)
         if existing_evals:
             with st.expander(f"📊 Existing Evaluations ({len(existing_evals)})"):
-                for eval_path in sorted(existing_evals, reverse=True):
-                    with open(eval_path, 'r') as f:
-                        eval_data = json.load(f)
-
-                    rubric = eval_data.get('rubric', 'unknown')
-                    timestamp = eval_data.get('timestamp', 'unknown')
-                    st.write(f"- **{rubric}** - {timestamp} - [{eval_path.name}]({eval_path})")
+                for entry in existing_evals:
+                    eval_path = evaluations_dir / entry['filename']
+                    st.write(f"- **{entry['rubric']}** - {entry['timestamp']} - [{eval_path.name}]({eval_path})")
 
     st.markdown("---")
 
@@ -337,21 +359,11 @@ if selected_video_display:
                 status.text("Loading rubric...")
                 progress_bar.progress(10)
 
-                if rubric_choice == "academic":
-                    rubric_prompt = get_academic_rubric()
-                elif rubric_choice == "four_pillars":
-                    rubric_prompt = get_brainrot_rubric()
-                elif rubric_choice == "content_safety":
-                    rubric_prompt = get_content_safety_rubric()
-                elif rubric_choice == "ai_quality":
-                    rubric_prompt = get_ai_quality_rubric()
-                elif rubric_choice == "production_metrics":
-                    rubric_prompt = get_production_metrics_rubric()
-                elif rubric_choice == "media_ethics":
-                    rubric_prompt = get_media_ethics_rubric()
-                else:
+                get_rubric = RUBRIC_GETTERS.get(rubric_choice)
+                if get_rubric is None:
                     st.error(f"Unknown rubric: {rubric_choice}")
                     st.stop()
+                rubric_prompt = get_rubric()
 
                 # Calculate actual max_frames for percentage selections
                 total_frames = metadata.get('frame_count', 100)
@@ -466,7 +478,7 @@ if selected_video_display:
                 # Download button
                 st.download_button(
                     label="📥 Download Evaluation (JSON)",
-                    data=json.dumps(result, indent=2),
+                    data=_dump_json(result),
                     file_name=f"{video_id}_{rubric_choice}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                     mime="application/json"
                 )
@@ -0,0 +1,33 @@
+-- Migration: Count every evaluation status in rubric_completion_stats
+-- Run this in Supabase SQL Editor
+--
+-- The previous view joined only completed evaluations, so total_evaluations
+-- equalled completed_count and failed_count was always 0. The rubric stats are
+-- now aggregated over all evaluations in one GROUP BY, with the averages still
+-- taken over completed runs.
+
+-- Step 1: Covering index so the aggregation can be an index-only scan
+CREATE INDEX IF NOT EXISTS idx_evaluations_rubric_status
+ON evaluations(rubric_name, status) INCLUDE (cost, duration_seconds);
+
+-- Step 2: Replace the view
+CREATE OR REPLACE VIEW rubric_completion_stats AS
+SELECT
+    r.name,
+    r.display_name,
+    r.category,
+    r.sort_order,
+    COUNT(e.id) as total_evaluations,
+    COUNT(e.id) FILTER (WHERE e.status = 'completed') as completed_count,
+    COUNT(e.id) FILTER (WHERE e.status = 'failed') as failed_count,
+    COALESCE(AVG(e.cost) FILTER (WHERE e.status = 'completed'), 0) as avg_cost,
+    COALESCE(AVG(e.duration_seconds) FILTER (WHERE e.status = 'completed'), 0) as avg_duration_seconds
+FROM rubrics r
+LEFT JOIN evaluations e ON r.name = e.rubric_name
+WHERE r.is_active = TRUE
+GROUP BY r.name, r.display_name, r.category, r.sort_order
+ORDER BY r.sort_order;
+
+-- Verify the migration
+SELECT name, total_evaluations, completed_count, failed_count
+FROM rubric_completion_stats;
@@ -3,85 +3,69 @@ All Videos Page - Shows video overview with status grid
 """
 
 import streamlit as st
+import html
 import sys
 from pathlib import Path
 from datetime import datetime
+from operator import itemgetter
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.database import VideoEvaluatorDB
 
+# Video cards rendered per page of the list
+PAGE_SIZE = 25
+
 st.set_page_config(
     page_title="All Videos",
     page_icon="📋",
     layout="wide"
 )
 
-# Custom CSS
-st.markdown("""
-<style>
-    .video-card {
-        background-color: #f8f9fa;
-        padding: 1.5rem;
-        border-radius: 0.75rem;
-        border: 1px solid #dee2e6;
-        margin-bottom: 1rem;
-    }
-    .video-title {
-        font-size: 1.3rem;
-        font-weight: bold;
-        margin-bottom: 0.5rem;
-        color: #212529;
-    }
-    .video-meta {
-        font-size: 0.9rem;
-        color: #6c757d;
-        margin-bottom: 1rem;
-    }
-    .status-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fill, minmax(120px, 1fr));
-        gap: 0.5rem;
-        margin-top: 1rem;
-    }
-    .status-item {
-        padding: 0.5rem;
-        border-radius: 0.5rem;
-        text-align: center;
-        font-size: 0.85rem;
-        border: 1px solid #dee2e6;
-    }
-    .status-completed {
-        background-color: #d1e7dd;
-        border-color: #a3cfbb;
-    }
-    .status-pending {
-        background-color: #f8f9fa;
-        border-color: #dee2e6;
-    }
-    .status-in-progress {
-        background-color: #fff3cd;
-        border-color: #ffe69c;
-    }
-    .status-failed {
-        background-color: #f8d7da;
-        border-color: #f1aeb5;
-    }
-    .progress-bar {
-        height: 8px;
-        background-color: #e9ecef;
-        border-radius: 4px;
-        overflow: hidden;
-        margin: 0.5rem 0;
-    }
-    .progress-fill {
-        height: 100%;
-        background-color: #0d6efd;
-        transition: width 0.3s ease;
-    }
-</style>
-""", unsafe_allow_html=True)
+
+@st.cache_resource
+def _load_css():
+    """Page stylesheet, read from disk once per process."""
+    css_path = Path(__file__).parent.parent / "styles" / "all_videos.css"
+    return f"<style>\n{css_path.read_text(encoding='utf-8')}</style>"
+
+
+# Custom CSS. Streamlit drops elements a full rerun doesn't re-emit, so this is
+# sent on full reruns; filter/sort/page changes rerun only the list fragment.
+st.markdown(_load_css(), unsafe_allow_html=True)
+
+
+@st.cache_resource
+def get_db():
+    """Database client, shared across reruns and sessions."""
+    return VideoEvaluatorDB()
+
+
+@st.cache_data(ttl=60)
+def _load_video_status():
+    """Per-video status rows, cached for 60 seconds across reruns."""
+    video_status = get_db().get_video_status()
+    # Case-folded search keys and normalized sort fields, computed once per load
+    # so filtering and sorting need no per-row Python callbacks
+    for v in video_status:
+        v['_title_lc'] = v['title'].casefold()
+        v['_id_lc'] = v['id'].casefold()
+        v['_date_key'] = v.get('ingestion_date') or ''
+        v['completion_percentage'] = v.get('completion_percentage') or 0
+    return video_status
+
+
+@st.cache_data(ttl=60)
+def _load_all_rubrics():
+    """Active rubrics, cached for 60 seconds across reruns."""
+    return get_db().get_all_rubrics()
+
+
+@st.cache_data(ttl=60)
+def _load_evaluations_grouped(video_ids):
+    """Evaluations for the given videos keyed by video ID, in one query, cached for 60 seconds."""
+    return get_db().get_all_evaluations_grouped(list(video_ids))
 
 
 def get_status_emoji(status):
@@ -104,30 +88,90 @@ def format_duration(seconds):
     return f"{minutes}m {secs}s"
 
 
-def main():
-    st.title("📋 All Videos")
-    st.markdown("View and manage all ingested videos and their evaluation status")
-    st.markdown("---")
-
-    # Initialize database
-    try:
-        db = VideoEvaluatorDB()
-    except Exception as e:
-        st.error(f"Database connection failed: {e}")
-        return
-
-    # Get video status data
-    try:
-        video_status = db.get_video_status()
-        all_rubrics = db.get_all_rubrics()
-    except Exception as e:
-        st.error(f"Error loading videos: {e}")
-        return
-
-    if not video_status:
-        st.info("No videos found. Start by ingesting videos with Phase 1!")
-        return
-
+# (key, reverse) per sort mode; fields are normalized in _load_video_status
+SORT_KEYS = {
+    "Newest First": (itemgetter('_date_key'), True),
+    "Oldest First": (itemgetter('_date_key'), False),
+    "Most Complete": (itemgetter('completion_percentage'), True),
+    "Least Complete": (itemgetter('completion_percentage'), False),
+    "Title A-Z": (itemgetter('title'), False),
+}
+
+
+def sorted_view(video_status, sort_by):
+    """
+    video_status sorted by sort_by, memoized in the session.
+
+    The memo is tied to this exact list object, so it lives across fragment
+    reruns (same data) and is rebuilt when a full rerun reloads the data.
+    """
+    memo = st.session_state.get('all_videos_sorted')
+    if memo is None or memo[0] is not video_status:
+        memo = (video_status, {})
+        st.session_state['all_videos_sorted'] = memo
+
+    views = memo[1]
+    if sort_by not in views:
+        key, reverse = SORT_KEYS.get(sort_by, (None, False))
+        views[sort_by] = sorted(video_status, key=key, reverse=reverse) if key else list(video_status)
+    return views[sort_by]
+
+
+def build_card_html(video, all_rubrics, status_by_rubric=None):
+    """
+    HTML for one video card: title, meta line, completion/cost, progress bar
+    and, when status_by_rubric is given, the per-rubric status grid.
+    """
+    meta_parts = [f"🆔 {html.escape(video['id'][:12])}..."]
+    if video.get('duration_seconds'):
+        meta_parts.append(f"⏱️ {format_duration(video['duration_seconds'])}")
+    if video.get('frame_count'):
+        meta_parts.append(f"🖼️ {video['frame_count']} frames")
+    if video.get('youtube_id'):
+        meta_parts.append("📺 YouTube")
+
+    completion = video.get('completion_percentage', 0) or 0
+    total_cost = video.get('total_cost')
+    cost = f"${total_cost:.3f}" if total_cost else "$0.00"
+
+    parts = [
+        '<div class="video-card">',
+        '<div class="video-card-header"><div>',
+        f'<div class="video-title">{html.escape(video["title"])}</div>',
+        f'<div class="video-meta">{" • ".join(meta_parts)}</div>',
+        '</div><div class="video-stats">',
+        f'<div class="video-stat"><div class="video-stat-label">Completion</div>'
+        f'<div class="video-stat-value">{completion:.0f}%</div></div>',
+        f'<div class="video-stat"><div class="video-stat-label">Cost</div>'
+        f'<div class="video-stat-value">{cost}</div></div>',
+        '</div></div>',
+        f'<div class="progress-bar"><div class="progress-fill" style="width: {completion}%"></div></div>',
+        f'<div><strong>Evaluations:</strong> {video["completed_count"]}/{video["total_evaluations"]} complete</div>',
+    ]
+
+    if status_by_rubric is not None:
+        parts.append('<div class="status-grid">')
+        for rubric in all_rubrics:
+            eval_status = status_by_rubric.get(rubric['name'], 'pending')
+            parts.append(
+                f'<div class="status-item status-{eval_status.replace("_", "-")}">'
+                f'{get_status_emoji(eval_status)}<br>'
+                f'<small>{html.escape(rubric["display_name"][:15])}</small></div>'
+            )
+        parts.append('</div>')
+
+    parts.append('</div>')
+    return ''.join(parts)
+
+
+def _change_page(delta):
+    """Button callback: move the video list forward/back one page."""
+    st.session_state['all_videos_page'] = st.session_state.get('all_videos_page', 0) + delta
+
+
+@st.fragment
+def render_video_list(video_status, all_rubrics):
+    """Filters and video cards; reruns on its own when the search/sort widgets change."""
     # Filters
     col1, col2, col3 = st.columns([2, 2, 1])
 
@@ -147,115 +191,112 @@ def main():
 
     st.markdown("---")
 
-    # Filter videos based on search
-    filtered_videos = video_status
+    # Sort the full list (memoized per sort mode), then filter; filtering
+    # keeps the sorted order, so typing in the search box never re-sorts
+    sorted_videos = sorted_view(video_status, sort_by)
+    filtered_videos = sorted_videos
     if search:
-        search_lower = search.lower()
+        search_cf = search.casefold()
         filtered_videos = [
-            v for v in video_status
-            if search_lower in v['title'].lower() or search_lower in v['id'].lower()
+            v for v in sorted_videos
+            if search_cf in v['_title_lc'] or search_cf in v['_id_lc']
         ]
 
-    # Sort videos
-    if sort_by == "Newest First":
-        filtered_videos.sort(key=lambda x: x.get('ingestion_date') or '', reverse=True)
-    elif sort_by == "Oldest First":
-        filtered_videos.sort(key=lambda x: x.get('ingestion_date') or '')
-    elif sort_by == "Most Complete":
-        filtered_videos.sort(key=lambda x: x.get('completion_percentage', 0), reverse=True)
-    elif sort_by == "Least Complete":
-        filtered_videos.sort(key=lambda x: x.get('completion_percentage', 0))
-    elif sort_by == "Title A-Z":
-        filtered_videos.sort(key=lambda x: x['title'])
+    # Back to the first page whenever the search or sort changes
+    if st.session_state.get('all_videos_filters') != (search, sort_by):
+        st.session_state['all_videos_filters'] = (search, sort_by)
+        st.session_state['all_videos_page'] = 0
+
+    page_count = max(1, -(-len(filtered_videos) // PAGE_SIZE))
+    page = min(max(st.session_state.get('all_videos_page', 0), 0), page_count - 1)
+    st.session_state['all_videos_page'] = page
+    page_videos = filtered_videos[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]
 
     st.write(f"Showing {len(filtered_videos)} of {len(video_status)} videos")
 
-    # Display videos
-    for video in filtered_videos:
-        with st.container():
-            # Video card header
-            col1, col2, col3 = st.columns([6, 2, 2])
-
-            with col1:
-                st.markdown(f'<div class="video-title">{video["title"]}</div>', unsafe_allow_html=True)
-                meta_parts = [
-                    f"🆔 {video['id'][:12]}...",
-                ]
-                if video.get('duration_seconds'):
-                    meta_parts.append(f"⏱️ {format_duration(video['duration_seconds'])}")
-                if video.get('frame_count'):
-                    meta_parts.append(f"🖼️ {video['frame_count']} frames")
-                if video.get('youtube_id'):
-                    meta_parts.append(f"📺 YouTube")
-
-                st.markdown(f'<div class="video-meta">{" • ".join(meta_parts)}</div>', unsafe_allow_html=True)
-
-            with col2:
-                completion = video.get('completion_percentage', 0)
-                st.metric("Completion", f"{completion:.0f}%")
-
-            with col3:
-                if video.get('total_cost'):
-                    st.metric("Cost", f"${video['total_cost']:.3f}")
-                else:
-                    st.metric("Cost", "$0.00")
-
-            # Progress bar
-            completion = video.get('completion_percentage', 0)
-            st.markdown(f"""
-            <div class="progress-bar">
-                <div class="progress-fill" style="width: {completion}%"></div>
-            </div>
-            """, unsafe_allow_html=True)
-
-            # Evaluation status
-            st.write(f"**Evaluations:** {video['completed_count']}/{video['total_evaluations']} complete")
-
-            if show_all:
-                # Get detailed evaluations for this video
-                evaluations = db.get_video_evaluations(video['id'])
-
-                # Create status grid
-                cols = st.columns(len(all_rubrics))
-                for idx, rubric in enumerate(all_rubrics):
-                    with cols[idx]:
-                        # Find evaluation for this rubric
-                        eval_status = 'pending'
-                        for eval_item in evaluations:
-                            if eval_item['rubric_name'] == rubric['name']:
-                                eval_status = eval_item['status']
-                                break
-
-                        # Status badge
-                        status_class = f"status-{eval_status}"
-                        emoji = get_status_emoji(eval_status)
-                        st.markdown(f"""
-                        <div class="status-item {status_class}">
-                            {emoji}<br>
-                            <small>{rubric['display_name'][:15]}</small>
-                        </div>
-                        """, unsafe_allow_html=True)
-
-            # Action button
-            if st.button(f"View Details →", key=f"view_{video['id']}", use_container_width=True):
-                st.session_state['selected_video_id'] = video['id']
-                st.switch_page("pages/3_📹_Video_Detail.py")
-
-            st.markdown("---")
-
-    # Summary footer
+    # One query for the whole page instead of one per video
+    evaluations_by_video = {}
+    if show_all:
+        evaluations_by_video = _load_evaluations_grouped(tuple(v['id'] for v in page_videos))
+
+    # Display only the current page of videos
+    for video in page_videos:
+        status_by_rubric = None
+        if show_all:
+            # Status of each rubric for this video (first record wins)
+            status_by_rubric = {}
+            for eval_item in evaluations_by_video.get(video['id'], []):
+                status_by_rubric.setdefault(eval_item['rubric_name'], eval_item['status'])
+
+        # Whole card in one element; only the action button is a separate widget
+        st.markdown(build_card_html(video, all_rubrics, status_by_rubric), unsafe_allow_html=True)
+
+        if st.button("View Details →", key=f"view_{video['id']}", use_container_width=True):
+            st.session_state['selected_video_id'] = video['id']
+            st.switch_page("pages/3_📹_Video_Detail.py")
+
+    # Page navigation
+    if page_count > 1:
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            st.button("← Previous", on_click=_change_page, args=(-1,),
+                      disabled=page == 0, use_container_width=True)
+        with col2:
+            st.markdown(f"<div style='text-align: center'>Page {page + 1} of {page_count}</div>",
+                        unsafe_allow_html=True)
+        with col3:
+            st.button("Next →", on_click=_change_page, args=(1,),
+                      disabled=page >= page_count - 1, use_container_width=True)
+
+
+def main():
+    st.title("📋 All Videos")
+    st.markdown("View and manage all ingested videos and their evaluation status")
+    st.markdown("---")
+
+    # Initialize database
+    try:
+        get_db()
+    except Exception as e:
+        st.error(f"Database connection failed: {e}")
+        return
+
+    if st.button("🔄 Refresh"):
+        _load_video_status.clear()
+        _load_all_rubrics.clear()
+        _load_evaluations_grouped.clear()
+
+    # Get video status data
+    try:
+        video_status = _load_video_status()
+        all_rubrics = _load_all_rubrics()
+    except Exception as e:
+        st.error(f"Error loading videos: {e}")
+        return
+
+    if not video_status:
+        st.info("No videos found. Start by ingesting videos with Phase 1!")
+        return
+
+    render_video_list(video_status, all_rubrics)
+
+    # Summary footer (all totals in one pass)
+    total_evals = completed_evals = 0
+    total_cost = 0.0
+    for v in video_status:
+        total_evals += v.get('total_evaluations', 0)
+        completed_evals += v.get('completed_count', 0)
+        total_cost += v.get('total_cost', 0) or 0
+
     st.markdown("### 📊 Summary")
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("Total Videos", len(video_status))
     with col2:
-        total_evals = sum(v.get('total_evaluations', 0) for v in video_status)
         st.metric("Total Evaluations", total_evals)
     with col3:
-        completed_evals = sum(v.get('completed_count', 0) for v in video_status)
         st.metric("Completed", completed_evals)
     with col4:
-        total_cost = sum(v.get('total_cost', 0) for v in video_status)
         st.metric("Total Cost", f"${total_cost:.2f}")
 
 
@@ -3,13 +3,15 @@ Subtitle Generator - Web UI
 Generate SRT subtitles and transcripts from video files using Whisper
 """
 import streamlit as st
+import io
 import os
+import shutil
 import tempfile
 from pathlib import Path
 from datetime import datetime
 import logging
 
-from src.audio_transcriber import AudioTranscriber
+from src.audio_transcriber import AudioTranscriber, get_transcriber as load_transcriber
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -26,14 +28,24 @@ st.set_page_config(
 SUBTITLE_DIR = "subtitles"
 TRANSCRIPT_DIR = "transcripts"
 WHISPER_MODELS = ["tiny", "base", "small", "medium", "large"]
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024  # copy uploads to disk 4 MB at a time
+
+
+@st.cache_resource
+def get_transcriber(model_name: str) -> AudioTranscriber:
+    """Load (and warm up) a Whisper transcriber once per model, reused across reruns"""
+    return load_transcriber(model_name, warmup=True)
 
 
 def format_srt_timestamp(seconds: float) -> str:
     """Format seconds to SRT timestamp format: HH:MM:SS,mmm"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    milliseconds = int((seconds - int(seconds)) * 1000)
+    total_ms = int(seconds * 1000)
+    total_seconds, milliseconds = divmod(total_ms, 1000)
+    if 0 <= total_ms < 3_600_000:  # sub-hour fast path
+        minutes, secs = divmod(total_seconds, 60)
+        return f"00:{minutes:02d}:{secs:02d},{milliseconds:03d}"
+    total_minutes, secs = divmod(total_seconds, 60)
+    hours, minutes = divmod(total_minutes, 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
 
 
@@ -46,45 +58,51 @@ def format_timestamp_readable(seconds: float) -> str:
 
 def create_srt_content(transcript_result: dict) -> str:
     """Generate SRT content from Whisper transcript"""
-    srt_lines = []
+    buf = io.StringIO()
     for idx, segment in enumerate(transcript_result.get('segments', []), start=1):
-        # SRT index
-        srt_lines.append(f"{idx}")
-
-        # Timestamps
+        # Blank line between subtitles
+        if idx > 1:
+            buf.write("\n")
         start_time = format_srt_timestamp(segment['start'])
         end_time = format_srt_timestamp(segment['end'])
-        srt_lines.append(f"{start_time} --> {end_time}")
-
-        # Text content
-        text = segment['text'].strip()
-        srt_lines.append(text)
-
-        # Blank line between subtitles
-        srt_lines.append("")
+        buf.write(f"{idx}\n{start_time} --> {end_time}\n{segment['text'].strip()}\n")
 
-    return "\n".join(srt_lines)
+    return buf.getvalue()
 
 
 def create_transcript_content(transcript_result: dict) -> str:
     """Generate transcript text content"""
-    lines = []
-    lines.append("=== VIDEO TRANSCRIPT ===\n")
-
-    # Full text
-    lines.append("FULL TEXT:")
-    lines.append(transcript_result['text'].strip())
-    lines.append("\n")
+    buf = io.StringIO()
+    buf.write("=== VIDEO TRANSCRIPT ===\n\nFULL TEXT:\n")
+    buf.write(transcript_result['text'].strip())
+    buf.write("\n\n\nTIMESTAMPED SEGMENTS:")
 
     # Timestamped segments
-    lines.append("TIMESTAMPED SEGMENTS:")
     for segment in transcript_result.get('segments', []):
         start_time = format_timestamp_readable(segment['start'])
         end_time = format_timestamp_readable(segment['end'])
-        text = segment['text'].strip()
-        lines.append(f"[{start_time} - {end_time}] {text}")
+        buf.write(f"\n[{start_time} - {end_time}] {segment['text'].strip()}")
+
+    return buf.getvalue()
+
+
+def list_generated_files(directory: Path, suffix: str) -> list:
+    """
+    List files with a suffix in one scandir pass, newest first
 
-    return "\n".join(lines)
+    Returns (path, stat_result) pairs so callers reuse the single stat per file.
+    """
+    with os.scandir(directory) as entries:
+        files = [(Path(entry.path), entry.stat()) for entry in entries
+                 if entry.name.endswith(suffix) and entry.is_file()]
+    files.sort(key=lambda item: item[1].st_mtime, reverse=True)
+    return files
+
+
+@st.cache_data(max_entries=256)
+def read_generated_file(path: str, mtime: float) -> bytes:
+    """File contents for a download button, re-read only when mtime changes"""
+    return Path(path).read_bytes()
 
 
 # Header
@@ -160,7 +178,8 @@ with tab1:
 
             # Save uploaded file temporarily
             with tempfile.NamedTemporaryFile(delete=False, suffix=Path(uploaded_file.name).suffix) as tmp_file:
-                tmp_file.write(uploaded_file.read())
+                uploaded_file.seek(0)
+                shutil.copyfileobj(uploaded_file, tmp_file, UPLOAD_CHUNK_SIZE)
                 video_path = tmp_file.name
 
             try:
@@ -172,11 +191,16 @@ with tab1:
                 status_text.text(f"Loading Whisper model: {model_choice}...")
                 progress_bar.progress(10)
 
-                transcriber = AudioTranscriber(model_name=model_choice)
+                transcriber = get_transcriber(model_choice)
                 progress_bar.progress(30)
 
                 # Transcribe
-                status_text.text("Transcribing audio...")
+                engine = transcriber.backend
+                if getattr(transcriber, 'compute_type', None):
+                    engine += f", {transcriber.device}/{transcriber.compute_type}"
+                else:
+                    engine += f", {transcriber.device}"
+                status_text.text(f"Transcribing audio ({engine})...")
                 transcript_result = transcriber.transcribe_video(video_path)
                 progress_bar.progress(70)
 
@@ -285,21 +309,18 @@ with tab2:
         st.subheader("📝 Subtitle Files (.srt)")
         subtitle_dir_path = Path(SUBTITLE_DIR)
         if subtitle_dir_path.exists():
-            srt_files = sorted(subtitle_dir_path.glob("*.srt"), key=lambda x: x.stat().st_mtime, reverse=True)
+            srt_files = list_generated_files(subtitle_dir_path, ".srt")
 
             if srt_files:
-                for srt_file in srt_files:
+                for srt_file, srt_file_stat in srt_files:
                     with st.expander(f"📄 {srt_file.name}"):
-                        st.write(f"**Size:** {srt_file.stat().st_size / 1024:.2f} KB")
-                        st.write(f"**Modified:** {datetime.fromtimestamp(srt_file.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')}")
-
-                        # Download button
-                        with open(srt_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
+                        st.write(f"**Size:** {srt_file_stat.st_size / 1024:.2f} KB")
+                        st.write(f"**Modified:** {datetime.fromtimestamp(srt_file_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')}")
 
+                        # Download button (contents cached until the file changes)
                         st.download_button(
                             label="📥 Download",
-                            data=content,
+                            data=read_generated_file(str(srt_file), srt_file_stat.st_mtime),
                             file_name=srt_file.name,
                             mime="text/plain",
                             key=f"download_srt_{srt_file.name}"
@@ -313,21 +334,18 @@ with tab2:
         st.subheader("📄 Transcript Files (.txt)")
         transcript_dir_path = Path(TRANSCRIPT_DIR)
         if transcript_dir_path.exists():
-            txt_files = sorted(transcript_dir_path.glob("*.txt"), key=lambda x: x.stat().st_mtime, reverse=True)
+            txt_files = list_generated_files(transcript_dir_path, ".txt")
 
             if txt_files:
-                for txt_file in txt_files:
+                for txt_file, txt_file_stat in txt_files:
                     with st.expander(f"📄 {txt_file.name}"):
-                        st.write(f"**Size:** {txt_file.stat().st_size / 1024:.2f} KB")
-                        st.write(f"**Modified:** {datetime.fromtimestamp(txt_file.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')}")
-
-                        # Download button
-                        with open(txt_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
+                        st.write(f"**Size:** {txt_file_stat.st_size / 1024:.2f} KB")
+                        st.write(f"**Modified:** {datetime.fromtimestamp(txt_file_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')}")
 
+                        # Download button (contents cached until the file changes)
                         st.download_button(
                             label="📥 Download",
-                            data=content,
+                            data=read_generated_file(str(txt_file), txt_file_stat.st_mtime),
                             file_name=txt_file.name,
                             mime="text/plain",
                             key=f"download_txt_{txt_file.name}"
@@ -4,8 +4,11 @@ Statistics Page - Shows rubric completion stats and aggregated metrics
 
 import streamlit as st
 import sys
+import heapq
 from pathlib import Path
 
+import numpy as np
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -18,6 +21,36 @@ st.set_page_config(
 )
 
 
+@st.cache_resource
+def get_db():
+    """Database client, shared across reruns and sessions."""
+    return VideoEvaluatorDB()
+
+
+@st.cache_data(ttl=60)
+def _load_rubric_stats():
+    """Rubric completion stats, cached for 60 seconds across reruns."""
+    return get_db().get_rubric_completion_stats()
+
+
+@st.cache_data(ttl=60)
+def _load_video_status():
+    """Per-video status rows, cached for 60 seconds across reruns."""
+    return get_db().get_video_status()
+
+
+@st.cache_data(ttl=60)
+def _load_all_videos():
+    """All videos, cached for 60 seconds across reruns."""
+    return get_db().get_all_videos()
+
+
+@st.cache_data(ttl=60)
+def _load_total_cost():
+    """Total evaluation cost, cached for 60 seconds across reruns."""
+    return get_db().get_total_cost()
+
+
 def main():
     st.title("📊 Evaluation Statistics")
     st.markdown("Overview of evaluation completion across all rubrics")
@@ -25,21 +58,39 @@ def main():
 
     # Initialize database
     try:
-        db = VideoEvaluatorDB()
+        get_db()
     except Exception as e:
         st.error(f"Database connection failed: {e}")
         return
 
+    if st.button("🔄 Refresh"):
+        for loader in (_load_rubric_stats, _load_video_status, _load_all_videos, _load_total_cost):
+            loader.clear()
+
     # Get statistics
     try:
-        rubric_stats = db.get_rubric_completion_stats()
-        video_status = db.get_video_status()
-        all_videos = db.get_all_videos()
-        total_cost = db.get_total_cost()
+        rubric_stats = _load_rubric_stats()
+        video_status = _load_video_status()
+        all_videos = _load_all_videos()
+        total_cost = _load_total_cost()
     except Exception as e:
         st.error(f"Error loading statistics: {e}")
         return
 
+    # Numeric columns pulled out once; every metric below is a numpy reduction
+    rubric_counts = np.array(
+        [(r['total_evaluations'], r['completed_count']) for r in rubric_stats],
+        dtype=np.int64
+    ).reshape(-1, 2)
+    total_evaluations, completed_evaluations = rubric_counts.sum(axis=0).tolist()
+
+    video_metrics = np.array(
+        [(v.get('completion_percentage') or 0, v.get('total_cost') or 0) for v in video_status],
+        dtype=np.float64
+    ).reshape(-1, 2)
+    percents = video_metrics[:, 0]
+    costs = video_metrics[:, 1]
+
     # Overview metrics
     col1, col2, col3, col4 = st.columns(4)
 
@@ -47,11 +98,9 @@ def main():
         st.metric("Total Videos", len(all_videos))
 
     with col2:
-        total_evaluations = sum(r['total_evaluations'] for r in rubric_stats)
         st.metric("Total Evaluations", total_evaluations)
 
     with col3:
-        completed_evaluations = sum(r['completed_count'] for r in rubric_stats)
         st.metric("Completed Evaluations", completed_evaluations)
 
     with col4:
@@ -63,44 +112,33 @@ def main():
     st.markdown("## 📋 Rubric Completion Overview")
 
     if rubric_stats:
-        # Create a table-like view
+        # One table element instead of a block of columns/metrics per rubric
+        rows = []
         for rubric in rubric_stats:
-            with st.container():
-                col1, col2, col3, col4 = st.columns([3, 2, 2, 2])
-
-                with col1:
-                    st.markdown(f"### {rubric['display_name']}")
-                    st.caption(rubric.get('category', 'N/A').title())
-
-                with col2:
-                    completed = rubric['completed_count']
-                    total = rubric['total_evaluations']
-                    if total > 0:
-                        completion_pct = (completed / total) * 100
-                        st.metric("Completion", f"{completion_pct:.0f}%")
-                    else:
-                        st.metric("Completion", "0%")
-
-                with col3:
-                    st.metric("Completed", f"{rubric['completed_count']}")
-                    if rubric.get('failed_count', 0) > 0:
-                        st.caption(f"⚠️ {rubric['failed_count']} failed")
-
-                with col4:
-                    avg_cost = rubric.get('avg_cost', 0) or 0
-                    st.metric("Avg Cost", f"${avg_cost:.3f}")
-                    avg_duration = rubric.get('avg_duration_seconds', 0) or 0
-                    if avg_duration > 0:
-                        st.caption(f"⏱️ {int(avg_duration)}s avg")
-
-                # Progress bar
-                if rubric['total_evaluations'] > 0:
-                    progress = rubric['completed_count'] / rubric['total_evaluations']
-                    st.progress(progress)
-                else:
-                    st.progress(0.0)
-
-                st.markdown("---")
+            completed = rubric['completed_count']
+            total = rubric['total_evaluations']
+            rows.append({
+                'Rubric': rubric['display_name'],
+                'Category': (rubric.get('category') or 'N/A').title(),
+                'Completion': (completed / total) * 100 if total > 0 else 0.0,
+                'Completed': completed,
+                'Total': total,
+                'Failed': rubric.get('failed_count', 0) or 0,
+                'Avg Cost': rubric.get('avg_cost', 0) or 0,
+                'Avg Duration (s)': int(rubric.get('avg_duration_seconds', 0) or 0),
+            })
+
+        st.dataframe(
+            rows,
+            column_config={
+                'Completion': st.column_config.ProgressColumn(
+                    'Completion', format='%.0f%%', min_value=0, max_value=100
+                ),
+                'Avg Cost': st.column_config.NumberColumn('Avg Cost', format='$%.3f'),
+            },
+            use_container_width=True,
+            hide_index=True
+        )
     else:
         st.info("No statistics available yet. Start evaluating videos!")
 
@@ -110,30 +148,14 @@ def main():
     st.markdown("## 📹 Video Completion Distribution")
 
     if video_status:
-        # Group videos by completion percentage
-        completion_buckets = {
-            "0%": 0,
-            "1-25%": 0,
-            "26-50%": 0,
-            "51-75%": 0,
-            "76-99%": 0,
-            "100%": 0
-        }
-
-        for video in video_status:
-            pct = video.get('completion_percentage', 0)
-            if pct == 0:
-                completion_buckets["0%"] += 1
-            elif pct <= 25:
-                completion_buckets["1-25%"] += 1
-            elif pct <= 50:
-                completion_buckets["26-50%"] += 1
-            elif pct <= 75:
-                completion_buckets["51-75%"] += 1
-            elif pct < 100:
-                completion_buckets["76-99%"] += 1
-            else:
-                completion_buckets["100%"] += 1
+        # Group videos by completion percentage: exactly 0, (0, 25], (25, 50],
+        # (50, 75], (75, 100), and 100+
+        bucket_labels = ["0%", "1-25%", "26-50%", "51-75%", "76-99%", "100%"]
+        bucket_index = 1 + np.searchsorted([25, 50, 75], percents, side='left')
+        bucket_index[percents >= 100] = 5
+        bucket_index[percents == 0] = 0
+        counts = np.bincount(bucket_index, minlength=len(bucket_labels))
+        completion_buckets = dict(zip(bucket_labels, counts.tolist()))
 
         # Display distribution
         col1, col2, col3, col4, col5, col6 = st.columns(6)
@@ -149,16 +171,16 @@ def main():
     st.markdown("## 💰 Cost Analysis")
 
     if video_status:
-        videos_with_cost = [v for v in video_status if v.get('total_cost', 0) > 0]
+        with_cost = np.flatnonzero(costs > 0)
 
-        if videos_with_cost:
+        if with_cost.size:
             col1, col2, col3 = st.columns(3)
 
             with col1:
                 st.metric("Total Cost", f"${total_cost:.2f}")
 
             with col2:
-                avg_cost_per_video = total_cost / len(videos_with_cost)
+                avg_cost_per_video = total_cost / with_cost.size
                 st.metric("Avg Cost/Video", f"${avg_cost_per_video:.2f}")
 
             with col3:
@@ -170,7 +192,10 @@ def main():
 
             # Top 5 most expensive videos
             st.markdown("### 💸 Most Expensive Videos")
-            expensive_videos = sorted(videos_with_cost, key=lambda x: x.get('total_cost', 0), reverse=True)[:5]
+            # O(N log 5) selection instead of sorting every costed video
+            cost_list = costs.tolist()
+            top = heapq.nlargest(5, with_cost.tolist(), key=cost_list.__getitem__)
+            expensive_videos = [video_status[i] for i in top]
 
             for video in expensive_videos:
                 col1, col2, col3 = st.columns([5, 2, 2])
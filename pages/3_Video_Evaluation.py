@@ -4,8 +4,13 @@ Select ingested videos and evaluate with different rubrics/models
 """
 
 import streamlit as st
-import json
+import base64
+import html
+import importlib
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -20,15 +25,8 @@ try:
 except ImportError:
     pass
 
-from pipeline.evaluators.claude_evaluator import ClaudeEvaluator
-from pipeline.evaluators.ollama_evaluator import OllamaEvaluator
-from pipeline.evaluators.gemini_evaluator import GeminiEvaluator
-from src.rubric_content_safety import get_content_safety_rubric
-from src.rubric_ai_quality import get_ai_quality_rubric
-from src.rubric_production_metrics import get_production_metrics_rubric
-from src.rubric_media_ethics import get_media_ethics_rubric
-from src.rubric_academic import get_academic_rubric
-from src.rubric_fourPillars import get_brainrot_rubric
+# Evaluator classes (anthropic / google-generativeai / ollama clients) are
+# imported in the Run Evaluation branch that uses them
 from src.database import VideoEvaluatorDB, Evaluation, EvaluationStatus
 
 logging.basicConfig(
@@ -38,9 +36,227 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Rubric name -> (module, prompt builder); the module is imported only when
+# that rubric is used
+RUBRIC_LOADERS = {
+    "academic": ("src.rubric_academic", "get_academic_rubric"),
+    "four_pillars": ("src.rubric_fourPillars", "get_brainrot_rubric"),
+    "content_safety": ("src.rubric_content_safety", "get_content_safety_rubric"),
+    "ai_quality": ("src.rubric_ai_quality", "get_ai_quality_rubric"),
+    "production_metrics": ("src.rubric_production_metrics", "get_production_metrics_rubric"),
+    "media_ethics": ("src.rubric_media_ethics", "get_media_ethics_rubric"),
+}
+
+# Sidebar rubric choices, in display order
+RUBRIC_LABELS = {
+    "four_pillars": "🧠 Four Pillars (Brainrot Detector)",
+    "academic": "🎓 Academic (4-Pillar Pedagogical Quality)",
+    "content_safety": "Content Safety (Kijkwijzer)",
+    "ai_quality": "AI Quality & Fidelity",
+    "production_metrics": "Production Metrics (Technical)",
+    "media_ethics": "Media Ethics (Manipulation & Commercial)",
+}
+
+# Frame selection -> sidebar label / configuration summary text
+FRAME_SELECTION_LABELS = {
+    "all": "All frames (recommended)",
+    "50%": "50% of frames (evenly sampled)",
+    "25%": "25% of frames (evenly sampled)",
+    "10%": "10% of frames (evenly sampled)",
+    "max_50": "Maximum 50 frames",
+    "max_100": "Maximum 100 frames",
+    "max_200": "Maximum 200 frames",
+    "max_500": "Maximum 500 frames",
+}
+FRAME_DESCRIPTIONS = {
+    "all": "All frames",
+    "50%": "50% of frames",
+    "25%": "25% of frames",
+    "10%": "10% of frames",
+    "max_50": "Max 50 frames",
+    "max_100": "Max 100 frames",
+    "max_200": "Max 200 frames",
+    "max_500": "Max 500 frames",
+}
+
+# Percentage frame selections -> percent of the video's frames to sample
+FRAME_PERCENTAGES = {"50%": 50, "25%": 25, "10%": 10}
+
+# Evaluator name shown in the API evaluators' configuration summary
+API_EVALUATOR_NAMES = {
+    "claude": "Claude API",
+    "gemini": "Gemini Flash API",
+}
+
+# Largest output-token cap each model accepts; models not listed allow 16384
+MODEL_MAX_OUTPUT_TOKENS = {
+    "claude-3-5-sonnet-20241022": 8192,
+    "claude-3-haiku-20240307": 4096,
+}
+DEFAULT_MAX_OUTPUT_TOKENS = 16384
+
+# API evaluations in flight at once (rate limits); Ollama runs one at a time
+# since every request shares the same local model
+MAX_PARALLEL_EVALUATIONS = 5
+
+
+@st.cache_data
+def load_rubric(name: str) -> str:
+    """Build a rubric prompt once per process; raises KeyError for unknown rubrics"""
+    module_name, function_name = RUBRIC_LOADERS[name]
+    return getattr(importlib.import_module(module_name), function_name)()
+
+
+@st.cache_data(ttl=60)
+def scan_videos(data_dir_str: str) -> dict:
+    """
+    Build the video selectbox options from the ingested-video directories
+
+    The per-video JSON reads run in parallel. Cached for 60 seconds (or
+    until Refresh) so widget reruns don't re-read every video's metadata.
+
+    Returns:
+        Dict of display name -> {'video_id', 'path', 'metadata', 'title'}
+    """
+    with os.scandir(data_dir_str) as entries:
+        video_dirs = sorted(entry.path for entry in entries if entry.is_dir())
+
+    from pipeline.evaluators.base import load_video_option
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        options = executor.map(load_video_option, video_dirs)
+        return dict(option for option in options if option is not None)
+
+
+def resolve_max_frames(frame_selection: str, total_frames: int) -> tuple:
+    """
+    Turn a "Frames to Analyze" choice into evaluator sampling settings
+
+    Returns:
+        Tuple of (sampling_strategy, max_frames)
+    """
+    if frame_selection == "all":
+        return "all", 9999  # Effectively unlimited
+
+    percent = FRAME_PERCENTAGES.get(frame_selection)
+    if percent is not None:
+        return "even", max(1, total_frames * percent // 100)
+
+    return "even", int(frame_selection[len("max_"):])
+
+
+@st.cache_data(max_entries=64)
+def load_thumbnail_b64(thumbnail_path_str: str, mtime_ns: int) -> str:
+    """Base64 of a thumbnail JPEG, read once per file version (mtime_ns is only the cache key)"""
+    return base64.b64encode(Path(thumbnail_path_str).read_bytes()).decode('ascii')
+
+
+@st.cache_data(ttl=30)
+def load_existing_evaluations(evaluations_dir_str: str, dir_mtime_ns: int) -> list:
+    """
+    Saved evaluations for one video from its evaluations index
+
+    dir_mtime_ns is only part of the cache key: saving a new evaluation
+    changes the directory mtime, which invalidates the cached listing.
+    """
+    from pipeline.evaluators.base import load_evaluation_index
+    return load_evaluation_index(Path(evaluations_dir_str))
+
+
+def create_evaluator(evaluator_type: str, rubric_name: str, rubric_prompt: str, **options):
+    """
+    Build the evaluator for one rubric
+
+    The evaluator class (and its API client) is imported only for the
+    selected provider. options are passed through to the constructor.
+    """
+    if evaluator_type == "claude":
+        from pipeline.evaluators.claude_evaluator import ClaudeEvaluator
+        evaluator_class = ClaudeEvaluator
+    elif evaluator_type == "gemini":
+        from pipeline.evaluators.gemini_evaluator import GeminiEvaluator
+        evaluator_class = GeminiEvaluator
+    else:  # ollama
+        from pipeline.evaluators.ollama_evaluator import OllamaEvaluator
+        evaluator_class = OllamaEvaluator
+
+    return evaluator_class(rubric_name=rubric_name, rubric_prompt=rubric_prompt, **options)
+
+
+def sync_evaluation(video_id: str, rubric_name: str, evaluator_type: str, result: dict, default_model: str):
+    """Upsert a finished evaluation result into the database"""
+    # Extract summary from evaluation result
+    eval_markdown = result.get('evaluation_markdown', '')
+    summary = ' '.join(eval_markdown.split('\n')[:3])[:200] if eval_markdown else None
+
+    evaluation = Evaluation(
+        video_id=video_id,
+        rubric_name=rubric_name,
+        status=EvaluationStatus.COMPLETED,
+        evaluator=evaluator_type,
+        model_name=result.get('model', default_model),
+        cost=result.get('cost_info', {}).get('total_cost'),
+        started_at=datetime.now(),
+        completed_at=datetime.now(),
+        duration_seconds=result.get('performance_metrics', {}).get('processing_time_seconds'),
+        result=result,
+        summary=summary
+    )
+
+    db.upsert_evaluation(evaluation)
+    logger.info(f"✓ Synced evaluation to database: {video_id}/{rubric_name}")
+
+
+@st.cache_resource
+def get_db():
+    """Database client, shared across reruns and sessions"""
+    return VideoEvaluatorDB()
+
+
+@st.cache_resource
+def get_evaluation_executor(evaluator_type: str):
+    """Worker threads for evaluations of one provider, shared across reruns and sessions"""
+    return ThreadPoolExecutor(max_workers=1 if evaluator_type == "ollama" else MAX_PARALLEL_EVALUATIONS)
+
+
+def run_evaluation_job(evaluator, video_id: str, video_data: dict, output_dir: Path,
+                       evaluator_type: str, default_model: str) -> dict:
+    """
+    Evaluate, save and sync one rubric on an executor thread
+
+    Makes no st.* calls, so the result is saved even if the user navigates
+    away before it finishes.
+
+    Returns:
+        Dict with 'result', 'saved_path' and 'sync_error' (None if synced
+        or the database is unavailable)
+    """
+    result = evaluator.evaluate(
+        video_id=video_id,
+        frames=video_data['frames'],
+        transcript=video_data['transcript'],
+        metadata=video_data['metadata']
+    )
+
+    saved_path = evaluator.save_evaluation(
+        video_id=video_id,
+        evaluation_result=result,
+        output_dir=output_dir
+    )
+
+    sync_error = None
+    if DB_AVAILABLE:
+        try:
+            sync_evaluation(video_id, evaluator.rubric_name, evaluator_type, result, default_model)
+        except Exception as e:
+            logger.error(f"Database sync failed: {e}")
+            sync_error = str(e)
+
+    return {'result': result, 'saved_path': saved_path, 'sync_error': sync_error}
+
+
 # Initialize database
 try:
-    db = VideoEvaluatorDB()
+    db = get_db()
     DB_AVAILABLE = True
 except Exception as e:
     logger.warning(f"Database not available: {e}")
@@ -63,22 +279,24 @@ if DB_AVAILABLE:
 else:
     st.warning("⚠️ Database not available - evaluations will be saved locally only")
 
+
 # Sidebar - Settings
-with st.sidebar:
+@st.fragment
+def render_settings() -> dict:
+    """
+    Sidebar evaluation settings and configuration summary
+
+    A fragment, so changing a setting reruns only the sidebar instead of the
+    whole page. The returned settings are read by full-page reruns, which
+    the Run buttons always trigger.
+    """
     st.header("⚙️ Evaluation Settings")
 
     # Rubric selection
     rubric_choice = st.selectbox(
         "Rubric",
-        ["four_pillars", "academic", "content_safety", "ai_quality", "production_metrics", "media_ethics"],
-        format_func=lambda x: {
-            "academic": "🎓 Academic (4-Pillar Pedagogical Quality)",
-            "four_pillars": "🧠 Four Pillars (Brainrot Detector)",
-            "content_safety": "Content Safety (Kijkwijzer)",
-            "ai_quality": "AI Quality & Fidelity",
-            "production_metrics": "Production Metrics (Technical)",
-            "media_ethics": "Media Ethics (Manipulation & Commercial)"
-        }[x]
+        list(RUBRIC_LABELS),
+        format_func=RUBRIC_LABELS.__getitem__
     )
 
     st.markdown("---")
@@ -158,42 +376,11 @@ with st.sidebar:
     # Frame selection with clearer options
     frame_selection = st.selectbox(
         "Frames to Analyze",
-        [
-            "all",
-            "50%",
-            "25%",
-            "10%",
-            "max_50",
-            "max_100",
-            "max_200",
-            "max_500"
-        ],
-        format_func=lambda x: {
-            "all": "All frames (recommended)",
-            "50%": "50% of frames (evenly sampled)",
-            "25%": "25% of frames (evenly sampled)",
-            "10%": "10% of frames (evenly sampled)",
-            "max_50": "Maximum 50 frames",
-            "max_100": "Maximum 100 frames",
-            "max_200": "Maximum 200 frames",
-            "max_500": "Maximum 500 frames"
-        }[x],
+        list(FRAME_SELECTION_LABELS),
+        format_func=FRAME_SELECTION_LABELS.__getitem__,
         help="How many frames to send for analysis. 'All frames' is recommended for thorough evaluation."
     )
 
-    # Convert selection to sampling_strategy and max_frames
-    if frame_selection == "all":
-        sampling_strategy = "all"
-        max_frames = 9999  # Effectively unlimited
-    elif frame_selection.endswith("%"):
-        sampling_strategy = "even"
-        # Will be calculated based on video frame count when video is selected
-        percentage = int(frame_selection.replace("%", ""))
-        max_frames = percentage  # Store percentage temporarily, will recalculate
-    else:
-        sampling_strategy = "even"
-        max_frames = int(frame_selection.replace("max_", ""))
-
     # Timeout
     timeout = st.slider(
         "Timeout (seconds)",
@@ -201,9 +388,97 @@ with st.sidebar:
         max_value=1800,
         value=900 if evaluator_type == "ollama" else 600,
         step=60,
-        help="Maximum time to wait for evaluation"
+        help="Maximum time to wait for evaluation" if evaluator_type == "ollama"
+        else "Maximum time to wait for each API request before retrying"
     )
 
+    if evaluator_type != "ollama":
+        max_output_tokens = None
+        if st.checkbox("Limit output tokens", help="Leave off to use the model's default output limit"):
+            model_limit = MODEL_MAX_OUTPUT_TOKENS.get(model_choice, DEFAULT_MAX_OUTPUT_TOKENS)
+            max_output_tokens = st.number_input(
+                "Max output tokens",
+                min_value=512,
+                max_value=model_limit,
+                value=model_limit,
+                step=512,
+                help="Upper bound on the length of the generated evaluation"
+            )
+        max_retries = st.slider(
+            "Max retries",
+            min_value=0,
+            max_value=5,
+            value=3,
+            help="Retries after a transient failure (rate limit, outage, timeout or empty reply), with exponential backoff"
+        )
+
+    # Configuration summary
+    frame_desc = FRAME_DESCRIPTIONS.get(frame_selection, frame_selection)
+
+    if evaluator_type != "ollama":
+        config_summary = f"""
+        **Configuration:**
+        - Evaluator: {API_EVALUATOR_NAMES[evaluator_type]}
+        - Rubric: {rubric_choice}
+        - Model: {model_choice}
+        - Frames: {frame_desc}
+        - Timeout: {timeout}s per request, {max_retries} retries
+        - Max output tokens: {max_output_tokens or "model default"}
+        """
+    else:
+        config_summary = f"""
+        **Configuration:**
+        - Evaluator: Ollama (Local)
+        - Rubric: {rubric_choice}
+        - Vision Model: {vision_model}
+        - Synthesis Model: {synthesis_model}
+        - Batch Size: {batch_size} frames/batch
+        - Frames: {frame_desc}
+        - Timeout: {timeout}s
+        """
+
+    st.info(config_summary)
+
+    # Constructor arguments shared by every rubric's evaluator (frame
+    # sampling is added once the video's frame count is known)
+    if evaluator_type == "ollama":
+        evaluator_options = {
+            'vision_model': vision_model,
+            'synthesis_model': synthesis_model,
+            'batch_size': batch_size
+        }
+        default_model = vision_model
+        eval_label = f"Ollama ({vision_model})"
+    else:
+        evaluator_options = {
+            'model_name': model_choice,
+            'timeout': timeout,
+            'max_retries': max_retries
+        }
+        if max_output_tokens:
+            evaluator_options['max_output_tokens'] = max_output_tokens
+        default_model = model_choice
+        eval_label = "Claude" if evaluator_type == "claude" else f"Gemini ({model_choice})"
+
+    return {
+        'rubric_choice': rubric_choice,
+        'evaluator_type': evaluator_type,
+        'frame_selection': frame_selection,
+        'evaluator_options': evaluator_options,
+        'default_model': default_model,
+        'eval_label': eval_label
+    }
+
+
+with st.sidebar:
+    settings = render_settings()
+
+rubric_choice = settings['rubric_choice']
+evaluator_type = settings['evaluator_type']
+frame_selection = settings['frame_selection']
+default_model = settings['default_model']
+eval_label = settings['eval_label']
+
 
 # Main content
 # Step 1: Select video
@@ -232,10 +507,13 @@ if not data_dir.exists():
     """)
     st.stop()
 
-# Get all video directories
-video_dirs = [d for d in data_dir.iterdir() if d.is_dir()]
+if st.button("🔄 Refresh video list"):
+    scan_videos.clear()
 
-if not video_dirs:
+# Ingested videos with metadata (cached)
+video_options = scan_videos(str(data_dir))
+
+if not video_options:
     st.warning("No ingested videos found!")
     st.info("""
     **To evaluate a video, you need to ingest it first:**
@@ -255,35 +533,6 @@ if not video_dirs:
     """)
     st.stop()
 
-# Load video metadata for display
-video_options = {}
-for vdir in sorted(video_dirs):
-    metadata_path = vdir / "metadata.json"
-    if metadata_path.exists():
-        with open(metadata_path, 'r') as f:
-            metadata = json.load(f)
-
-        video_id = vdir.name
-        duration = metadata.get('duration_seconds', 0)
-        frame_count = metadata.get('frame_count', 0)
-        source_type = metadata.get('source_type', 'unknown')
-
-        # Get YouTube title if available
-        title = video_id
-        youtube_metadata_path = vdir / "youtube_metadata.json"
-        if youtube_metadata_path.exists():
-            with open(youtube_metadata_path, 'r') as f:
-                yt_meta = json.load(f)
-                title = yt_meta.get('title', video_id)
-
-        display_name = f"{title} ({duration:.0f}s, {frame_count} frames)"
-        video_options[display_name] = {
-            'video_id': video_id,
-            'path': vdir,
-            'metadata': metadata,
-            'title': title
-        }
-
 selected_video_display = st.selectbox(
     "Select ingested video",
     options=list(video_options.keys())
@@ -304,253 +553,83 @@ if selected_video_display:
     with col3:
         st.metric("Frames", metadata.get('frame_count', 0))
 
-    # Show thumbnail if available
+    # Show thumbnail if available - embedded as-is and sized by CSS, so the
+    # JPEG is never decoded or re-encoded server-side
     thumbnail_path = video_dir / "thumbnail.jpg"
     if thumbnail_path.exists():
-        st.image(str(thumbnail_path), caption=selected_video['title'], width=400)
+        thumbnail_b64 = load_thumbnail_b64(str(thumbnail_path), thumbnail_path.stat().st_mtime_ns)
+        st.markdown(
+            f'<figure style="margin: 0 0 1rem 0;">'
+            f'<img src="data:image/jpeg;base64,{thumbnail_b64}" style="width: 400px; max-width: 100%;">'
+            f'<figcaption style="font-size: 0.875rem; color: #6c757d;">{html.escape(selected_video["title"])}</figcaption>'
+            f'</figure>',
+            unsafe_allow_html=True
+        )
 
     # Show existing evaluations if any
     evaluations_dir = video_dir / "evaluations"
     if evaluations_dir.exists():
-        existing_evals = list(evaluations_dir.glob("*.json"))
+        existing_evals = load_existing_evaluations(
+            str(evaluations_dir), os.stat(evaluations_dir).st_mtime_ns
+        )
         if existing_evals:
             with st.expander(f"📊 Existing Evaluations ({len(existing_evals)})"):
-                for eval_path in sorted(existing_evals, reverse=True):
-                    with open(eval_path, 'r') as f:
-                        eval_data = json.load(f)
-
-                    rubric = eval_data.get('rubric', 'unknown')
-                    timestamp = eval_data.get('timestamp', 'unknown')
-                    st.write(f"- **{rubric}** - {timestamp} - [{eval_path.name}]({eval_path})")
+                for entry in existing_evals:
+                    eval_path = evaluations_dir / entry['filename']
+                    st.write(f"- **{entry['rubric']}** - {entry['timestamp']} - [{eval_path.name}]({eval_path})")
 
     st.markdown("---")
 
     # Step 2: Run Evaluation
     st.header("2️⃣ Run Evaluation")
 
-    # Show configuration summary
-    frame_desc = {
-        "all": "All frames",
-        "50%": "50% of frames",
-        "25%": "25% of frames",
-        "10%": "10% of frames",
-        "max_50": "Max 50 frames",
-        "max_100": "Max 100 frames",
-        "max_200": "Max 200 frames",
-        "max_500": "Max 500 frames"
-    }.get(frame_selection, frame_selection)
-
-    if evaluator_type == "claude":
-        config_summary = f"""
-        **Configuration:**
-        - Evaluator: Claude API
-        - Rubric: {rubric_choice}
-        - Model: {model_choice}
-        - Frames: {frame_desc}
-        - Timeout: {timeout}s
-        """
-    elif evaluator_type == "gemini":
-        config_summary = f"""
-        **Configuration:**
-        - Evaluator: Gemini Flash API
-        - Rubric: {rubric_choice}
-        - Model: {model_choice}
-        - Frames: {frame_desc}
-        - Timeout: {timeout}s
-        """
-    else:  # ollama
-        config_summary = f"""
-        **Configuration:**
-        - Evaluator: Ollama (Local)
-        - Rubric: {rubric_choice}
-        - Vision Model: {vision_model}
-        - Synthesis Model: {synthesis_model}
-        - Batch Size: {batch_size} frames/batch
-        - Frames: {frame_desc}
-        - Timeout: {timeout}s
-        """
-
-    st.info(config_summary)
+    # Percentage selections depend on this video's frame count
+    total_frames = metadata.get('frame_count', 100)
+    sampling_strategy, max_frames = resolve_max_frames(frame_selection, total_frames)
+    evaluator_options = {
+        **settings['evaluator_options'],
+        'sampling_strategy': sampling_strategy,
+        'max_frames': max_frames
+    }
 
     if st.button("▶️ Run Evaluation", type="primary", use_container_width=True):
 
-        with st.spinner("Running evaluation..."):
-            progress_bar = st.progress(0)
+        with st.spinner("Preparing evaluation..."):
             status = st.empty()
 
             try:
                 # Load rubric
                 status.text("Loading rubric...")
-                progress_bar.progress(10)
-
-                if rubric_choice == "academic":
-                    rubric_prompt = get_academic_rubric()
-                elif rubric_choice == "four_pillars":
-                    rubric_prompt = get_brainrot_rubric()
-                elif rubric_choice == "content_safety":
-                    rubric_prompt = get_content_safety_rubric()
-                elif rubric_choice == "ai_quality":
-                    rubric_prompt = get_ai_quality_rubric()
-                elif rubric_choice == "production_metrics":
-                    rubric_prompt = get_production_metrics_rubric()
-                elif rubric_choice == "media_ethics":
-                    rubric_prompt = get_media_ethics_rubric()
-                else:
+
+                if rubric_choice not in RUBRIC_LOADERS:
                     st.error(f"Unknown rubric: {rubric_choice}")
                     st.stop()
-
-                # Calculate actual max_frames for percentage selections
-                total_frames = metadata.get('frame_count', 100)
-                if frame_selection.endswith("%"):
-                    percentage = int(frame_selection.replace("%", ""))
-                    max_frames = max(1, int(total_frames * percentage / 100))
-                    status.text(f"Using {percentage}% of frames ({max_frames} of {total_frames})...")
+                rubric_prompt = load_rubric(rubric_choice)
 
                 # Initialize evaluator
                 status.text("Initializing evaluator...")
-                progress_bar.progress(20)
-
-                if evaluator_type == "claude":
-                    evaluator = ClaudeEvaluator(
-                        rubric_name=rubric_choice,
-                        rubric_prompt=rubric_prompt,
-                        model_name=model_choice,
-                        sampling_strategy=sampling_strategy,
-                        max_frames=max_frames,
-                        timeout=timeout
-                    )
-                elif evaluator_type == "gemini":
-                    evaluator = GeminiEvaluator(
-                        rubric_name=rubric_choice,
-                        rubric_prompt=rubric_prompt,
-                        model_name=model_choice,
-                        sampling_strategy=sampling_strategy,
-                        max_frames=max_frames,
-                        timeout=timeout
-                    )
-                else:  # ollama
-                    evaluator = OllamaEvaluator(
-                        rubric_name=rubric_choice,
-                        rubric_prompt=rubric_prompt,
-                        vision_model=vision_model,
-                        synthesis_model=synthesis_model,
-                        batch_size=batch_size,
-                        sampling_strategy=sampling_strategy,
-                        max_frames=max_frames
-                    )
-
-                # Load video data
-                status.text("Loading video data...")
-                progress_bar.progress(30)
-
-                video_data = evaluator.load_video_data(video_id)
-
-                frames = video_data['frames']
-                transcript = video_data['transcript']
-                metadata = video_data['metadata']
-
-                # Run evaluation
-                if evaluator_type == "claude":
-                    eval_label = "Claude"
-                elif evaluator_type == "gemini":
-                    eval_label = f"Gemini ({model_choice})"
-                else:
-                    eval_label = f"Ollama ({vision_model})"
-
-                status.text(f"Evaluating with {eval_label} ({len(frames)} frames)...")
-                progress_bar.progress(40)
-
-                result = evaluator.evaluate(
-                    video_id=video_id,
-                    frames=frames,
-                    transcript=transcript,
-                    metadata=metadata
-                )
+                evaluator = create_evaluator(evaluator_type, rubric_choice, rubric_prompt, **evaluator_options)
 
-                # Save evaluation
-                status.text("Saving evaluation...")
-                progress_bar.progress(80)
-
-                output_dir = video_dir / "evaluations"
-                saved_path = evaluator.save_evaluation(
-                    video_id=video_id,
-                    evaluation_result=result,
-                    output_dir=output_dir
-                )
-
-                # Sync to database
-                if DB_AVAILABLE:
-                    status.text("Syncing to database...")
-                    progress_bar.progress(90)
-
-                    try:
-                        # Extract summary from evaluation result
-                        eval_markdown = result.get('evaluation_markdown', '')
-                        summary = ' '.join(eval_markdown.split('\n')[:3])[:200] if eval_markdown else None
-
-                        # Create Evaluation object
-                        evaluation = Evaluation(
-                            video_id=video_id,
-                            rubric_name=rubric_choice,
-                            status=EvaluationStatus.COMPLETED,
-                            evaluator=evaluator_type,
-                            model_name=result.get('model', model_choice if evaluator_type != "ollama" else vision_model),
-                            cost=result.get('cost_info', {}).get('total_cost'),
-                            started_at=datetime.now(),
-                            completed_at=datetime.now(),
-                            duration_seconds=result.get('performance_metrics', {}).get('processing_time_seconds'),
-                            result=result,
-                            summary=summary
-                        )
-
-                        # Upsert to database
-                        db.upsert_evaluation(evaluation)
-                        logger.info(f"✓ Synced evaluation to database: {video_id}/{rubric_choice}")
-
-                    except Exception as e:
-                        logger.error(f"Database sync failed: {e}")
-                        st.warning(f"⚠️ Database sync failed: {e}. Evaluation saved locally.")
-
-                progress_bar.progress(100)
-                status.text("✓ Complete!")
-
-                st.success(f"✓ Evaluation saved to: `{saved_path}`")
-                if DB_AVAILABLE:
-                    st.success("✓ Synced to database")
-
-                # Display results
-                st.markdown("---")
-                st.header("3️⃣ Evaluation Results")
-
-                # Metrics
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric(
-                        "Processing Time",
-                        f"{result['performance_metrics']['processing_time_seconds']:.1f}s"
-                    )
-                with col2:
-                    st.metric(
-                        "Frames Analyzed",
-                        f"{result['metadata']['frames_analyzed']}/{result['metadata']['total_frames_available']}"
-                    )
-                with col3:
-                    st.metric(
-                        "Words Analyzed",
-                        result['metadata']['transcript_word_count']
-                    )
-
-                # Show evaluation text
-                st.markdown("### Evaluation Report")
-                st.markdown(result['evaluation_markdown'])
-
-                # Download button
-                st.download_button(
-                    label="📥 Download Evaluation (JSON)",
-                    data=json.dumps(result, indent=2),
-                    file_name=f"{video_id}_{rubric_choice}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                    mime="application/json"
+                # Load video data (metadata was already parsed by scan_videos)
+                status.text("Loading video data...")
+                video_data = evaluator.load_video_data(video_id, metadata=metadata)
+
+                # The evaluation itself runs on a worker thread; this script
+                # only polls it, so the page stays responsive
+                future = get_evaluation_executor(evaluator_type).submit(
+                    run_evaluation_job,
+                    evaluator, video_id, video_data, video_dir / "evaluations",
+                    evaluator_type, default_model
                 )
+                st.session_state['evaluation_job'] = {
+                    'future': future,
+                    'video_id': video_id,
+                    'rubric': rubric_choice,
+                    'label': eval_label,
+                    'frames': len(video_data['frames']),
+                    'started': time.time()
+                }
+                status.empty()
 
             except Exception as e:
                 st.error(f"Evaluation failed: {str(e)}")
@@ -559,6 +638,156 @@ if selected_video_display:
                 with st.expander("Error Details"):
                     st.code(traceback.format_exc())
 
+    # Current (or last) single-rubric evaluation for this video
+    job = st.session_state.get('evaluation_job')
+    if job and job['video_id'] != video_id and not job['future'].done():
+        st.info(f"⏳ An evaluation of {job['video_id']} ({job['rubric']}) is still running")
+
+    elif job and not job['future'].done():
+        if st.button("⏹️ Cancel evaluation"):
+            del st.session_state['evaluation_job']
+            if job['future'].cancel():
+                st.warning("Evaluation cancelled")
+            else:
+                st.warning("Stopped waiting. The request was already running; "
+                           "it will still be saved when it finishes.")
+        else:
+            with st.spinner(f"Evaluating {job['rubric']} with {job['label']} ({job['frames']} frames)..."):
+                status = st.empty()
+                while not job['future'].done():
+                    status.text(f"Elapsed: {time.time() - job['started']:.0f}s")
+                    time.sleep(0.5)
+            st.rerun()
+
+    elif job:
+        try:
+            outcome = job['future'].result()
+        except Exception as e:
+            st.error(f"Evaluation failed: {str(e)}")
+            logger.error(f"Evaluation error: {e}", exc_info=e)
+            import traceback
+            with st.expander("Error Details"):
+                st.code(''.join(traceback.format_exception(type(e), e, e.__traceback__)))
+        else:
+            result = outcome['result']
+            saved_path = outcome['saved_path']
+
+            st.success(f"✓ Evaluation saved to: `{saved_path}`")
+            if outcome['sync_error']:
+                st.warning(f"⚠️ Database sync failed: {outcome['sync_error']}. Evaluation saved locally.")
+            elif DB_AVAILABLE:
+                st.success("✓ Synced to database")
+
+            # Display results
+            st.markdown("---")
+            st.header("3️⃣ Evaluation Results")
+
+            # Metrics
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric(
+                    "Processing Time",
+                    f"{result['performance_metrics']['processing_time_seconds']:.1f}s"
+                )
+            with col2:
+                st.metric(
+                    "Frames Analyzed",
+                    f"{result['metadata']['frames_analyzed']}/{result['metadata']['total_frames_available']}"
+                )
+            with col3:
+                st.metric(
+                    "Words Analyzed",
+                    result['metadata']['transcript_word_count']
+                )
+
+            # Show evaluation text
+            st.markdown("### Evaluation Report")
+            st.markdown(result['evaluation_markdown'])
+
+            # Download button - serve the file save_evaluation already wrote
+            st.download_button(
+                label="📥 Download Evaluation (JSON)",
+                data=Path(saved_path).read_bytes(),
+                file_name=f"{video_id}_{job['rubric']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                mime="application/json"
+            )
+
+    if st.button("⏩ Run ALL rubrics", use_container_width=True,
+                 help="Evaluate every rubric with these settings "
+                      f"({MAX_PARALLEL_EVALUATIONS} at a time; one at a time for Ollama)"):
+        try:
+            # Evaluators are built here; worker threads only make the API calls
+            evaluators = [
+                create_evaluator(evaluator_type, rubric_name, load_rubric(rubric_name), **evaluator_options)
+                for rubric_name in RUBRIC_LOADERS
+            ]
+            video_data = evaluators[0].load_video_data(video_id, metadata=metadata)
+
+            executor = get_evaluation_executor(evaluator_type)
+            st.session_state['evaluation_batch'] = {
+                'futures': {
+                    executor.submit(
+                        run_evaluation_job,
+                        evaluator, video_id, video_data, video_dir / "evaluations",
+                        evaluator_type, default_model
+                    ): evaluator.rubric_name
+                    for evaluator in evaluators
+                },
+                'video_id': video_id,
+                'label': eval_label,
+                'frames': len(video_data['frames']),
+                'started': time.time()
+            }
+        except Exception as e:
+            st.error(f"Evaluation failed: {str(e)}")
+            logger.exception("Evaluation error:")
+
+    # Current (or last) all-rubrics run for this video
+    batch = st.session_state.get('evaluation_batch')
+    batch_done = batch and all(future.done() for future in batch['futures'])
+    if batch and batch['video_id'] != video_id and not batch_done:
+        st.info(f"⏳ An all-rubrics evaluation of {batch['video_id']} is still running")
+
+    elif batch and not batch_done:
+        if st.button("⏹️ Cancel remaining rubrics"):
+            del st.session_state['evaluation_batch']
+            cancelled = sum(future.cancel() for future in batch['futures'])
+            st.warning(f"Cancelled {cancelled} pending rubric(s). Rubrics already running "
+                       "will still be saved when they finish.")
+        else:
+            total = len(batch['futures'])
+            with st.spinner(f"Running {total} evaluations with {batch['label']} ({batch['frames']} frames)..."):
+                progress_bar = st.progress(0)
+                status = st.empty()
+                while True:
+                    completed = sum(future.done() for future in batch['futures'])
+                    progress_bar.progress(int(completed * 100 / total))
+                    status.text(f"{completed}/{total} rubrics evaluated - "
+                                f"elapsed: {time.time() - batch['started']:.0f}s")
+                    if completed == total:
+                        break
+                    time.sleep(0.5)
+            st.rerun()
+
+    elif batch:
+        failed = 0
+        for future, rubric_name in batch['futures'].items():
+            try:
+                outcome = future.result()
+            except Exception as e:
+                logger.error(f"Evaluation error ({rubric_name}): {e}", exc_info=e)
+                failed += 1
+                st.error(f"{rubric_name} failed: {str(e)}")
+                continue
+
+            st.success(f"✓ {rubric_name} saved to: `{outcome['saved_path']}`")
+            if outcome['sync_error']:
+                st.warning(f"⚠️ Database sync failed for {rubric_name}: {outcome['sync_error']}. "
+                           "Evaluation saved locally.")
+
+        total = len(batch['futures'])
+        st.info(f"✓ Complete! {total - failed}/{total} rubrics evaluated")
+
 else:
     st.info("👆 Select a video to begin")
 
@@ -3,6 +3,7 @@ Video Detail Page - Shows detailed evaluation status for a specific video
 """
 
 import streamlit as st
+import html
 import sys
 from pathlib import Path
 import json
@@ -55,6 +56,19 @@ st.markdown("""
         font-size: 0.9rem;
         color: #6c757d;
     }
+    .rubric-details {
+        display: grid;
+        grid-template-columns: 3fr 2fr 1fr;
+        gap: 0.25rem 1rem;
+        margin-top: 1rem;
+    }
+    .rubric-error {
+        margin-top: 1rem;
+        padding: 0.75rem 1rem;
+        border-radius: 0.5rem;
+        background-color: #f8d7da;
+        color: #842029;
+    }
     .video-header {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         color: white;
@@ -86,6 +100,70 @@ def get_status_emoji(status):
     return emoji_map.get(status, '❓')
 
 
+def build_rubric_card_html(rubric, evaluation=None):
+    """
+    HTML for one rubric card: title, description and, when the rubric has
+    an evaluation, its status/evaluator/timing/cost details.
+    """
+    description = html.escape(rubric.get('description') or 'No description')
+
+    if not evaluation:
+        return (
+            '<div class="rubric-card rubric-pending">'
+            f'<div class="rubric-title">⭕ {html.escape(rubric["display_name"])}</div>'
+            f'<div class="rubric-meta">{description}</div>'
+            '<div class="rubric-details"><div><strong>Status:</strong> Not evaluated yet</div></div>'
+            '</div>'
+        )
+
+    status = evaluation['status']
+    status_class = f"rubric-{status.replace('_', '-')}"
+
+    who, when, cost = [], [], []
+    who.append(f"<div><strong>Status:</strong> {html.escape(status.replace('_', ' ').title())}</div>")
+    if evaluation.get('evaluator'):
+        who.append(f"<div><strong>Evaluator:</strong> {html.escape(evaluation['evaluator'])}</div>")
+    if evaluation.get('model_name'):
+        who.append(f"<div><strong>Model:</strong> {html.escape(evaluation['model_name'])}</div>")
+    if evaluation.get('completed_at'):
+        when.append(f"<div><strong>Completed:</strong> {html.escape(evaluation['completed_at'][:19])}</div>")
+    if evaluation.get('duration_seconds'):
+        when.append(f"<div><strong>Duration:</strong> {format_duration(evaluation['duration_seconds'])}</div>")
+    if evaluation.get('cost'):
+        cost.append(f"<div><strong>Cost:</strong> ${evaluation['cost']:.4f}</div>")
+
+    parts = [
+        f'<div class="rubric-card {status_class}">',
+        f'<div class="rubric-title">{get_status_emoji(status)} {html.escape(rubric["display_name"])}</div>',
+        f'<div class="rubric-meta">{description}</div>',
+        '<div class="rubric-details">',
+        f'<div>{"".join(who)}</div><div>{"".join(when)}</div><div>{"".join(cost)}</div>',
+        '</div>',
+    ]
+    if status == 'failed' and evaluation.get('error_message'):
+        parts.append(f'<div class="rubric-error">Error: {html.escape(evaluation["error_message"])}</div>')
+    parts.append('</div>')
+    return ''.join(parts)
+
+
+@st.cache_resource
+def get_db():
+    """Database client, shared across reruns and sessions."""
+    return VideoEvaluatorDB()
+
+
+@st.cache_data(ttl=30)
+def _load_video_bundle(video_id):
+    """Video row, status row, evaluations and rubrics for one video (cached 30s)."""
+    db = get_db()
+    return (
+        db.get_video(video_id),
+        db.get_video_status(video_id),
+        db.get_video_evaluations(video_id),
+        db.get_all_rubrics(),
+    )
+
+
 def main():
     st.title("📹 Video Detail")
 
@@ -100,33 +178,32 @@ def main():
 
     # Initialize database
     try:
-        db = VideoEvaluatorDB()
+        get_db()
     except Exception as e:
         st.error(f"Database connection failed: {e}")
         return
 
-    # Get video data
+    # Back button / refresh
+    col_back, col_refresh = st.columns([4, 1])
+    with col_back:
+        if st.button("← Back to All Videos"):
+            st.switch_page("pages/1_📋_All_Videos.py")
+    with col_refresh:
+        if st.button("🔄 Refresh"):
+            _load_video_bundle.clear()
+
+    # Get video data (cached per video_id)
     try:
-        video = db.get_video(video_id)
-        if not video:
-            st.error(f"Video not found: {video_id}")
-            return
-
-        video_status = db.get_video_status(video_id)
-        if video_status:
-            video_status = video_status[0]
-        else:
-            video_status = {}
-
-        evaluations = db.get_video_evaluations(video_id)
-        all_rubrics = db.get_all_rubrics()
+        video, video_status, evaluations, all_rubrics = _load_video_bundle(video_id)
     except Exception as e:
         st.error(f"Error loading video data: {e}")
         return
 
-    # Back button
-    if st.button("← Back to All Videos"):
-        st.switch_page("pages/1_📋_All_Videos.py")
+    if not video:
+        st.error(f"Video not found: {video_id}")
+        return
+
+    video_status = video_status[0] if video_status else {}
 
     st.markdown("---")
 
@@ -165,67 +242,25 @@ def main():
     # Create a map of evaluations by rubric name
     eval_map = {e['rubric_name']: e for e in evaluations}
 
-    # Display rubrics
+    # Display rubrics - cards are batched into one markdown call, flushed
+    # only where a "View Full Report" button has to follow a card
+    pending_html = []
     for rubric in all_rubrics:
         rubric_name = rubric['name']
         evaluation = eval_map.get(rubric_name)
+        pending_html.append(build_rubric_card_html(rubric, evaluation))
+
+        if evaluation and evaluation['status'] == 'completed':
+            st.markdown(''.join(pending_html), unsafe_allow_html=True)
+            pending_html = []
+            if st.button("View Full Report →", key=f"view_report_{rubric_name}"):
+                st.session_state['selected_evaluation'] = evaluation
+                st.switch_page("pages/4_📄_Evaluation_Report.py")
 
-        if evaluation:
-            status = evaluation['status']
-            status_emoji = get_status_emoji(status)
-            status_class = f"rubric-{status}"
-
-            with st.container():
-                st.markdown(f"""
-                <div class="rubric-card {status_class}">
-                    <div class="rubric-title">{status_emoji} {rubric['display_name']}</div>
-                    <div class="rubric-meta">{rubric.get('description', 'No description')}</div>
-                </div>
-                """, unsafe_allow_html=True)
-
-                # Show evaluation details
-                col1, col2, col3 = st.columns([3, 2, 1])
-
-                with col1:
-                    st.write(f"**Status:** {status.replace('_', ' ').title()}")
-                    if evaluation.get('evaluator'):
-                        st.write(f"**Evaluator:** {evaluation['evaluator']}")
-                    if evaluation.get('model_name'):
-                        st.write(f"**Model:** {evaluation['model_name']}")
-
-                with col2:
-                    if evaluation.get('completed_at'):
-                        st.write(f"**Completed:** {evaluation['completed_at'][:19]}")
-                    if evaluation.get('duration_seconds'):
-                        st.write(f"**Duration:** {format_duration(evaluation['duration_seconds'])}")
-
-                with col3:
-                    if evaluation.get('cost'):
-                        st.write(f"**Cost:** ${evaluation['cost']:.4f}")
-
-                # View report button
-                if status == 'completed':
-                    if st.button(f"View Full Report →", key=f"view_report_{rubric_name}"):
-                        st.session_state['selected_evaluation'] = evaluation
-                        st.switch_page("pages/4_📄_Evaluation_Report.py")
-
-                elif status == 'failed':
-                    if evaluation.get('error_message'):
-                        st.error(f"Error: {evaluation['error_message']}")
-
-                st.markdown("---")
-
-        else:
-            # No evaluation exists for this rubric
-            st.markdown(f"""
-            <div class="rubric-card rubric-pending">
-                <div class="rubric-title">⭕ {rubric['display_name']}</div>
-                <div class="rubric-meta">{rubric.get('description', 'No description')}</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-            st.write("**Status:** Not evaluated yet")
-            st.markdown("---")
+    if pending_html:
+        st.markdown(''.join(pending_html), unsafe_allow_html=True)
+
+    st.markdown("---")
 
     # Video metadata expander
     with st.expander("📋 Full Video Metadata"):
@@ -39,6 +39,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Rubric name -> prompt builder
+RUBRIC_GETTERS = {
+    'content_safety': get_content_safety_rubric,
+    'ai_quality': get_ai_quality_rubric,
+    'production_metrics': get_production_metrics_rubric,
+    'media_ethics': get_media_ethics_rubric,
+    'academic': get_academic_rubric,
+    'four_pillars': get_brainrot_rubric,
+}
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -79,7 +89,7 @@ Examples:
     parser.add_argument(
         '--rubric',
         type=str,
-        choices=['content_safety', 'ai_quality', 'production_metrics', 'media_ethics', 'academic', 'four_pillars'],
+        choices=list(RUBRIC_GETTERS),
         default='four_pillars',
         help='Evaluation rubric to use (default: four_pillars)'
     )
@@ -150,21 +160,11 @@ Examples:
     try:
         # Load rubric
         logger.info("Loading rubric...")
-        if args.rubric == 'content_safety':
-            rubric_prompt = get_content_safety_rubric()
-        elif args.rubric == 'ai_quality':
-            rubric_prompt = get_ai_quality_rubric()
-        elif args.rubric == 'production_metrics':
-            rubric_prompt = get_production_metrics_rubric()
-        elif args.rubric == 'media_ethics':
-            rubric_prompt = get_media_ethics_rubric()
-        elif args.rubric == 'academic':
-            rubric_prompt = get_academic_rubric()
-        elif args.rubric == 'four_pillars':
-            rubric_prompt = get_brainrot_rubric()
-        else:
+        get_rubric = RUBRIC_GETTERS.get(args.rubric)
+        if get_rubric is None:
             logger.error(f"Unknown rubric: {args.rubric}")
             return 1
+        rubric_prompt = get_rubric()
 
         # Initialize evaluator
         logger.info(f"Initializing {args.evaluator} evaluator...")
@@ -1,9 +1,24 @@
 """
 Video Evaluators Package
+
+Evaluator classes are imported on first access, so importing one evaluator
+module doesn't also load the other providers' SDKs.
 """
 
+import importlib
+
 from .base import VideoEvaluator
-from .claude_evaluator import ClaudeEvaluator
-from .ollama_evaluator import OllamaEvaluator
+
+_LAZY_EVALUATORS = {
+    'ClaudeEvaluator': '.claude_evaluator',
+    'OllamaEvaluator': '.ollama_evaluator',
+}
 
 __all__ = ['VideoEvaluator', 'ClaudeEvaluator', 'OllamaEvaluator']
+
+
+def __getattr__(name):
+    if name in _LAZY_EVALUATORS:
+        module = importlib.import_module(_LAZY_EVALUATORS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
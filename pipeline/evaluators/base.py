@@ -6,8 +6,128 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
 from pathlib import Path
 import json
+import os
 from datetime import datetime
 
+import orjson
+
+from src.frame_sampling import sample_indices
+
+# One JSON line per saved evaluation ({filename, rubric, timestamp}) so
+# listings don't have to parse every evaluation file. Not *.json, so it is
+# never mistaken for an evaluation.
+EVALUATION_INDEX = "index.jsonl"
+
+
+def _index_entry(filename: str, evaluation_result: Dict) -> Dict:
+    return {
+        "filename": filename,
+        "rubric": evaluation_result.get("rubric", "unknown"),
+        "timestamp": evaluation_result.get("timestamp", "unknown")
+    }
+
+
+def _append_index_entries(evaluations_dir: Path, entries: List[Dict]):
+    with open(evaluations_dir / EVALUATION_INDEX, 'a', encoding='utf-8') as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def load_evaluation_index(evaluations_dir: Path) -> List[Dict]:
+    """
+    List the evaluations saved in a directory, newest filename first.
+
+    Reads the index file, and only parses evaluation files that are not
+    indexed yet (saved before the index existed, or copied in by hand),
+    adding them to the index.
+
+    Returns:
+        List of {"filename", "rubric", "timestamp"} dicts
+    """
+    evaluations_dir = Path(evaluations_dir)
+    index_path = evaluations_dir / EVALUATION_INDEX
+
+    entries = {}
+    if index_path.exists():
+        with open(index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                entries[entry["filename"]] = entry
+
+    with os.scandir(evaluations_dir) as it:
+        filenames = sorted(
+            (e.name for e in it if e.name.endswith(".json") and e.is_file()),
+            reverse=True
+        )
+
+    new_entries = []
+    for filename in filenames:
+        if filename in entries:
+            continue
+        try:
+            with open(evaluations_dir / filename, 'r', encoding='utf-8') as f:
+                entry = _index_entry(filename, json.load(f))
+        except (OSError, ValueError):
+            continue
+        entries[filename] = entry
+        new_entries.append(entry)
+
+    if new_entries:
+        _append_index_entries(evaluations_dir, new_entries)
+
+    return [entries[name] for name in filenames if name in entries]
+
+
+def read_json(path: Path):
+    """Parse a JSON file with orjson, straight from bytes"""
+    return orjson.loads(Path(path).read_bytes())
+
+
+def file_mtime_ns(path: Path) -> Optional[int]:
+    """Modification time of a file in ns (for cache keys), or None if it doesn't exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def load_video_option(vdir: Path):
+    """
+    Load the video picker entry for one ingested video
+
+    Returns:
+        (display name, {'video_id', 'path', 'metadata', 'title'}), or None
+        if the directory has no metadata.json
+    """
+    vdir = Path(vdir)
+    metadata_path = vdir / "metadata.json"
+    if not metadata_path.exists():
+        return None
+
+    metadata = read_json(metadata_path)
+
+    video_id = vdir.name
+    duration = metadata.get('duration_seconds', 0)
+    frame_count = metadata.get('frame_count', 0)
+
+    # Get YouTube title if available
+    title = video_id
+    youtube_metadata_path = vdir / "youtube_metadata.json"
+    if youtube_metadata_path.exists():
+        yt_meta = read_json(youtube_metadata_path)
+        title = yt_meta.get('title', video_id)
+
+    display_name = f"{title} ({duration:.0f}s, {frame_count} frames)"
+    return display_name, {
+        'video_id': video_id,
+        'path': vdir,
+        'metadata': metadata,
+        'title': title
+    }
+
 
 class VideoEvaluator(ABC):
     """
@@ -103,26 +223,8 @@ class VideoEvaluator(ABC):
         Returns:
             List of selected frame paths
         """
-        if len(all_frames) <= max_frames:
-            return all_frames
-
-        if sampling_strategy == "even":
-            # Sample evenly across the video
-            step = len(all_frames) / max_frames
-            indices = [int(i * step) for i in range(max_frames)]
-            return [all_frames[i] for i in indices]
-
-        elif sampling_strategy == "first_n":
-            return all_frames[:max_frames]
-
-        elif sampling_strategy == "last_n":
-            return all_frames[-max_frames:]
-
-        elif sampling_strategy == "all":
-            return all_frames
-
-        else:
-            raise ValueError(f"Unknown sampling strategy: {sampling_strategy}")
+        indices = sample_indices(len(all_frames), max_frames, sampling_strategy)
+        return [all_frames[i] for i in indices]
 
     def save_evaluation(
         self,
@@ -153,15 +255,18 @@ class VideoEvaluator(ABC):
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(evaluation_result, f, indent=2, ensure_ascii=False)
 
+        _append_index_entries(output_dir, [_index_entry(filename, evaluation_result)])
+
         return str(filepath)
 
-    def load_video_data(self, video_id: str, data_dir: Path = None) -> Dict:
+    def load_video_data(self, video_id: str, data_dir: Path = None, metadata: Dict = None) -> Dict:
         """
         Load ingested video data (metadata, transcript, frames).
 
         Args:
             video_id: Video identifier
             data_dir: Base data directory (defaults to ./data)
+            metadata: Already-parsed metadata.json, skips reading it again
 
         Returns:
             Dictionary with:
@@ -184,12 +289,13 @@ class VideoEvaluator(ABC):
             raise FileNotFoundError(f"Video directory not found: {video_dir}")
 
         # Load metadata
-        metadata_path = video_dir / "metadata.json"
-        if not metadata_path.exists():
-            raise FileNotFoundError(f"Metadata not found: {metadata_path}")
+        if metadata is None:
+            metadata_path = video_dir / "metadata.json"
+            if not metadata_path.exists():
+                raise FileNotFoundError(f"Metadata not found: {metadata_path}")
 
-        with open(metadata_path, 'r', encoding='utf-8') as f:
-            metadata = json.load(f)
+            with open(metadata_path, 'r', encoding='utf-8') as f:
+                metadata = json.load(f)
 
         # Load transcript text
         transcript_txt_path = video_dir / "transcript.txt"
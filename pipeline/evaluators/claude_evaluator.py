@@ -6,6 +6,7 @@ Supports multiple rubrics with configurable settings
 import subprocess
 import os
 import logging
+import time
 from typing import List, Dict
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +16,31 @@ from ..cost_tracker import calculate_cost, log_evaluation_cost
 
 logger = logging.getLogger(__name__)
 
+# First retry waits this long, doubling on each further attempt
+RETRY_BACKOFF_SECONDS = 2
+
+
+# CLI error output (lowercased) that marks a failure as worth retrying:
+# rate limits, overload, 5xx responses and network errors. Anything else
+# (auth, bad flags, unknown model) fails on the first attempt.
+TRANSIENT_ERROR_MARKERS = (
+    'rate limit', 'rate_limit', 'api error: 429',
+    'overloaded', 'api error: 5',
+    'internal server error', 'bad gateway', 'service unavailable', 'gateway timeout',
+    'econnreset', 'econnrefused', 'etimedout', 'socket hang up',
+    'network error', 'connection error',
+)
+
+
+class TransientClaudeError(RuntimeError):
+    """A CLI failure worth retrying: rate limit, overload, 5xx/network error or empty output"""
+
+
+def is_transient_cli_error(error_msg: str) -> bool:
+    """True if the CLI's error output describes a failure worth retrying"""
+    error_msg = error_msg.lower()
+    return any(marker in error_msg for marker in TRANSIENT_ERROR_MARKERS)
+
 
 class ClaudeEvaluator(VideoEvaluator):
     """
@@ -31,7 +57,9 @@ class ClaudeEvaluator(VideoEvaluator):
         model_name: str = "claude-sonnet-4-20250514",
         sampling_strategy: str = "even",
         max_frames: int = 30,
-        timeout: int = 600
+        timeout: int = 600,
+        max_output_tokens: int = None,
+        max_retries: int = 3
     ):
         """
         Initialize Claude evaluator.
@@ -42,7 +70,10 @@ class ClaudeEvaluator(VideoEvaluator):
             model_name: Claude model identifier
             sampling_strategy: Frame sampling strategy ("even", "all", "first_n", "last_n")
             max_frames: Maximum number of frames to send
-            timeout: Evaluation timeout in seconds (default: 10 minutes)
+            timeout: Per-attempt timeout in seconds (default: 10 minutes)
+            max_output_tokens: Cap on generated tokens (None = CLI default)
+            max_retries: Extra attempts after a rate-limit, overload, 5xx/network
+                error or empty response
         """
         super().__init__(
             evaluator_name="claude-cli",
@@ -56,6 +87,8 @@ class ClaudeEvaluator(VideoEvaluator):
         # Claude API has a hard limit of 100 images per request
         self.max_frames = min(max_frames, 100)
         self.timeout = timeout
+        self.max_output_tokens = max_output_tokens
+        self.max_retries = max_retries
 
         if max_frames > 100:
             logger.warning(f"Requested {max_frames} frames, but Claude API limit is 100. Capping at 100.")
@@ -252,6 +285,22 @@ Please provide a thorough evaluation following the rubric framework.
         Returns:
             Claude's response text
         """
+        env = None
+        if self.max_output_tokens:
+            env = {**os.environ, 'CLAUDE_CODE_MAX_OUTPUT_TOKENS': str(self.max_output_tokens)}
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self._run_claude_cli(prompt, env)
+            except TransientClaudeError as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = RETRY_BACKOFF_SECONDS * 2 ** attempt
+                logger.warning(f"  {e}; retry {attempt + 1}/{self.max_retries} in {delay}s")
+                time.sleep(delay)
+
+    def _run_claude_cli(self, prompt: str, env: Dict = None) -> str:
+        """Run one Claude CLI call, bounded by self.timeout"""
         logger.info("  Calling Claude Code CLI...")
 
         try:
@@ -265,23 +314,28 @@ Please provide a thorough evaluation following the rubric framework.
                 capture_output=True,
                 text=True,
                 timeout=self.timeout,
-                cwd=os.getcwd()
+                cwd=os.getcwd(),
+                env=env
             )
 
             if result.returncode != 0:
                 error_msg = result.stderr or result.stdout or "Unknown error"
                 logger.error(f"  Claude CLI error: {error_msg}")
+                if is_transient_cli_error(error_msg):
+                    raise TransientClaudeError(f"Claude CLI failed: {error_msg}")
                 raise RuntimeError(f"Claude CLI failed: {error_msg}")
 
             response = result.stdout.strip()
 
             if not response:
-                raise RuntimeError("Claude returned empty response")
+                raise TransientClaudeError("Claude returned empty response")
 
             logger.info("  ✓ Claude evaluation complete")
             return response
 
         except subprocess.TimeoutExpired:
             raise RuntimeError(f"Claude evaluation timed out after {self.timeout}s")
+        except RuntimeError:
+            raise
         except Exception as e:
             raise RuntimeError(f"Error calling Claude: {e}")
@@ -5,6 +5,7 @@ Free tier: 1,500 requests per day with native vision support
 
 import os
 import logging
+import time
 from typing import List, Dict
 from datetime import datetime
 from pathlib import Path
@@ -12,14 +13,26 @@ import base64
 
 try:
     import google.generativeai as genai
+    from google.api_core import exceptions as google_exceptions
 except ImportError:
     genai = None
+    google_exceptions = None
 
 from .base import VideoEvaluator
 from ..cost_tracker import calculate_cost, log_evaluation_cost
 
 logger = logging.getLogger(__name__)
 
+# First retry waits this long, doubling on each further attempt
+RETRY_BACKOFF_SECONDS = 2
+
+# Only rate limits, outages and deadlines are retried; auth/request errors fail fast
+RETRYABLE_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+) if google_exceptions else ()
+
 
 class GeminiEvaluator(VideoEvaluator):
     """
@@ -36,7 +49,9 @@ class GeminiEvaluator(VideoEvaluator):
         model_name: str = "models/gemini-2.5-flash",
         sampling_strategy: str = "even",
         max_frames: int = 50,
-        timeout: int = 600
+        timeout: int = 600,
+        max_output_tokens: int = 16384,
+        max_retries: int = 3
     ):
         """
         Initialize Gemini evaluator.
@@ -47,7 +62,9 @@ class GeminiEvaluator(VideoEvaluator):
             model_name: Gemini model identifier (default: models/gemini-2.5-flash)
             sampling_strategy: Frame sampling strategy
             max_frames: Maximum frames to send (Gemini can handle many frames)
-            timeout: Evaluation timeout in seconds
+            timeout: Per-request timeout in seconds
+            max_output_tokens: Cap on generated tokens per request
+            max_retries: Extra attempts after a rate-limited, unavailable or timed-out request
         """
         super().__init__(
             evaluator_name="gemini-flash",
@@ -66,6 +83,8 @@ class GeminiEvaluator(VideoEvaluator):
         self.sampling_strategy = sampling_strategy
         self.max_frames = max_frames
         self.timeout = timeout
+        self.max_output_tokens = max_output_tokens
+        self.max_retries = max_retries
 
         self._configure_gemini()
 
@@ -278,14 +297,24 @@ Please provide a thorough evaluation following the rubric framework.
                 {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
             ]
 
-            response = model.generate_content(
-                content,
-                generation_config=genai.types.GenerationConfig(
-                    max_output_tokens=16384,
-                    temperature=0.7,
-                ),
-                safety_settings=safety_settings
-            )
+            for attempt in range(self.max_retries + 1):
+                try:
+                    response = model.generate_content(
+                        content,
+                        generation_config=genai.types.GenerationConfig(
+                            max_output_tokens=self.max_output_tokens,
+                            temperature=0.7,
+                        ),
+                        safety_settings=safety_settings,
+                        request_options={"timeout": self.timeout}
+                    )
+                    break
+                except RETRYABLE_ERRORS as e:
+                    if attempt == self.max_retries:
+                        raise
+                    delay = RETRY_BACKOFF_SECONDS * 2 ** attempt
+                    logger.warning(f"  Gemini request failed ({e}), retry {attempt + 1}/{self.max_retries} in {delay}s")
+                    time.sleep(delay)
 
             call_duration = (datetime.now() - call_start).total_seconds()
             logger.info(f"  ✓ Gemini API call completed in {call_duration:.1f}s")
@@ -63,6 +63,7 @@ CREATE TABLE IF NOT EXISTS rubrics (
 CREATE INDEX IF NOT EXISTS idx_evaluations_video_id ON evaluations(video_id);
 CREATE INDEX IF NOT EXISTS idx_evaluations_status ON evaluations(status);
 CREATE INDEX IF NOT EXISTS idx_evaluations_rubric ON evaluations(rubric_name);
+CREATE INDEX IF NOT EXISTS idx_evaluations_rubric_status ON evaluations(rubric_name, status) INCLUDE (cost, duration_seconds);
 CREATE INDEX IF NOT EXISTS idx_videos_ingestion_date ON videos(ingestion_date DESC);
 CREATE INDEX IF NOT EXISTS idx_videos_youtube_id ON videos(youtube_id) WHERE youtube_id IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_evaluations_completed ON evaluations(completed_at DESC) WHERE completed_at IS NOT NULL;
@@ -111,12 +112,12 @@ SELECT
     r.category,
     r.sort_order,
     COUNT(e.id) as total_evaluations,
-    COUNT(CASE WHEN e.status = 'completed' THEN 1 END) as completed_count,
-    COUNT(CASE WHEN e.status = 'failed' THEN 1 END) as failed_count,
-    COALESCE(AVG(e.cost), 0) as avg_cost,
-    COALESCE(AVG(e.duration_seconds), 0) as avg_duration_seconds
+    COUNT(e.id) FILTER (WHERE e.status = 'completed') as completed_count,
+    COUNT(e.id) FILTER (WHERE e.status = 'failed') as failed_count,
+    COALESCE(AVG(e.cost) FILTER (WHERE e.status = 'completed'), 0) as avg_cost,
+    COALESCE(AVG(e.duration_seconds) FILTER (WHERE e.status = 'completed'), 0) as avg_duration_seconds
 FROM rubrics r
-LEFT JOIN evaluations e ON r.name = e.rubric_name AND e.status = 'completed'
+LEFT JOIN evaluations e ON r.name = e.rubric_name
 WHERE r.is_active = TRUE
 GROUP BY r.name, r.display_name, r.category, r.sort_order
 ORDER BY r.sort_order;
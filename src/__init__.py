@@ -1,12 +1,19 @@
 """Kids Video Evaluator - Analyze educational videos for children"""
 
-from .frame_extractor import FrameExtractor
-from .audio_transcriber import AudioTranscriber
-from .evaluator import VideoEvaluator
-from .report_generator import ReportGenerator
-from .rubric import get_evaluation_prompt
-from .youtube_downloader import YouTubeDownloader
-from .youtube_metadata import YouTubeMetadataFetcher
+import importlib
+
+# Public name -> submodule. Loaded on first access so that importing one
+# submodule (e.g. src.database or a rubric) doesn't pull in OpenCV, Whisper
+# and the API clients.
+_LAZY_EXPORTS = {
+    'FrameExtractor': '.frame_extractor',
+    'AudioTranscriber': '.audio_transcriber',
+    'VideoEvaluator': '.evaluator',
+    'ReportGenerator': '.report_generator',
+    'get_evaluation_prompt': '.rubric',
+    'YouTubeDownloader': '.youtube_downloader',
+    'YouTubeMetadataFetcher': '.youtube_metadata',
+}
 
 __all__ = [
     'FrameExtractor',
@@ -17,3 +24,10 @@ __all__ = [
     'YouTubeDownloader',
     'YouTubeMetadataFetcher',
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
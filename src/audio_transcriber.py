@@ -1,18 +1,102 @@
 """
-Audio transcription using OpenAI Whisper (local model)
+Audio transcription using Whisper (local model)
+
+Uses faster-whisper (CTranslate2; FP16 on CUDA, INT8 quantized on CPU) when
+installed and falls back to the reference openai-whisper implementation
+otherwise.
 """
-import whisper
 import os
 import logging
 import json
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+try:
+    from faster_whisper import WhisperModel, decode_audio
+    import ctranslate2
+except ImportError:
+    WhisperModel = None
+
+try:
+    # faster-whisper >= 1.1: encodes several VAD chunks per forward pass
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:
+    BatchedInferencePipeline = None
+
+try:
+    import whisper
+except ImportError:
+    whisper = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Loaded transcribers keyed by model name (see get_transcriber)
+_MODEL_CACHE = {}
+
+# Finished transcripts keyed by backend/model, decoding settings and a hash of
+# the decoded audio
+TRANSCRIPT_CACHE_DIR = os.environ.get("WHISPER_CACHE_DIR", os.path.join("cache", "whisper"))
+
+# 30 s audio chunks per batched faster-whisper forward pass
+WHISPER_BATCH_SIZE = 16
+
+# Silero VAD settings for faster-whisper: drop non-speech gaps (music, silence)
+# of half a second or more instead of the 2 s default, so less audio is decoded
+WHISPER_VAD_PARAMETERS = {"min_silence_duration_ms": 500, "speech_pad_ms": 200}
+
+# Silence skipping for the openai-whisper backend (see find_speech_regions)
+SAMPLE_RATE = 16000
+VAD_FRAME_SECONDS = 0.03
+SILENCE_THRESHOLD_DB = -40.0
+MIN_SILENCE_SECONDS = 2.0
+SPEECH_PAD_SECONDS = 0.5
+
+
+def find_speech_regions(audio: np.ndarray) -> List[Tuple[int, int]]:
+    """
+    Find non-silent regions of decoded audio with a simple energy VAD
+
+    Audio is split into 30 ms frames; frames louder than SILENCE_THRESHOLD_DB
+    count as speech. Gaps shorter than MIN_SILENCE_SECONDS are bridged and
+    each region is padded by SPEECH_PAD_SECONDS so words aren't clipped.
+
+    Args:
+        audio: 16 kHz mono float32 array
+
+    Returns:
+        List of (start_sample, end_sample) tuples, empty if all silent
+    """
+    frame_size = int(SAMPLE_RATE * VAD_FRAME_SECONDS)
+    num_frames = len(audio) // frame_size
+    if num_frames == 0:
+        return [(0, len(audio))]
+
+    frames = audio[:num_frames * frame_size].reshape(num_frames, frame_size)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+    voiced = np.flatnonzero(20 * np.log10(np.maximum(rms, 1e-10)) > SILENCE_THRESHOLD_DB)
+    if voiced.size == 0:
+        return []
+
+    max_gap = int(MIN_SILENCE_SECONDS / VAD_FRAME_SECONDS)
+    breaks = np.flatnonzero(np.diff(voiced) > max_gap)
+    starts = np.concatenate(([voiced[0]], voiced[breaks + 1]))
+    ends = np.concatenate((voiced[breaks], [voiced[-1]])) + 1
+
+    pad = int(SPEECH_PAD_SECONDS * SAMPLE_RATE)
+    return [
+        (max(0, start * frame_size - pad), min(len(audio), end * frame_size + pad))
+        for start, end in zip(starts.tolist(), ends.tolist())
+    ]
+
 
 class AudioTranscriber:
-    def __init__(self, model_name: str = "base"):
+    def __init__(self, model_name: str = "base", beam_size: int = 1):
         """
         Initialize Whisper transcriber
 
@@ -23,31 +107,81 @@ class AudioTranscriber:
                 - small: Better accuracy (~2GB RAM)
                 - medium: High accuracy (~5GB RAM)
                 - large: Best accuracy (~10GB RAM)
+            beam_size: faster-whisper beam width (1 = greedy, fastest)
         """
         self.model_name = model_name
+        self.beam_size = beam_size
         logger.info(f"Loading Whisper model: {model_name}")
-        self.model = whisper.load_model(model_name)
-        logger.info(f"✓ Whisper model '{model_name}' loaded")
 
-    def transcribe_video(self, video_path: str, output_dir: str = None) -> dict:
+        if WhisperModel is not None:
+            self.backend = "faster-whisper"
+            use_cuda = ctranslate2.get_cuda_device_count() > 0
+            self.device = "cuda" if use_cuda else "cpu"
+            # FP16 tensor-core kernels are the fastest option on GPU; INT8 on CPU.
+            # WHISPER_COMPUTE_TYPE overrides (e.g. int8_float16 to save VRAM).
+            self.compute_type = os.environ.get("WHISPER_COMPUTE_TYPE") or ("float16" if use_cuda else "int8")
+            self.model = WhisperModel(model_name, device=self.device, compute_type=self.compute_type)
+            self.batched_model = BatchedInferencePipeline(model=self.model) if BatchedInferencePipeline else None
+        elif whisper is not None:
+            import torch
+
+            self.backend = "openai-whisper"
+            self.device = "cuda" if torch.cuda.is_available() else "cpu"
+            self.model = whisper.load_model(model_name, device=self.device)
+        else:
+            raise ImportError(
+                "No Whisper backend installed. "
+                "Run: pip install faster-whisper (or openai-whisper)"
+            )
+
+        # One forward pass at a time per model, even if called from several threads
+        self._lock = threading.Lock()
+        self.warmed_up = False
+
+        logger.info(f"✓ Whisper model '{model_name}' loaded ({self.backend})")
+
+    def transcribe_video(self, video_path: str, output_dir: str = None, audio=None) -> dict:
         """
         Transcribe audio from video file
 
         Args:
             video_path: Path to video file
             output_dir: Optional directory to save transcript JSON
+            audio: Optional pre-decoded 16 kHz mono audio (see load_audio);
+                decoded here if not given. Results are cached on disk by a hash
+                of this audio, and by the video's path/size/mtime, so re-runs on
+                an unchanged video skip both audio decoding and Whisper.
 
         Returns:
             Dictionary containing transcript with timestamps
         """
         logger.info(f"Transcribing audio from: {Path(video_path).name}")
+        file_cache_path = self._file_cache_path(video_path)
+        result = self._load_cached(file_cache_path) if file_cache_path else None
 
-        # Transcribe with word-level timestamps
-        result = self.model.transcribe(
-            video_path,
-            word_timestamps=True,
-            verbose=False
-        )
+        if result is not None:
+            logger.info("  ✓ Using cached transcript (video unchanged)")
+        else:
+            if audio is None:
+                audio = self.load_audio(video_path)
+
+            # Same audio + same model always gives the same transcript
+            cache_path = self._cache_path(audio)
+            result = self._load_cached(cache_path)
+
+            if result is not None:
+                logger.info(f"  ✓ Using cached transcript ({Path(cache_path).name})")
+            else:
+                # Transcribe with word-level timestamps
+                with self._lock:
+                    if self.backend == "faster-whisper":
+                        result = self._transcribe_faster_whisper(audio)
+                    else:
+                        result = self._transcribe_openai_whisper(audio)
+                self._save_cached(cache_path, result)
+
+            if file_cache_path:
+                self._save_cached(file_cache_path, result)
 
         logger.info(f"  ✓ Transcription complete")
         logger.info(f"  Detected language: {result.get('language', 'unknown')}")
@@ -66,6 +200,325 @@ class AudioTranscriber:
 
         return result
 
+    def transcribe_video_stream(self, video_path: str) -> Tuple[Iterator[dict], dict]:
+        """
+        Transcribe audio from video file, yielding segments as they are decoded
+
+        Unlike transcribe_video, segments aren't collected into one result,
+        so callers writing them out (e.g. SRT files) keep memory flat on long
+        videos. Cached transcripts are replayed; fresh ones aren't cached.
+
+        Args:
+            video_path: Path to video file
+
+        Returns:
+            Tuple of (iterator of segment dicts, info dict with 'language')
+        """
+        logger.info(f"Transcribing audio from: {Path(video_path).name}")
+        file_cache_path = self._file_cache_path(video_path)
+        cached = self._load_cached(file_cache_path) if file_cache_path else None
+        if cached is None:
+            audio = self.load_audio(video_path)
+            cached = self._load_cached(self._cache_path(audio))
+        if cached is not None:
+            logger.info("  ✓ Using cached transcript")
+            return iter(cached.get('segments', [])), {'language': cached.get('language', 'unknown')}
+
+        if self.backend == "faster-whisper":
+            segments, info = self._run_faster_whisper(audio)
+            return self._stream_segments(segments), {'language': info.language}
+
+        # openai-whisper has no streaming API; transcribe, then replay the segments
+        with self._lock:
+            result = self._transcribe_openai_whisper(audio)
+        return iter(result.get('segments', [])), {'language': result.get('language', 'unknown')}
+
+    def _stream_segments(self, segments) -> Iterator[dict]:
+        """
+        Convert faster-whisper's lazy segments one at a time
+
+        The model lock is held only while the next segment is decoded, not
+        while the consumer handles it, so a slow or abandoned consumer never
+        blocks other transcriptions.
+        """
+        segments = iter(segments)
+        while True:
+            with self._lock:
+                segment = next(segments, None)
+            if segment is None:
+                return
+            yield self._segment_to_dict(segment)
+
+    def load_audio(self, video_path: str):
+        """
+        Decode a video's audio track to a 16 kHz mono float32 array
+
+        Args:
+            video_path: Path to video file
+
+        Returns:
+            NumPy array accepted by transcribe_video(audio=...)
+        """
+        if self.backend == "faster-whisper":
+            return decode_audio(video_path)
+        return whisper.load_audio(video_path)
+
+    def transcribe_batch(self, video_paths: List[str], output_dirs: List[str] = None,
+                         load_audio=None) -> List[dict]:
+        """
+        Transcribe several videos back to back
+
+        The next file's audio is decoded (ffmpeg, CPU) while the model is
+        transcribing the current one, so the model isn't idle between files.
+
+        Args:
+            video_paths: Paths to video files
+            output_dirs: Optional per-video directories to save transcript JSON
+            load_audio: Optional callable(video_path) -> audio array used instead
+                of self.load_audio (e.g. to decode frames in the same pass)
+
+        Returns:
+            List of transcript results, in the same order as video_paths
+        """
+        if not video_paths:
+            return []
+        if output_dirs is None:
+            output_dirs = [None] * len(video_paths)
+        if load_audio is None:
+            load_audio = self._load_audio_unless_cached
+
+        results = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(load_audio, video_paths[0])
+            for i, (video_path, output_dir) in enumerate(zip(video_paths, output_dirs)):
+                audio = pending.result()
+                if i + 1 < len(video_paths):
+                    pending = executor.submit(load_audio, video_paths[i + 1])
+                results.append(self.transcribe_video(video_path, output_dir, audio=audio))
+
+        return results
+
+    def warmup(self):
+        """
+        Run one throwaway pass over 30 s of silence
+
+        The first decode on a freshly loaded model pays one-off costs (CUDA
+        context and kernel setup, CTranslate2 cache allocation), so do it at
+        load time rather than on the first real video.
+        """
+        silence = np.zeros(30 * 16000, dtype=np.float32)
+        if self.backend == "faster-whisper":
+            segments, _ = self.model.transcribe(silence, beam_size=self.beam_size, vad_filter=False)
+            for _ in segments:
+                pass
+        else:
+            self._transcribe_openai_whisper(silence, word_timestamps=False, verbose=None, skip_silence=False)
+        self.warmed_up = True
+        logger.info(f"✓ Whisper model '{self.model_name}' warmed up")
+
+    def _load_audio_unless_cached(self, video_path: str):
+        """load_audio, or None when the video already has a cached transcript"""
+        file_cache_path = self._file_cache_path(video_path)
+        if file_cache_path and os.path.exists(file_cache_path):
+            return None
+        return self.load_audio(video_path)
+
+    def _file_cache_path(self, video_path: str):
+        """
+        Transcript cache file keyed by the video's path, size and mtime
+
+        Lets unchanged videos skip audio decoding and hashing; any edit to the
+        file changes the key. None if the video can't be stat'ed.
+        """
+        try:
+            stat = os.stat(video_path)
+        except OSError:
+            return None
+        key = f"{os.path.abspath(video_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self._cache_dir(), "files", f"{digest}.json")
+
+    def _cache_path(self, audio) -> str:
+        """Transcript cache file for decoded audio under the current settings"""
+        digest = hashlib.sha1(audio.tobytes()).hexdigest()
+        return os.path.join(self._cache_dir(), f"{digest}.json")
+
+    def _cache_dir(self) -> str:
+        """
+        Transcript cache directory for the current backend, model and decoding settings
+
+        Beam size and the VAD / silence-skipping parameters change the
+        transcript, so changing any of them starts a fresh cache.
+        """
+        settings = json.dumps({
+            'beam_size': self.beam_size,
+            'vad_parameters': WHISPER_VAD_PARAMETERS,
+            'silence': [VAD_FRAME_SECONDS, SILENCE_THRESHOLD_DB, MIN_SILENCE_SECONDS, SPEECH_PAD_SECONDS],
+        }, sort_keys=True)
+        digest = hashlib.sha1(settings.encode('utf-8')).hexdigest()[:12]
+        return os.path.join(TRANSCRIPT_CACHE_DIR, self.backend, self.model_name, digest)
+
+    @staticmethod
+    def _load_cached(cache_path: str):
+        """Load a cached transcript, or None if missing/unreadable"""
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _save_cached(cache_path: str, result: dict):
+        """Write a transcript to the cache atomically; failures are non-fatal"""
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"  Could not write transcript cache: {e}")
+
+    def _transcribe_openai_whisper(self, audio, word_timestamps: bool = True, verbose=False,
+                                   skip_silence: bool = True) -> dict:
+        """
+        Transcribe decoded audio with openai-whisper
+
+        Long silent stretches are cut out first (see find_speech_regions) and
+        each speech region is transcribed separately, with segment and word
+        timestamps shifted back to positions in the full audio. faster-whisper
+        does the same internally via its Silero VAD filter.
+
+        Args:
+            audio: 16 kHz mono float32 array (see load_audio)
+            word_timestamps: Include word-level timestamps
+            verbose: Passed through to whisper's transcribe
+            skip_silence: Skip silent regions before transcribing
+
+        Returns:
+            openai-whisper result dict
+        """
+        regions = find_speech_regions(audio) if skip_silence else [(0, len(audio))]
+        if not regions:
+            return {'text': '', 'segments': [], 'language': 'unknown'}
+
+        # Not worth splitting the audio if there's hardly any silence to skip
+        if sum(end - start for start, end in regions) >= 0.9 * len(audio):
+            regions = [(0, len(audio))]
+        else:
+            logger.info(f"  Skipping silence: transcribing {len(regions)} speech region(s)")
+
+        text_parts = []
+        segments = []
+        language = None
+
+        for start, end in regions:
+            offset = start / SAMPLE_RATE
+            result = self._run_openai_whisper(audio[start:end], word_timestamps, verbose)
+            language = language or result.get('language')
+            text_parts.append(result['text'])
+
+            for segment in result.get('segments', []):
+                segment['id'] = len(segments)
+                segment['seek'] += int(offset * 100)
+                segment['start'] += offset
+                segment['end'] += offset
+                for word in segment.get('words', []):
+                    word['start'] += offset
+                    word['end'] += offset
+                segments.append(segment)
+
+        return {'text': "".join(text_parts), 'segments': segments, 'language': language}
+
+    def _run_openai_whisper(self, audio, word_timestamps: bool, verbose) -> dict:
+        """
+        Run openai-whisper's transcribe on one audio array
+
+        Decoding runs in fp16 on CUDA; on CPU fp16 is off (it isn't supported
+        there and only produces a warning).
+        """
+        use_cuda = self.device == "cuda"
+        return self.model.transcribe(
+            audio,
+            word_timestamps=word_timestamps,
+            verbose=verbose,
+            fp16=use_cuda
+        )
+
+    def _transcribe_faster_whisper(self, source) -> dict:
+        """
+        Transcribe with faster-whisper and return the openai-whisper result shape
+
+        Args:
+            source: Path to video file or decoded audio array
+
+        Returns:
+            Dictionary with 'text', 'segments' and 'language'
+        """
+        segments, info = self._run_faster_whisper(source)
+
+        segment_dicts = [self._segment_to_dict(segment) for segment in segments]
+
+        return {
+            'text': "".join(segment['text'] for segment in segment_dicts),
+            'segments': segment_dicts,
+            'language': info.language
+        }
+
+    def _run_faster_whisper(self, source):
+        """
+        Start a faster-whisper transcription, batched when supported
+
+        Silero VAD (WHISPER_VAD_PARAMETERS) drops non-speech first. The
+        batched pipeline then packs the speech into chunks (up to 30 s) and
+        runs WHISPER_BATCH_SIZE of them through the encoder and decoder at
+        once; timestamps come back relative to the full audio.
+
+        Returns:
+            Tuple of (lazy segment iterator, TranscriptionInfo)
+        """
+        if self.batched_model is not None:
+            return self.batched_model.transcribe(
+                source,
+                beam_size=self.beam_size,
+                batch_size=WHISPER_BATCH_SIZE,
+                vad_filter=True,
+                vad_parameters=WHISPER_VAD_PARAMETERS,
+                word_timestamps=True
+            )
+        return self.model.transcribe(
+            source,
+            beam_size=self.beam_size,
+            vad_filter=True,
+            vad_parameters=WHISPER_VAD_PARAMETERS,
+            word_timestamps=True
+        )
+
+    @staticmethod
+    def _segment_to_dict(segment) -> dict:
+        """Convert a faster-whisper Segment to an openai-whisper style segment dict"""
+        return {
+            'id': segment.id,
+            'seek': segment.seek,
+            'start': segment.start,
+            'end': segment.end,
+            'text': segment.text,
+            'tokens': list(segment.tokens),
+            'temperature': segment.temperature,
+            'avg_logprob': segment.avg_logprob,
+            'compression_ratio': segment.compression_ratio,
+            'no_speech_prob': segment.no_speech_prob,
+            'words': [
+                {
+                    'word': word.word,
+                    'start': word.start,
+                    'end': word.end,
+                    'probability': word.probability
+                }
+                for word in (segment.words or [])
+            ]
+        }
+
     def format_transcript_for_claude(self, transcript_result: dict) -> str:
         """
         Format Whisper transcript for Claude analysis
@@ -121,3 +574,26 @@ class AudioTranscriber:
             'language': transcript_result.get('language', 'unknown'),
             'words_per_minute': (total_words / duration * 60) if duration > 0 else 0
         }
+
+
+def get_transcriber(model_name: str = "base", warmup: bool = False) -> AudioTranscriber:
+    """
+    Get a process-wide AudioTranscriber for a model, loading it on first use
+
+    Args:
+        model_name: Whisper model size
+        warmup: Also run warmup() once. Only worth it in long-lived processes
+            that load the model ahead of the first real request (subtitle
+            server, Streamlit resource caches); a one-shot run would just
+            pay the setup cost twice.
+
+    Returns:
+        Cached AudioTranscriber instance
+    """
+    transcriber = _MODEL_CACHE.get(model_name)
+    if transcriber is None:
+        transcriber = AudioTranscriber(model_name=model_name)
+        _MODEL_CACHE[model_name] = transcriber
+    if warmup and not transcriber.warmed_up:
+        transcriber.warmup()
+    return transcriber
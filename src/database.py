@@ -265,6 +265,31 @@ class VideoEvaluatorDB:
         response = self.client.table("evaluations").select("*").eq("video_id", video_id).execute()
         return response.data
 
+    def get_all_evaluations_grouped(
+        self,
+        video_ids: Optional[List[str]] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get evaluations for many videos in one query, grouped by video.
+
+        Args:
+            video_ids: Optional video IDs to restrict to (all videos if None)
+
+        Returns:
+            Dictionary mapping video ID to its evaluation records
+        """
+        query = self.client.table("evaluations").select("*")
+        if video_ids is not None:
+            if not video_ids:
+                return {}
+            query = query.in_("video_id", list(video_ids))
+        response = query.execute()
+
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for row in response.data:
+            grouped.setdefault(row["video_id"], []).append(row)
+        return grouped
+
     def get_evaluations_by_status(self, status: EvaluationStatus) -> List[Dict[str, Any]]:
         """
         Get all evaluations with a specific status.
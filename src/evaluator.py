@@ -5,13 +5,15 @@ import os
 import base64
 import logging
 from pathlib import Path
-from typing import List
+from typing import List, Union
 import anthropic
 from .rubric import get_evaluation_prompt
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+CLAUDE_MODEL = "claude-sonnet-4-20250514"  # Latest Sonnet model
+
 
 class VideoEvaluator:
     def __init__(self, api_key: str = None):
@@ -36,7 +38,7 @@ class VideoEvaluator:
 
     def evaluate_video(
         self,
-        frame_paths: List[str],
+        frame_paths: List[Union[str, bytes]],
         transcript: str,
         video_name: str
     ) -> str:
@@ -44,7 +46,7 @@ class VideoEvaluator:
         Evaluate video using Claude with frames and transcript
 
         Args:
-            frame_paths: List of paths to frame images
+            frame_paths: List of frame image paths, or in-memory JPEG bytes
             transcript: Formatted transcript text
             video_name: Name of video being evaluated
 
@@ -54,15 +56,16 @@ class VideoEvaluator:
         logger.info(f"Evaluating video: {video_name}")
         logger.info(f"  Sending {len(frame_paths)} frames to Claude API")
 
-        # Build the text prompt
+        # Rubric goes in the (cached) system prompt, per-video details in the message
+        system_prompt = self._build_system_prompt()
         text_prompt = self._build_evaluation_prompt(transcript, video_name, len(frame_paths))
 
         # Build message content with images
         content = []
 
         # Add all frame images first
-        for i, frame_path in enumerate(frame_paths):
-            image_data = self._encode_image(frame_path)
+        for i, frame in enumerate(frame_paths):
+            image_data = self._encode_image(frame)
             content.append({
                 "type": "image",
                 "source": {
@@ -83,8 +86,16 @@ class VideoEvaluator:
 
             # Call Claude API
             response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",  # Latest Sonnet model
+                model=CLAUDE_MODEL,
                 max_tokens=4096,
+                system=[
+                    {
+                        "type": "text",
+                        "text": system_prompt,
+                        # Identical for every video, so later calls read it from the prompt cache
+                        "cache_control": {"type": "ephemeral"}
+                    }
+                ],
                 messages=[
                     {
                         "role": "user",
@@ -104,21 +115,26 @@ class VideoEvaluator:
         except Exception as e:
             raise RuntimeError(f"Unexpected error calling Claude API: {e}")
 
-    def _encode_image(self, image_path: str) -> str:
-        """Encode image to base64 for API"""
-        with open(image_path, 'rb') as f:
+    def _encode_image(self, image: Union[str, bytes]) -> str:
+        """Encode image (file path or in-memory JPEG bytes) to base64 for API"""
+        if isinstance(image, bytes):
+            return base64.standard_b64encode(image).decode('utf-8')
+        with open(image, 'rb') as f:
             return base64.standard_b64encode(f.read()).decode('utf-8')
 
-    def _build_evaluation_prompt(self, transcript: str, video_name: str, num_frames: int) -> str:
-        """Build the complete evaluation prompt"""
+    def _build_system_prompt(self) -> str:
+        """Build the rubric system prompt (the same for every video)"""
         rubric_prompt = get_evaluation_prompt()
 
-        prompt = f"""# Educational Video Evaluation Task
-
-VIDEO: {video_name}
-FRAMES PROVIDED: {num_frames} frames (sampled from video at regular intervals)
+        return f"""# Educational Video Evaluation Task
 
 {rubric_prompt}
+"""
+
+    def _build_evaluation_prompt(self, transcript: str, video_name: str, num_frames: int) -> str:
+        """Build the per-video evaluation prompt (rubric is in the system prompt)"""
+        prompt = f"""VIDEO: {video_name}
+FRAMES PROVIDED: {num_frames} frames (sampled from video at regular intervals)
 
 ---
 
@@ -132,13 +148,29 @@ FRAMES PROVIDED: {num_frames} frames (sampled from video at regular intervals)
 
 I've attached {num_frames} frame images from the video, sampled at regular intervals throughout the video duration. Please analyze these frames along with the transcript to provide your evaluation.
 
-Please provide a comprehensive evaluation following the framework above. Be specific, cite timestamps from the transcript, and provide actionable feedback for parents.
+Please provide a comprehensive evaluation following the evaluation framework in the system prompt. Be specific, cite timestamps from the transcript, and provide actionable feedback for parents.
 """
         return prompt
 
+    def warmup(self):
+        """
+        Open the client's pooled HTTPS connection ahead of the first evaluation
+
+        Uses the (free) token counting endpoint, so the DNS lookup and TCP/TLS
+        handshake are done before any video is ready. Failures are non-fatal.
+        """
+        try:
+            self.client.messages.count_tokens(
+                model=CLAUDE_MODEL,
+                messages=[{"role": "user", "content": "ping"}]
+            )
+            logger.info("✓ Claude API connection warmed up")
+        except Exception as e:
+            logger.warning(f"Claude API warm-up failed: {e}")
+
     def evaluate_with_retry(
         self,
-        frame_paths: List[str],
+        frame_paths: List[Union[str, bytes]],
         transcript: str,
         video_name: str,
         max_retries: int = 2
@@ -147,7 +179,7 @@ Please provide a comprehensive evaluation following the framework above. Be spec
         Evaluate video with retry logic
 
         Args:
-            frame_paths: Paths to frame images
+            frame_paths: Paths to frame images, or in-memory JPEG bytes
             transcript: Formatted transcript
             video_name: Video name
             max_retries: Maximum number of retry attempts
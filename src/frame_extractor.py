@@ -7,6 +7,23 @@ from pathlib import Path
 from typing import List, Tuple
 import logging
 
+import numpy as np
+
+from .frame_sampling import sample_indices
+
+try:
+    import ffmpeg
+except ImportError:
+    ffmpeg = None
+
+try:
+    import av
+except ImportError:
+    av = None
+
+# average_rate vs guessed_rate mismatch above which a stream is treated as VFR
+VFR_RATE_TOLERANCE = 0.1
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -92,6 +109,213 @@ class FrameExtractor:
 
         return extracted_paths
 
+    def extract_frames_and_audio(self, video_path: str, output_dir: str,
+                                 max_frames: int = None) -> Tuple[List[str], np.ndarray]:
+        """
+        Extract frames and decode audio with a single ffmpeg pass
+
+        One ffmpeg process demuxes the container once: the video stream is
+        sampled every interval_seconds, scaled to fit the API limit and
+        written as JPEGs, while the audio stream is resampled to 16 kHz mono
+        PCM and piped back. The audio is the same array Whisper's
+        load_audio returns, so it can be passed to
+        AudioTranscriber.transcribe_video(audio=...).
+
+        Args:
+            video_path: Path to input video file
+            output_dir: Directory to save extracted frames
+            max_frames: Maximum number of frames to extract (None = no limit)
+
+        Returns:
+            Tuple of (frame paths, float32 audio array)
+        """
+        if ffmpeg is None:
+            raise RuntimeError("ffmpeg-python is not installed. Run: pip install ffmpeg-python")
+
+        os.makedirs(output_dir, exist_ok=True)
+        logger.info(f"Decoding frames and audio: {Path(video_path).name}")
+
+        source = ffmpeg.input(video_path)
+        frame_options = {'q:v': 2}
+        if max_frames:
+            frame_options['vframes'] = max_frames
+
+        frames_out = (
+            source.video
+            .filter('fps', fps=f'1/{self.interval_seconds}')
+            .filter('scale', w='min(iw,1600)', h='min(ih,1600)', force_original_aspect_ratio='decrease')
+            .output(os.path.join(output_dir, '_decoded_%04d.jpg'), **frame_options)
+        )
+        audio_out = source.audio.output('pipe:', format='s16le', acodec='pcm_s16le', ac=1, ar=16000)
+
+        try:
+            pcm, _ = (
+                ffmpeg.merge_outputs(frames_out, audio_out)
+                .global_args('-loglevel', 'error')
+                .run(capture_stdout=True, capture_stderr=True)
+            )
+        except ffmpeg.Error as e:
+            raise RuntimeError(f"ffmpeg failed to decode {video_path}: {e.stderr.decode(errors='ignore')}") from e
+
+        # Rename to the same frame_NNNN_tX.Xs.jpg scheme as extract_frames
+        extracted_paths = []
+        while True:
+            decoded_path = os.path.join(output_dir, f"_decoded_{len(extracted_paths) + 1:04d}.jpg")
+            if not os.path.exists(decoded_path):
+                break
+            saved_count = len(extracted_paths)
+            output_path = os.path.join(
+                output_dir,
+                f"frame_{saved_count:04d}_t{saved_count * self.interval_seconds:.1f}s.jpg"
+            )
+            os.replace(decoded_path, output_path)
+            extracted_paths.append(output_path)
+
+        audio = np.frombuffer(pcm, np.int16).flatten().astype(np.float32) / 32768.0
+
+        logger.info(f"  ✓ Extracted {len(extracted_paths)} frames and {len(audio) / 16000:.1f}s of audio")
+        return extracted_paths, audio
+
+    def extract_sampled_frames(self, video_path: str, output_dir: str, target_count: int) -> List[str]:
+        """
+        Extract only the frames that sample_frames_evenly would keep
+
+        Picks the same timestamps as extract_frames + sample_frames_evenly
+        (one every interval_seconds, thinned evenly to target_count), then
+        uses PyAV to seek to the keyframe before each one and decode just up
+        to it, instead of decoding the whole stream. Falls back to a full
+        OpenCV decode when PyAV isn't installed or the stream looks VFR.
+
+        Args:
+            video_path: Path to input video file
+            output_dir: Directory to save extracted frames
+            target_count: Number of frames wanted
+
+        Returns:
+            List of paths to extracted frame images
+        """
+        os.makedirs(output_dir, exist_ok=True)
+
+        def save(index, timestamp_seconds, frame):
+            output_path = os.path.join(output_dir, f"frame_{index:04d}_t{timestamp_seconds:.1f}s.jpg")
+            cv2.imwrite(output_path, self._resize_for_api(frame))
+            return output_path
+
+        return self._collect_sampled_frames(video_path, target_count, save)
+
+    def encode_sampled_frames(self, video_path: str, target_count: int) -> List[bytes]:
+        """
+        Like extract_sampled_frames, but return JPEG bytes instead of writing files
+
+        Args:
+            video_path: Path to input video file
+            target_count: Number of frames wanted
+
+        Returns:
+            List of JPEG-encoded frames, in time order
+        """
+        def encode(index, timestamp_seconds, frame):
+            ok, buffer = cv2.imencode('.jpg', self._resize_for_api(frame))
+            if not ok:
+                raise ValueError(f"Could not encode frame {index} of {video_path}")
+            return buffer.tobytes()
+
+        return self._collect_sampled_frames(video_path, target_count, encode)
+
+    def _collect_sampled_frames(self, video_path: str, target_count: int, handle) -> list:
+        """
+        Run handle(index, timestamp_seconds, bgr_frame) on each sampled frame
+
+        Returns:
+            List of handle's return values
+        """
+        try:
+            return self._seek_sampled_frames(video_path, target_count, handle)
+        except Exception as e:
+            logger.warning(f"  Keyframe seeking unavailable ({e}), decoding full video")
+            return self._decode_sampled_frames(video_path, target_count, handle)
+
+    def _seek_sampled_frames(self, video_path: str, target_count: int, handle) -> list:
+        """PyAV keyframe-seeking implementation of _collect_sampled_frames"""
+        if av is None:
+            raise RuntimeError("PyAV is not installed")
+
+        with av.open(video_path) as container:
+            stream = container.streams.video[0]
+            average_rate = stream.average_rate
+            guessed_rate = stream.guessed_rate
+            if not average_rate or not guessed_rate or \
+                    abs(float(average_rate) / float(guessed_rate) - 1) > VFR_RATE_TOLERANCE:
+                raise RuntimeError("variable frame rate stream")
+
+            if stream.duration is not None:
+                duration_seconds = float(stream.duration * stream.time_base)
+            else:
+                duration_seconds = container.duration / av.time_base
+
+            # Same grid extract_frames would produce, thinned like sample_frames_evenly
+            grid = [i * self.interval_seconds for i in range(int(duration_seconds // self.interval_seconds) + 1)
+                    if i * self.interval_seconds < duration_seconds]
+            targets = [grid[i] for i in sample_indices(len(grid), target_count)]
+
+            logger.info(f"Video: {Path(video_path).name}")
+            logger.info(f"  Duration: {duration_seconds:.1f} seconds")
+            logger.info(f"  Seeking to {len(targets)} of {len(grid)} sample points")
+
+            results = []
+            for target in targets:
+                container.seek(int(target / stream.time_base), backward=True, any_frame=False, stream=stream)
+
+                # Decode forward from the keyframe to the target time
+                chosen = None
+                for frame in container.decode(stream):
+                    if frame.pts is None:
+                        continue
+                    chosen = frame
+                    if frame.pts * stream.time_base >= target:
+                        break
+                if chosen is None:
+                    continue
+
+                timestamp_seconds = float(chosen.pts * stream.time_base)
+                results.append(handle(len(results), timestamp_seconds, chosen.to_ndarray(format='bgr24')))
+
+        logger.info(f"  ✓ Extracted {len(results)} frames total")
+        return results
+
+    def _decode_sampled_frames(self, video_path: str, target_count: int, handle) -> list:
+        """OpenCV full-decode implementation of _collect_sampled_frames"""
+        video = cv2.VideoCapture(video_path)
+        if not video.isOpened():
+            raise ValueError(f"Could not open video file: {video_path}")
+
+        fps = video.get(cv2.CAP_PROP_FPS)
+        total_frames = int(video.get(cv2.CAP_PROP_FRAME_COUNT))
+        frame_interval = max(1, int(fps * self.interval_seconds))
+
+        # Grid points extract_frames would save, thinned like sample_frames_evenly
+        grid_count = -(-total_frames // frame_interval)
+        wanted = None
+        if grid_count > target_count:
+            wanted = set(sample_indices(grid_count, target_count).tolist())
+
+        results = []
+        frame_count = 0
+        while True:
+            grid_index, offset = divmod(frame_count, frame_interval)
+            if offset == 0 and (wanted is None or grid_index in wanted):
+                ret, frame = video.read()
+                if not ret:
+                    break
+                results.append(handle(len(results), frame_count / fps, frame))
+            elif not video.grab():
+                break
+            frame_count += 1
+
+        video.release()
+        logger.info(f"  ✓ Extracted {len(results)} frames total")
+        return results
+
     def get_video_duration(self, video_path: str) -> float:
         """Get video duration in seconds"""
         video = cv2.VideoCapture(video_path)
@@ -115,11 +339,7 @@ class FrameExtractor:
         if len(frame_paths) <= target_count:
             return frame_paths
 
-        # Calculate step size to get evenly distributed frames
-        step = len(frame_paths) / target_count
-        indices = [int(i * step) for i in range(target_count)]
-
-        sampled = [frame_paths[i] for i in indices]
+        sampled = [frame_paths[i] for i in sample_indices(len(frame_paths), target_count)]
         logger.info(f"Sampled {len(sampled)} frames from {len(frame_paths)} total")
 
         return sampled
@@ -0,0 +1,32 @@
+"""
+Frame index selection shared by the extractors and evaluators
+"""
+import numpy as np
+
+
+def sample_indices(n: int, k: int, strategy: str = "even") -> np.ndarray:
+    """
+    Pick which of n frames to keep
+
+    Args:
+        n: Number of available frames
+        k: Maximum number of frames to keep
+        strategy: "even", "first_n", "last_n" or "all"
+
+    Returns:
+        Sorted array of frame indices (all n indices when n <= k)
+    """
+    if strategy == "all" or n <= k:
+        return np.arange(n)
+
+    if strategy == "even":
+        # Same indices as the original int(i * step) loop, float step
+        # included: (i * n) // k rounds differently for some n, k
+        step = n / k
+        return (np.arange(k) * step).astype(int)
+    elif strategy == "first_n":
+        return np.arange(k)
+    elif strategy == "last_n":
+        return np.arange(n - k, n)
+    else:
+        raise ValueError(f"Unknown sampling strategy: {strategy}")
@@ -119,7 +119,9 @@ class ReportGenerator:
         Generate a summary report for multiple videos
 
         Args:
-            video_reports: List of tuples (video_name, report_path)
+            video_reports: List of tuples (video_name, report_path) or
+                (video_name, report_path, processing_time), as returned by
+                process_video; everything is taken from these, no report is re-read
             total_processing_time: Total time for all videos
 
         Returns:
@@ -134,10 +136,12 @@ class ReportGenerator:
         report_lines.append(f"**Total Processing Time:** {total_processing_time / 60:.1f} minutes\n")
 
         report_lines.append("## Evaluated Videos\n")
-        for i, (video_name, report_path) in enumerate(video_reports, 1):
+        for i, (video_name, report_path, *rest) in enumerate(video_reports, 1):
             rel_path = Path(report_path).name
             report_lines.append(f"{i}. **{video_name}**")
             report_lines.append(f"   - Report: [{rel_path}](./{rel_path})")
+            if rest:
+                report_lines.append(f"   - Processing Time: {rest[0]:.1f} seconds")
 
         report_lines.append(f"\n---\n*Generated by Kids Video Evaluator*")
 